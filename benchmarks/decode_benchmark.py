@@ -0,0 +1,46 @@
+## @file decode_benchmark.py
+# @brief Measures how many point information replies can be decoded per second.
+# @author Guy Chamberlain-Webber
+#
+# Run from the repository root, so the configuration file is found:
+#
+#     python -m benchmarks.decode_benchmark
+
+import argparse
+import timeit
+
+import src.packet.decode_cache as decode_cache
+from src.packet.decode_cache import DecodeCache
+from src.packet.packet_decode import decode_pirmx5
+from src.packet.packet_types import PointInformationReplyMX5, PointInformationRequestMX5
+from src.simulator.panel_simulator import PanelSimulator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure how many replies can be decoded per second.")
+    parser.add_argument("--number", type=int, default=20000, help="Replies decoded per timing run.")
+    args = parser.parse_args()
+
+    frame = PanelSimulator(devices={1: 0x02}).create_reply(PointInformationRequestMX5(1).encode(1))
+    params = PointInformationReplyMX5(1, frame).get_parameters()
+
+    def reply_as_csv():
+        return PointInformationReplyMX5(1, frame).get_as_csv()
+
+    # Every call decodes the same frame, which would be a decode cache hit after the first. The reply is
+    # timed with the process-wide cache disabled, to measure decoding, and enabled, to measure an unchanged
+    # reply.
+    timings = [
+        ("decode_pirmx5()", lambda: decode_pirmx5(params), DecodeCache(0)),
+        ("reply and get_as_csv(), uncached", reply_as_csv, DecodeCache(0)),
+        ("reply and get_as_csv(), cached", reply_as_csv, DecodeCache())
+    ]
+
+    for name, function, cache in timings:
+        decode_cache.decode_cache = cache
+        seconds = min(timeit.repeat(function, number=args.number, repeat=5))
+        print(f"{name}: {args.number / seconds:,.0f} replies per second.")
+
+
+if __name__ == "__main__":
+    main()
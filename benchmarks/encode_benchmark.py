@@ -0,0 +1,70 @@
+## @file encode_benchmark.py
+# @brief Measures how long it takes to encode a point information request frame, before and after the
+# frame encoder was introduced, and when filled in from a request template.
+# @author Guy Chamberlain-Webber
+#
+# Run from the repository root, so the configuration file is found:
+#
+#     python -m benchmarks.encode_benchmark
+
+import argparse
+import timeit
+
+import src.constants as constants
+from src.packet.content import Content
+from src.packet.packet import Packet
+from src.packet.packet_types import PointInformationRequestMX5, PointInformationRequestMX6
+
+
+## Encodes a packet the way Packet.get_byte_array() did before the frame encoder, for comparison.
+#
+# @param packet The packet to encode.
+# @param seq The sequence number to stamp the packet with.
+# @return The frame as a list of bytes.
+def legacy_get_byte_array(packet: Packet, seq: int) -> list:
+    default_array = Content.get_byte_array(packet)
+    default_array.insert(0, seq)
+
+    checksum = 0
+    for byte in default_array:
+        checksum += byte
+
+    checksum %= 256
+
+    default_array.insert(0, constants.SOH)
+    default_array.append(checksum)
+
+    return default_array
+
+
+## Returns the mean time taken by a function, in microseconds.
+#
+# @param function The function to time.
+# @param number The number of times to call it.
+# @return The mean time of a call.
+def time_per_call(function, number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the cost of encoding a frame.")
+    parser.add_argument("--number", type=int, default=20000, help="Frames encoded per timing run.")
+    args = parser.parse_args()
+
+    requests = [("MX5 point information request", PointInformationRequestMX5(1)),
+                ("MX6 point information request", PointInformationRequestMX6(1))]
+
+    for name, request in requests:
+        packet = request.packet
+        assert bytes(legacy_get_byte_array(packet, 7)) == packet.encode(7) == request.encode(7)
+
+        before = time_per_call(lambda: bytes(legacy_get_byte_array(packet, 7)), args.number)
+        after = time_per_call(lambda: packet.encode(7), args.number)
+        template = time_per_call(lambda: request.encode(7), args.number)
+
+        print(f"{name}: {before:.2f}us before, {after:.2f}us after per frame ({before / after:.1f}x faster), "
+              f"{template:.2f}us from the request template.")
+
+
+if __name__ == "__main__":
+    main()
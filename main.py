@@ -2,81 +2,365 @@
 # @brief The main entry point for the program.
 # @author Guy Chamberlain-Webber
 
+import asyncio
+import threading
+import time
+
+import numpy as np
+
 import src.config as config
 import src.constants as constants
+import src.log as log
 
-from src.clock import Clock
+from src.change_filter import ChangeFilter
+from src.discovery import PointDiscovery
+from src.inventory import InventoryRevalidator, PointInventory, get_inventory_path, open_inventory, \
+    read_panel_identity, read_panel_identity_async
+from src.packet.async_serial_data_transfer import AsyncSerialDataTransfer
+from src.packet.capture import open_capture
+from src.packet.decode_cache import get_decode_cache
 from src.packet.device_codes import devices_codes
 from src.packet.packet_types import PointInformationRequestMX5
 from src.packet.serial_data_transfer import SerialDataTransfer
+from src.packet.transaction_engine import TransactionEngine
+from src.packet.unit_conversion import convert_cycle
+from src.record_sink import RecordSink
+from src.scheduler import Scheduler
+from src.supervisor import PanelCycle, PanelReply, PanelSupervisor
+from src.transport.transport_factory import create_transport
+
+# The log file replies from every panel are written to.
+POINT_LOG_FILE = "points.log"
+
+# The log file the converted analogue values from every panel are written to.
+ANALOGUE_LOG_FILE = "analogue.log"
 
 
 ## The main program loop.
+#
+# Each configured panel is polled on its own thread. Replies from every panel are decoded and logged by
+# a single record sink.
 def run():
-    # Check the configured COM port to ensure that it is valid.
-    # Using a hacky way to do scope blocks in Python (it is not officially supported)
-    def scope_block():
-        serial = SerialDataTransfer()
+    log.create_log_dir()
 
-    scope_block()
+    with RecordSink(handle_record) as sink:
+        supervisor = PanelSupervisor(config.get_panels(), poll_points, sink)
+        supervisor.start()
 
-    # Get any existing points.
-    points = find_valid_points()
+        try:
+            supervisor.join()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            supervisor.stop()
+
+            # Handle every record already put before reporting how many were handled.
+            sink.stop()
+            print_sink_stats(sink)
+            print(f"Decode cache: {get_decode_cache().get_stats()}")
+
+
+## Handles a record put on the record sink: a single reply, or the replies of a polling cycle.
+#
+# @param record The record.
+def handle_record(record):
+    if isinstance(record, PanelCycle):
+        handle_cycle(record)
+    else:
+        handle_reply(record)
+
+
+## Prints and logs a point information reply.
+#
+# This is called on the record sink's thread, so the time taken to decode and store replies does not
+# delay requests to the panels.
+#
+# The reply is logged first, so it is stored even if it can not be printed.
+#
+# @param record The reply, and the name of the panel it came from.
+def handle_reply(record: PanelReply):
+    read_data = record.reply
+    csv = read_data.get_as_csv()
+
+    log.write_log(f"{record.panel},{csv}", POINT_LOG_FILE)
+
+    print(f"[{record.panel}] {csv}")
+    print(devices_codes.get(read_data.pdevice_type, f"Unknown device type '{read_data.pdevice_type}'"))
+    print("\n")
+
+
+## Converts the analogue values of a polling cycle into engineering units, and logs them.
+#
+# Every reply of the cycle is decoded and converted at once. A line is logged for each analogue channel which
+# has a value, giving the point, the channel, the quantity measured and the value in its standard unit. The
+# lines of the cycle are written to the log together.
+#
+# Only the converted values are logged. The raw analogue values are not, as how they are scaled is not known.
+#
+# @param record The replies of the cycle, and the name of the panel they came from.
+def handle_cycle(record: PanelCycle):
+    replies, converted = convert_cycle(record.frames)
+    points = replies[constants.PNAME_POINT_NUMBER]
+    entries = []
+
+    for quantity, values in converted.items():
+        for row, channel in np.argwhere(~np.isnan(values)):
+            entries.append(f"{record.panel},{points[row]},{channel + 1},{quantity},{values[row, channel]:g}")
+
+    log.write_logs(entries, ANALOGUE_LOG_FILE)
+
+
+## Prints how many records a record sink handled, and how many it dropped as its queue was full.
+#
+# @param sink The record sink, which has been stopped.
+def print_sink_stats(sink: RecordSink):
+    print(f"Record sink: {sink.handled_count} record(s) handled, {sink.dropped_count} dropped.")
+
+
+## Discovers the valid points on a panel, or reads them from its inventory cache, then repeatedly requests
+# information from each of them until stopped.
+#
+# @param name The name of the panel.
+# @param link The link session to send and receive packets with.
+# @param sink The record sink to put replies on.
+# @param stop_event An event which is set when polling should stop.
+def poll_points(name: str, link: SerialDataTransfer, sink: RecordSink, stop_event: threading.Event):
+    engine = TransactionEngine(link)
+    inventory = None
+
+    if config.get_inventory_enabled():
+        inventory = open_inventory(get_inventory_path(name), read_panel_identity(engine))
+
+    # Start from the points found on the last run if they were cached, otherwise get any existing points.
+    if inventory is not None and len(inventory) > 0:
+        points = inventory.get_points()
+        print(f"[{name}] Starting from {len(points)} cached point(s).")
+    else:
+        points = find_valid_points(link, stop_event)
+
+    # The same requests are sent every time period.
+    requests = [PointInformationRequestMX5(point, link) for point in points]
+
+    # Devices added since the inventory was cached are looked for a few points at a time.
+    revalidator = InventoryRevalidator(inventory, engine) if inventory is not None else None
+
+    # Only replies which have changed, or whose heartbeat is due, are stored.
+    changes = ChangeFilter() if config.get_change_filter_enabled() else None
+
+    print(f"\n--- INFORMATION REQUESTS ({name}) ---\n")
+
+    def request_information():
+        nonlocal points, requests
+        print(f"[{name}] Requesting information for points {points}...")
+
+        handle_transactions(name, engine.run(requests), sink, changes, inventory)
+
+        if inventory is not None:
+            revalidator.probe()
+            points, requests = update_inventory(name, link, inventory, points, requests)
+
+    def report_overrun(job, late: float):
+        print(f"[{name}] Requests overran the time period by {late:.3f}s. {job.skipped_count} cycle(s) skipped so far.")
+
+    scheduler = Scheduler(on_overrun=report_overrun)
+    scheduler.schedule(request_information, period=config.get_time_period())
+    scheduler.run(stop_event)
+
+    if changes is not None:
+        print(f"[{name}] Change filter: {changes.get_stats()}")
 
-    should_run = True
-    time_period = config.get_time_period()
-    clock = Clock(start_true=True)
 
-    print("\n--- INFORMATION REQUESTS ---\n")
+## Handles the point information transactions of a polling cycle.
+#
+# Each completed transaction is handled in turn. If unit conversion is enabled, the replies of the cycle
+# which were stored are then put on the record sink together, so their analogue values are converted at once.
+# Replies left out by the change filter are left out of the cycle too.
+#
+# @param name The name of the panel.
+# @param transactions The transactions of the cycle.
+# @param sink The record sink to put replies on.
+# @param changes The change filter, or None if every reply should be stored.
+# @param inventory The panel's inventory, or None if it is not cached.
+def handle_transactions(name: str, transactions: list, sink: RecordSink, changes: ChangeFilter,
+                        inventory: PointInventory):
+    frames = []
+
+    for transaction in transactions:
+        if transaction.is_complete() and handle_transaction(name, transaction, sink, changes, inventory):
+            frames.append(transaction.reply.get_frame())
 
-    while should_run:
-        if clock.time_elapsed(time_period):
-            for point in points:
-                print(f"Requesting information for point {point}...")
-                packet = PointInformationRequestMX5(point)
-                packet.write()
+    if frames and config.get_unit_conversion_enabled():
+        sink.put(PanelCycle(name, frames))
 
-                read_data = packet.read()
-                if read_data.reply_successful():
-                    print(read_data.get_as_csv())
-                    print(devices_codes[read_data.get_parameter("pdevice_type")])
 
-                print("\n")
+## Handles a completed point information transaction.
+#
+# The point's inventory entry is brought up to date, and the reply put on the record sink if it was
+# successful and has changed.
+#
+# @param name The name of the panel.
+# @param transaction The completed transaction.
+# @param sink The record sink to put replies on.
+# @param changes The change filter, or None if every reply should be stored.
+# @param inventory The panel's inventory, or None if it is not cached.
+# @return True if the reply was put on the record sink, False if not.
+def handle_transaction(name: str, transaction, sink: RecordSink, changes: ChangeFilter,
+                       inventory: PointInventory) -> bool:
+    read_data = transaction.reply
+
+    if inventory is not None:
+        inventory.record(transaction.get_point(), read_data)
+
+    if read_data.reply_successful() and \
+            (changes is None or changes.should_record(read_data.point_number, read_data)):
+        sink.put(PanelReply(name, read_data))
+        return True
+
+    return False
+
+
+## Saves a panel's inventory if it has changed, and brings the points polled up to date with it.
+#
+# @param name The name of the panel.
+# @param link The link session the requests are sent with.
+# @param inventory The panel's inventory.
+# @param points The points currently polled.
+# @param requests The requests currently sent each time period.
+# @return The points to poll and the requests to send each time period.
+def update_inventory(name: str, link, inventory: PointInventory, points: list, requests: list) -> tuple:
+    if inventory.save_if_changed() and inventory.get_points() != points:
+        points = inventory.get_points()
+        requests = [PointInformationRequestMX5(point, link) for point in points]
+        print(f"[{name}] Inventory changed, now polling points {points}.")
+
+    return points, requests
 
 
 ## Looks through each of the points on the network and discovers those which actually exist. These are returned.
 #
+# @param link The link session to send and receive packets with.
+# @param stop_event An event which is set when polling should stop, or None to poll every point.
 # @return A list of valid points in the network.
-def find_valid_points() -> list:
-    valid_points = []
+def find_valid_points(link: SerialDataTransfer, stop_event: threading.Event = None) -> list:
+    print("--- POLLING ---\n")
 
-    should_poll_points = True
-    polling_time_period = config.get_polling_time_period()
-    clock = Clock(start_true=True)
+    start_time = time.monotonic()
+    valid_points = PointDiscovery(link).run(stop_event)
 
-    current_point_number = 0
+    print(f"Found {len(valid_points)} point(s) in {time.monotonic() - start_time:.2f}s.\n")
 
-    print("--- POLLING ---\n")
+    return valid_points
+
+
+## The main program loop, driven by an asyncio event loop.
+#
+# Waiting on the serial ports and between polls is done by the event loop, so every configured panel is
+# polled concurrently on the one loop, and other tasks can run alongside acquisition.
+async def run_async():
+    log.create_log_dir()
+
+    links = [(panel["name"], AsyncSerialDataTransfer(
+        create_transport(timeout=0, settings=panel.get("transport")),
+        open_capture(panel["name"]) if config.get_capture_enabled() else None)) for panel in config.get_panels()]
+
+    with RecordSink(handle_record) as sink:
+        try:
+            await asyncio.gather(*[poll_panel_async(name, link, sink) for name, link in links])
+        finally:
+            for name, link in links:
+                print(f"[{name}] Serial port opened {link.open_count} time(s), closed {link.close_count} time(s).")
+                print(f"[{name}] Output coalescing: {link.get_coalescing_stats()}")
+
+                if link.capture is not None:
+                    link.capture.close()
+                    print(f"[{name}] Captured {link.capture.record_count} record(s) to '{link.capture.path}'.")
 
-    while should_poll_points:
-        if clock.time_elapsed(polling_time_period):
-            print(f"Polling point {current_point_number} for devices...")
-            packet = PointInformationRequestMX5(current_point_number)
-            packet.write()
+            # Handle every record already put before reporting how many were handled.
+            sink.stop()
+            print_sink_stats(sink)
+            print(f"Decode cache: {get_decode_cache().get_stats()}")
 
-            read_data = packet.read()
-            if read_data.reply_successful():
-                valid_points.append(current_point_number)
 
-            current_point_number += 1
+## Opens the link session to a panel, and polls the panel from an asyncio event loop until it disconnects.
+#
+# @param name The name of the panel.
+# @param link The asynchronous link session to send and receive packets with.
+# @param sink The record sink to put replies on.
+async def poll_panel_async(name: str, link: AsyncSerialDataTransfer, sink: RecordSink):
+    async with link:
+        try:
+            await poll_points_async(name, link, sink)
+        except ConnectionError as error:
+            print(f"[{name}] Disconnected: {error}")
+
+
+## Discovers the valid points on a panel, or reads them from its inventory cache, then repeatedly requests
+# information from each of them, from an asyncio event loop.
+#
+# @param name The name of the panel.
+# @param link The asynchronous link session to send and receive packets with.
+# @param sink The record sink to put replies on.
+async def poll_points_async(name: str, link: AsyncSerialDataTransfer, sink: RecordSink):
+    loop = asyncio.get_running_loop()
+    time_period = config.get_time_period()
+    engine = TransactionEngine(link)
+    inventory = None
+
+    if config.get_inventory_enabled():
+        inventory = open_inventory(get_inventory_path(name), await read_panel_identity_async(engine))
+
+    # Start from the points found on the last run if they were cached, otherwise get any existing points.
+    if inventory is not None and len(inventory) > 0:
+        points = inventory.get_points()
+        print(f"[{name}] Starting from {len(points)} cached point(s).")
+    else:
+        points = await find_valid_points_async(link)
+
+    # The same requests are sent every time period.
+    requests = [PointInformationRequestMX5(point, link) for point in points]
+
+    # Devices added since the inventory was cached are looked for a few points at a time.
+    revalidator = InventoryRevalidator(inventory, engine) if inventory is not None else None
+
+    # Only replies which have changed, or whose heartbeat is due, are stored.
+    changes = ChangeFilter() if config.get_change_filter_enabled() else None
+
+    print(f"\n--- INFORMATION REQUESTS ({name}) ---\n")
+
+    while True:
+        start_time = loop.time()
+
+        print(f"[{name}] Requesting information for points {points}...")
+
+        handle_transactions(name, await engine.run_async(requests), sink, changes, inventory)
+
+        if inventory is not None:
+            await revalidator.probe_async()
+            points, requests = update_inventory(name, link, inventory, points, requests)
+
+        # Sleep for the remainder of the time period.
+        await asyncio.sleep(max(0.0, time_period - (loop.time() - start_time)))
+
+
+## Looks through each of the points on the network and discovers those which actually exist, from an
+# asyncio event loop. These are returned.
+#
+# @param link The asynchronous link session to send and receive packets with.
+# @return A list of valid points in the network.
+async def find_valid_points_async(link: AsyncSerialDataTransfer) -> list:
+    print("--- POLLING ---\n")
 
-            if current_point_number > constants.MAXIMUM_POINT_NUMBER:
-                should_poll_points = False
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    valid_points = await PointDiscovery(link).run_async()
 
-            print("\n")
+    print(f"Found {len(valid_points)} point(s) in {loop.time() - start_time:.2f}s.\n")
 
     return valid_points
 
 
 if __name__ == "__main__":
-    run()
+    if config.get_asyncio_enabled():
+        asyncio.run(run_async())
+    else:
+        run()
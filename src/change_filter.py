@@ -0,0 +1,66 @@
+## @file change_filter.py
+# @brief Contains the ChangeFilter, which picks out the replies worth decoding and storing.
+# @author Guy Chamberlain-Webber
+
+import src.config as config
+from src.exceptions.invalid_value import InvalidValueException
+
+
+## Remembers the last reply from each point, so only replies which have changed are decoded and stored.
+#
+# Only the bytes of each reply which change while a point is in use, such as its states, analogue values
+# and dirtiness, are compared. So that a point which never changes is still seen to be alive, an unchanged
+# reply is recorded anyway once every 'heartbeat' polls of that point.
+#
+# Each panel should have its own filter, used from the thread polling it.
+class ChangeFilter:
+    def __init__(self, heartbeat: int = None):
+        if heartbeat is None:
+            heartbeat = config.get_heartbeat_cycles()
+
+        if heartbeat < 1:
+            raise InvalidValueException(f"Invalid heartbeat value '{heartbeat}': Heartbeat must be at least 1.")
+
+        self.heartbeat = heartbeat
+        self.changed_count = 0
+        self.heartbeat_count = 0
+        self.skipped_count = 0
+
+        # The dynamic bytes of the last reply from each point, and the number of polls since it was recorded.
+        self._last = dict()
+
+    ## Returns whether a reply should be recorded.
+    #
+    # @param point The point the reply is from.
+    # @param reply The reply.
+    # @return True if the reply has changed since the point's last reply, or the point's heartbeat is due,
+    # False if not.
+    def should_record(self, point: int, reply) -> bool:
+        dynamic_bytes = reply.get_dynamic_bytes()
+        last = self._last.get(point)
+
+        if last is None or last[0] != dynamic_bytes:
+            self._last[point] = [dynamic_bytes, 0]
+            self.changed_count += 1
+            return True
+
+        last[1] += 1
+
+        if last[1] >= self.heartbeat:
+            last[1] = 0
+            self.heartbeat_count += 1
+            return True
+
+        self.skipped_count += 1
+        return False
+
+    ## Returns the filter statistics.
+    #
+    # @return A dictionary of the number of replies recorded because they changed, recorded as a heartbeat
+    # and skipped.
+    def get_stats(self) -> dict:
+        return {
+            "changed": self.changed_count,
+            "heartbeats": self.heartbeat_count,
+            "skipped": self.skipped_count
+        }
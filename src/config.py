@@ -8,6 +8,7 @@ import sys
 
 import serial
 
+import src.constants as constants
 from src.exceptions.invalid_value import InvalidValueException
 from src.exceptions.unsupported_platform import UnsupportedPlatformException
 
@@ -23,6 +24,14 @@ class MXSpeakVersion(enum.Enum):
     MX_SPEAK6 = 1
 
 
+## An enum used to represent the different ways of connecting to the panel.
+class TransportType(enum.Enum):
+    SERIAL = "serial"
+    TCP = "tcp"
+    PTY = "pty"
+    LOOPBACK = "loopback"
+
+
 ## Loads the configuration contained within the configuration file.
 #
 # Looks for a directory named in the configuration files
@@ -234,11 +243,461 @@ def get_time_period() -> int:
     return config["time-period"]
 
 
-## Returns the polling time period value from the configuration file.
+## Returns the transaction window from the configuration file.
+#
+# The transaction window is the maximum number of requests which may be in flight at once. As requests
+# are matched to their replies by sequence number, it can not be larger than the number of sequence numbers.
+#
+# @return The transaction window.
+def get_transaction_window() -> int:
+    global config
+    load_config()
+
+    read_value = config["transactions"]["window"]
+
+    if type(read_value) != int:
+        raise InvalidValueException(f"Invalid window value '{read_value}': Window must be an integer value.")
+
+    if read_value < 1 or read_value > constants.SEQ_WRAP:
+        raise InvalidValueException(
+            f"Invalid window value '{read_value}': Window must be between 1 and {constants.SEQ_WRAP}.")
+
+    return read_value
+
+
+## Returns whether the asyncio event loop should be used from the configuration file.
+#
+# @return True if the program should run on an asyncio event loop, False if not.
+def get_asyncio_enabled() -> bool:
+    global config
+    load_config()
+
+    return config["asyncio"]
+
+
+## Returns a retransmission timeout setting from the configuration file.
+#
+# @param key The name of the setting within the "retransmission" section.
+# @return The timeout, in seconds.
+def get_retransmission_timeout(key: str) -> float:
+    global config
+    load_config()
+
+    read_value = config["retransmission"][key]
+
+    if type(read_value) not in (int, float):
+        raise InvalidValueException(f"Invalid {key} value '{read_value}': Timeouts must be a number of seconds.")
+
+    if read_value <= 0:
+        raise InvalidValueException(f"Invalid {key} value '{read_value}': Timeouts must be greater than zero.")
+
+    return read_value
+
+
+## Returns the retransmission timeout used before any round trip times have been measured.
+#
+# @return The initial retransmission timeout, in seconds.
+def get_initial_rto() -> float:
+    return get_retransmission_timeout("initial-timeout")
+
+
+## Returns the smallest retransmission timeout which may be used.
+#
+# @return The minimum retransmission timeout, in seconds.
+def get_rto_floor() -> float:
+    return get_retransmission_timeout("minimum-timeout")
+
+
+## Returns the largest retransmission timeout which may be used.
+#
+# @return The maximum retransmission timeout, in seconds.
+def get_rto_ceiling() -> float:
+    floor = get_rto_floor()
+    read_value = get_retransmission_timeout("maximum-timeout")
+
+    if read_value < floor:
+        raise InvalidValueException(
+            f"Invalid maximum-timeout value '{read_value}': Must not be less than the minimum-timeout, {floor}.")
+
+    return read_value
+
+
+## Returns the maximum number of times a request is sent from the configuration file.
+#
+# @return The maximum number of attempts.
+def get_retry_max_attempts() -> int:
+    global config
+    load_config()
+
+    read_value = config["retry"]["maximum-attempts"]
+
+    if type(read_value) != int or read_value < 1:
+        raise InvalidValueException(
+            f"Invalid maximum-attempts value '{read_value}': Must be an integer value of at least 1.")
+
+    return read_value
+
+
+## Returns the delay before a request is first sent again from the configuration file.
+#
+# @return The base retry delay, in seconds.
+def get_retry_base_delay() -> float:
+    global config
+    load_config()
+
+    return config["retry"]["base-delay"]
+
+
+## Returns the largest delay before a request is sent again from the configuration file.
+#
+# @return The maximum retry delay, in seconds.
+def get_retry_max_delay() -> float:
+    global config
+    load_config()
+
+    return config["retry"]["maximum-delay"]
+
+
+## Returns the fraction of each retry delay which is randomised from the configuration file.
+#
+# @return The retry jitter, between 0 and 1.
+def get_retry_jitter() -> float:
+    global config
+    load_config()
+
+    read_value = config["retry"]["jitter"]
+
+    if type(read_value) not in (int, float) or read_value < 0 or read_value > 1:
+        raise InvalidValueException(f"Invalid jitter value '{read_value}': Jitter must be between 0 and 1.")
+
+    return read_value
+
+
+## Returns the number of failed requests in a row which take a point out of the polling rotation from the
+# configuration file.
+#
+# @return The circuit breaker failure threshold.
+def get_breaker_failure_threshold() -> int:
+    global config
+    load_config()
+
+    return config["circuit-breaker"]["failure-threshold"]
+
+
+## Returns how often a point taken out of the polling rotation is probed from the configuration file.
 #
-# @return The polling time period value.
-def get_polling_time_period() -> int:
+# @return The circuit breaker probe interval, in seconds.
+def get_breaker_probe_interval() -> float:
     global config
     load_config()
 
-    return config["polling-time-period"]
+    return config["circuit-breaker"]["probe-interval"]
+
+
+## Returns the type of transport used to connect to the panel from the configuration file.
+#
+# @return The configured transport type.
+def get_transport_type() -> TransportType:
+    global config
+    load_config()
+
+    read_value = config["transport"]["type"]
+
+    try:
+        return TransportType(read_value)
+    except ValueError:
+        raise InvalidValueException(
+            f"Invalid transport type '{read_value}': Type can only be 'serial', 'tcp', 'pty' or 'loopback'.")
+
+
+## Returns the host name or address of the serial-to-Ethernet converter from the configuration file.
+#
+# @return The TCP host.
+def get_tcp_host() -> str:
+    global config
+    load_config()
+
+    return config["transport"]["tcp"]["host"]
+
+
+## Returns the TCP port of the serial-to-Ethernet converter from the configuration file.
+#
+# @return The TCP port.
+def get_tcp_port() -> int:
+    global config
+    load_config()
+
+    read_value = config["transport"]["tcp"]["port"]
+
+    if type(read_value) != int or read_value < 1 or read_value > 65535:
+        raise InvalidValueException(f"Invalid TCP port '{read_value}': Port must be between 1 and 65535.")
+
+    return read_value
+
+
+## Returns how long to wait for a TCP connection to be made from the configuration file.
+#
+# @return The TCP connect timeout, in seconds.
+def get_tcp_connect_timeout() -> float:
+    global config
+    load_config()
+
+    return config["transport"]["tcp"]["connect-timeout"]
+
+
+## Returns the path of the pseudo-terminal to connect to from the configuration file.
+#
+# @return The pseudo-terminal path.
+def get_pty_path() -> str:
+    global config
+    load_config()
+
+    return config["transport"]["pty"]["path"]
+
+
+## Returns the maximum number of frames coalesced into a single write from the configuration file.
+#
+# @return The output queue limit.
+def get_output_queue_limit() -> int:
+    global config
+    load_config()
+
+    read_value = config["output-queue"]["maximum-frames"]
+
+    if type(read_value) != int or read_value < 1:
+        raise InvalidValueException(
+            f"Invalid maximum-frames value '{read_value}': Must be an integer value of at least 1.")
+
+    return read_value
+
+
+## Returns whether the link should read and write on its own threads from the configuration file.
+#
+# @return True if the link should use reader and writer threads, False if not.
+def get_link_threads_enabled() -> bool:
+    global config
+    load_config()
+
+    return config["threads"]["enabled"]
+
+
+## Returns a queue size setting from the configuration file.
+#
+# @param key The name of the setting within the "threads" section.
+# @return The queue size.
+def get_queue_size(key: str) -> int:
+    global config
+    load_config()
+
+    read_value = config["threads"][key]
+
+    if type(read_value) != int or read_value < 1:
+        raise InvalidValueException(f"Invalid {key} value '{read_value}': Must be an integer value of at least 1.")
+
+    return read_value
+
+
+## Returns the size of the queues between the link's threads and the thread using the link.
+#
+# @return The link queue size.
+def get_link_queue_size() -> int:
+    return get_queue_size("link-queue-size")
+
+
+## Returns the size of the queue of records waiting to be decoded and stored.
+#
+# @return The record queue size.
+def get_record_queue_size() -> int:
+    return get_queue_size("record-queue-size")
+
+
+## Returns whether every frame sent, and every byte received, should be recorded to a capture file.
+#
+# @return True if capturing is enabled, False if it is not.
+def get_capture_enabled() -> bool:
+    global config
+    load_config()
+
+    return config["capture"]["enabled"]
+
+
+## Returns the path to the directory capture files are stored in.
+#
+# @return The path to the capture directory.
+def get_capture_dir() -> str:
+    global config
+    load_config()
+
+    return config["capture"]["directory"]
+
+
+## Returns the maximum number of decoded replies kept by the decode cache from the configuration file.
+#
+# A capacity of 0 disables the cache.
+#
+# @return The decode cache capacity.
+def get_decode_cache_capacity() -> int:
+    global config
+    load_config()
+
+    read_value = config["decode-cache"]["capacity"]
+
+    if type(read_value) != int or read_value < 0:
+        raise InvalidValueException(
+            f"Invalid capacity value '{read_value}': Must be an integer value of at least 0.")
+
+    return read_value
+
+
+## Returns whether only replies which have changed should be decoded and stored from the configuration file.
+#
+# @return True if unchanged replies should be skipped, False if every reply should be stored.
+def get_change_filter_enabled() -> bool:
+    global config
+    load_config()
+
+    return config["change-filter"]["enabled"]
+
+
+## Returns how many polls an unchanged point may go without being stored from the configuration file.
+#
+# @return The number of polls between heartbeats.
+def get_heartbeat_cycles() -> int:
+    global config
+    load_config()
+
+    read_value = config["change-filter"]["heartbeat-cycles"]
+
+    if type(read_value) != int or read_value < 1:
+        raise InvalidValueException(
+            f"Invalid heartbeat-cycles value '{read_value}': Must be an integer value of at least 1.")
+
+    return read_value
+
+
+## Returns whether discovery should first request every point at once from the configuration file.
+#
+# @return True if a request for every point should be sent, False if each point should be probed.
+def get_discovery_wildcard_enabled() -> bool:
+    global config
+    load_config()
+
+    return config["discovery"]["wildcard"]
+
+
+## Returns how many points in a row may have no device before discovery stops from the configuration file.
+#
+# This is 0 by default, so every point is probed. A panel's points need not be addressed without gaps, such as
+# when each loop's devices are numbered from their own block of points, and a gap limit would then stop short
+# of every device after the first large gap. A point which is missed is never read until discovery runs again.
+#
+# @return The gap limit, or 0 if every point should be probed.
+def get_discovery_gap_limit() -> int:
+    global config
+    load_config()
+
+    read_value = config["discovery"]["gap-limit"]
+
+    if type(read_value) != int or read_value < 0:
+        raise InvalidValueException(
+            f"Invalid gap-limit value '{read_value}': Must be an integer value of at least 0.")
+
+    return read_value
+
+
+## Returns the maximum number of times each point is probed by discovery from the configuration file.
+#
+# @return The maximum number of attempts.
+def get_discovery_max_attempts() -> int:
+    global config
+    load_config()
+
+    read_value = config["discovery"]["maximum-attempts"]
+
+    if type(read_value) != int or read_value < 1:
+        raise InvalidValueException(
+            f"Invalid maximum-attempts value '{read_value}': Must be an integer value of at least 1.")
+
+    return read_value
+
+
+## Returns whether the points found on each panel should be cached on disk from the configuration file.
+#
+# @return True if the point inventory should be cached, False if the points should be found on every start.
+def get_inventory_enabled() -> bool:
+    global config
+    load_config()
+
+    return config["inventory"]["enabled"]
+
+
+## Returns the path to the directory inventory files are kept in from the configuration file.
+#
+# @return The path to the inventory directory.
+def get_inventory_dir() -> str:
+    global config
+    load_config()
+
+    return config["inventory"]["directory"]
+
+
+## Returns how many uncached points are probed each time period from the configuration file.
+#
+# @return The number of points probed each time period.
+def get_inventory_revalidation_batch() -> int:
+    global config
+    load_config()
+
+    read_value = config["inventory"]["revalidation-batch"]
+
+    if type(read_value) != int or read_value < 0:
+        raise InvalidValueException(
+            f"Invalid revalidation-batch value '{read_value}': Must be an integer value of at least 0.")
+
+    return read_value
+
+
+## Returns whether the analogue values of each polling cycle should be converted into engineering units from
+# the configuration file.
+#
+# @return True if the analogue values should be converted, False if not.
+def get_unit_conversion_enabled() -> bool:
+    global config
+    load_config()
+
+    return config["unit-conversion"]["enabled"]
+
+
+## Returns the panels to poll from the configuration file.
+#
+# Each panel has a unique "name", and may have a "transport" section choosing how to connect to it. Any
+# transport setting a panel does not give is taken from the "transport", "com" and "serial" sections.
+#
+# @return A list of panel dictionaries.
+def get_panels() -> list:
+    global config
+    load_config()
+
+    read_value = config["panels"]
+
+    if type(read_value) != list or len(read_value) == 0:
+        raise InvalidValueException(f"Invalid panels value '{read_value}': Panels must be a list of at least one panel.")
+
+    names = set()
+
+    for panel in read_value:
+        name = panel.get("name")
+
+        if type(name) != str or name in names:
+            raise InvalidValueException(f"Invalid panel name '{name}': Each panel must have a unique name.")
+
+        names.add(name)
+
+        transport_type = panel.get("transport", dict()).get("type")
+
+        if transport_type is not None and transport_type not in [member.value for member in TransportType]:
+            raise InvalidValueException(
+                f"Invalid transport type '{transport_type}' for panel '{name}': Type can only be 'serial', 'tcp', "
+                f"'pty' or 'loopback'.")
+
+    return read_value
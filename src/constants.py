@@ -7,6 +7,7 @@ ACK = 0x06  # Acknowledge
 SEQ_WRAP = 0x0f  # Number to wrap the SEQ
 RESEND_TIME = 5  # Time to wait before resending a packet
 MAXIMUM_POINT_NUMBER = 250  # The maximum number of points
+ALL_POINTS = 255  # The point number which requests every point
 
 # Packet parameter names
 PNAME_SOH = "soh"
@@ -0,0 +1,231 @@
+## @file discovery.py
+# @brief Contains PointDiscovery, which finds the points which exist on a panel.
+# @author Guy Chamberlain-Webber
+
+import threading
+import time
+
+import src.config as config
+import src.constants as constants
+
+from src.exceptions.invalid_value import InvalidValueException
+from src.packet.packet import Packet, increment_seq, seq_lock
+from src.packet.packet_ids import PacketID
+from src.packet.packet_types import PointInformationRequestMX5
+from src.packet.retry_policy import RetryPolicy
+from src.packet.serial_data_transfer import SerialDataTransfer
+from src.packet.transaction_engine import TransactionEngine
+
+
+## Finds the points which exist on a panel.
+#
+# If 'wildcard' is set, a single request for every point (ALL_POINTS) is sent first. A panel which supports
+# it answers with a reply from each of its points, and nothing more needs to be sent.
+#
+# Otherwise, each point is probed in turn through a transaction engine, so a window of probes is in flight
+# at once and an unanswered probe only holds up its own slot. Most of the points probed usually have no
+# device, so unless an engine is given, each is only probed as many times as the discovery retry policy
+# allows, one by default, and a point which does not answer only lengthens its own timeout.
+#
+# By default every point is probed, as devices may be at any address. If a panel is known to have its points
+# addressed from the start with no large gaps, a 'gap_limit' may be set, and the sweep then stops once that
+# many addresses in a row after the last point found have had no device.
+class PointDiscovery:
+    def __init__(self, link: SerialDataTransfer, wildcard: bool = None, gap_limit: int = None,
+                 engine: TransactionEngine = None):
+        if wildcard is None:
+            wildcard = config.get_discovery_wildcard_enabled()
+
+        if gap_limit is None:
+            gap_limit = config.get_discovery_gap_limit()
+
+        if gap_limit < 0:
+            raise InvalidValueException(f"Invalid gap limit '{gap_limit}': Gap limit must be at least 0.")
+
+        if engine is None:
+            engine = TransactionEngine(link, retry_policy=RetryPolicy(config.get_discovery_max_attempts()))
+
+        self.link = link
+        self.wildcard = wildcard
+        self.gap_limit = gap_limit
+        self.engine = engine
+
+        # The number of probes sent by the last sweep.
+        self.probe_count = 0
+
+    ## Finds the points which exist.
+    #
+    # @param stop_event An event which is set when discovery should stop, or None to run until finished.
+    # @return A sorted list of the valid points.
+    def run(self, stop_event: threading.Event = None) -> list:
+        if self.wildcard:
+            valid_points = self.sweep_wildcard()
+
+            if valid_points:
+                return valid_points
+
+        return self.sweep(stop_event)
+
+    ## Finds the points which exist, from an asyncio event loop.
+    #
+    # The discovery must have been created with an asynchronous link.
+    #
+    # @return A sorted list of the valid points.
+    async def run_async(self) -> list:
+        if self.wildcard:
+            valid_points = await self.sweep_wildcard_async()
+
+            if valid_points:
+                return valid_points
+
+        return await self.sweep_async()
+
+    ## Sends a request for every point, and collects the points which answer.
+    #
+    # Replies are read until none has arrived for a retransmission timeout.
+    #
+    # @return A sorted list of the points which answered, empty if the panel does not support the request.
+    def sweep_wildcard(self) -> list:
+        seq = self._send_wildcard()
+        self.link.flush()
+
+        valid_points = set()
+        deadline = self._get_quiet_deadline()
+
+        while True:
+            result = self.link.read_frame(deadline)
+            if result.is_timeout():
+                break
+
+            self.link.queue_byte(constants.ACK)
+            self._add_wildcard_point(valid_points, seq, result.frame)
+            deadline = self._get_quiet_deadline()
+
+        # Send the ACK for the final reply.
+        self.link.flush()
+
+        return sorted(valid_points)
+
+    ## Sends a request for every point, and collects the points which answer, from an asyncio event loop.
+    #
+    # @return A sorted list of the points which answered, empty if the panel does not support the request.
+    async def sweep_wildcard_async(self) -> list:
+        seq = self._send_wildcard()
+        await self.link.drain()
+
+        valid_points = set()
+        deadline = self._get_quiet_deadline()
+
+        while True:
+            result = await self.link.read_frame(deadline)
+            if result.is_timeout():
+                break
+
+            self.link.queue_byte(constants.ACK)
+            self._add_wildcard_point(valid_points, seq, result.frame)
+            deadline = self._get_quiet_deadline()
+
+        # Send the ACK for the final reply.
+        await self.link.drain()
+
+        return sorted(valid_points)
+
+    ## Probes each point, a batch at a time, until the gap limit is reached or every point has been probed.
+    #
+    # @param stop_event An event which is set when discovery should stop, or None to run until finished.
+    # @return A sorted list of the valid points.
+    def sweep(self, stop_event: threading.Event = None) -> list:
+        valid_points = []
+        self.probe_count = 0
+
+        for requests in self._get_batches():
+            if stop_event is not None and stop_event.is_set():
+                break
+
+            self._add_valid_points(valid_points, self.engine.run(requests))
+
+            if self._gap_limit_reached(valid_points):
+                break
+
+        return valid_points
+
+    ## Probes each point, a batch at a time, until the gap limit is reached or every point has been probed,
+    # from an asyncio event loop.
+    #
+    # @return A sorted list of the valid points.
+    async def sweep_async(self) -> list:
+        valid_points = []
+        self.probe_count = 0
+
+        for requests in self._get_batches():
+            self._add_valid_points(valid_points, await self.engine.run_async(requests))
+
+            if self._gap_limit_reached(valid_points):
+                break
+
+        return valid_points
+
+    ## Queues a request for every point.
+    #
+    # @return The sequence number the request was sent with.
+    def _send_wildcard(self) -> int:
+        with seq_lock:
+            seq = Packet.seq
+            increment_seq()
+
+        self.link.queue(PointInformationRequestMX5(constants.ALL_POINTS).encode(seq))
+
+        return seq
+
+    ## Returns the time by which the next reply to a request for every point must arrive.
+    #
+    # @return The time.monotonic() deadline.
+    def _get_quiet_deadline(self) -> float:
+        return time.monotonic() + self.engine.timers.get_rto()
+
+    ## Adds the point a reply to a request for every point came from.
+    #
+    # @param valid_points The set of points found so far.
+    # @param seq The sequence number the request was sent with.
+    # @param frame The reply frame.
+    def _add_wildcard_point(self, valid_points: set, seq: int, frame: bytes):
+        if frame[constants.PIRMX5_SEQ_INDEX] != seq or len(frame) <= constants.PIRMX5_POINT_NUMBER_INDEX or \
+                frame[constants.PIRMX5_PACKET_ID_INDEX] != PacketID.POINT_INFO_REPLY.value:
+            return
+
+        reply = PointInformationRequestMX5(constants.ALL_POINTS).create_reply(frame)
+
+        if reply.reply_successful() and reply.ppoint_number != constants.ALL_POINTS:
+            valid_points.add(reply.ppoint_number)
+
+    ## Yields the probes to send, a batch at a time.
+    #
+    # Each batch holds at least a full window, and at least the gap limit, so the gap limit can be reached
+    # within a single batch after the last point found.
+    #
+    # @return A generator of lists of requests.
+    def _get_batches(self):
+        batch_size = max(self.engine.window, self.gap_limit)
+
+        for start in range(0, constants.MAXIMUM_POINT_NUMBER + 1, batch_size):
+            end = min(start + batch_size, constants.MAXIMUM_POINT_NUMBER + 1)
+            self.probe_count += end - start
+
+            yield [PointInformationRequestMX5(point, self.link) for point in range(start, end)]
+
+    ## Adds the points which answered a batch of probes.
+    #
+    # @param valid_points The list of points found so far.
+    # @param transactions The transactions of the batch.
+    def _add_valid_points(self, valid_points: list, transactions: list):
+        for transaction in transactions:
+            if transaction.is_complete() and transaction.reply.reply_successful():
+                valid_points.append(transaction.get_point())
+
+    ## Returns whether the sweep has gone 'gap_limit' points past the last point found.
+    #
+    # @param valid_points The list of points found so far.
+    # @return True if the sweep should stop, False if not.
+    def _gap_limit_reached(self, valid_points: list) -> bool:
+        return self.gap_limit > 0 and len(valid_points) > 0 and \
+            self.probe_count - 1 - valid_points[-1] >= self.gap_limit
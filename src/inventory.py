@@ -0,0 +1,276 @@
+## @file inventory.py
+# @brief Contains the PointInventory, a cache of the points found on a panel which is kept on disk, so
+# polling can start straight away when the program is restarted.
+# @author Guy Chamberlain-Webber
+
+import os
+import struct
+
+import src.config as config
+import src.constants as constants
+
+from src.packet.packet_types import PanelDetailsRequestMX5, PointInformationRequestMX5
+from src.packet.transaction_engine import TransactionEngine
+
+# Written at the start of every inventory file.
+INVENTORY_MAGIC = b"BBXINV01"
+
+# The header of an inventory file: the magic, the length of the panel identity which follows and the number
+# of entries after it.
+INVENTORY_HEADER = struct.Struct("<8sHH")
+
+# Each entry of an inventory file: point number, device type, logical point zone and loop type.
+INVENTORY_ENTRY = struct.Struct("<BBBB")
+
+# The bytes at the start and end of a panel details reply which are not part of the panel's identity: SOH,
+# SEQ and the checksum.
+IDENTITY_START = 2
+IDENTITY_END = -1
+
+
+## What is known about a point found on a panel.
+class InventoryEntry:
+    __slots__ = ("point_number", "device_type", "zone", "loop_type")
+
+    def __init__(self, point_number: int, device_type: int, zone: int, loop_type: int):
+        self.point_number = point_number
+        self.device_type = device_type
+        self.zone = zone
+        self.loop_type = loop_type
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, InventoryEntry) and self.pack() == other.pack()
+
+    ## Packs the entry as it is stored in an inventory file.
+    #
+    # @return The bytes of the entry.
+    def pack(self) -> bytes:
+        return INVENTORY_ENTRY.pack(self.point_number, self.device_type, self.zone, self.loop_type)
+
+
+## The points found on a panel, and the identity of the panel they were found on.
+#
+# The inventory is kept up to date from the replies received while polling: a point which answers is added
+# or updated, and a point which answers that it does not exist is removed. It is only written back to its
+# file when it has changed.
+class PointInventory:
+    ## @param path The path of the inventory file.
+    # @param identity The panel's identity: the contents of its panel details reply.
+    def __init__(self, path: str, identity: bytes = b""):
+        self.path = path
+        self.identity = identity
+        self.changed = False
+
+        self._entries = dict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, point: int) -> bool:
+        return point in self._entries
+
+    ## Returns the entry for a point.
+    #
+    # @param point The point number.
+    # @return The entry, or None if the point is not in the inventory.
+    def get_entry(self, point: int):
+        return self._entries.get(point)
+
+    ## Returns the points in the inventory.
+    #
+    # @return A sorted list of the point numbers.
+    def get_points(self) -> list:
+        return sorted(self._entries)
+
+    ## Adds or updates a point.
+    #
+    # @param entry The point's entry.
+    def add(self, entry: InventoryEntry):
+        if self._entries.get(entry.point_number) != entry:
+            self._entries[entry.point_number] = entry
+            self.changed = True
+
+    ## Removes a point, if it is in the inventory.
+    #
+    # @param point The point number.
+    def remove(self, point: int):
+        if self._entries.pop(point, None) is not None:
+            self.changed = True
+
+    ## Updates a point from the reply to a point information request.
+    #
+    # @param point The point number requested.
+    # @param reply The reply.
+    def record(self, point: int, reply):
+        if reply.reply_successful():
+            self.add(InventoryEntry(point, reply.pdevice_type, reply.plogical_point_zone, reply.ploop_type))
+        else:
+            self.remove(point)
+
+    ## Writes the inventory to its file, replacing the file in one step so it is never left half written.
+    def save(self):
+        temporary_path = f"{self.path}.tmp"
+
+        with open(temporary_path, "wb") as file:
+            file.write(INVENTORY_HEADER.pack(INVENTORY_MAGIC, len(self.identity), len(self._entries)))
+            file.write(self.identity)
+
+            for point in sorted(self._entries):
+                file.write(self._entries[point].pack())
+
+        os.replace(temporary_path, self.path)
+        self.changed = False
+
+    ## Writes the inventory to its file if it has changed since it was last written.
+    #
+    # @return True if the inventory was written, False if not.
+    def save_if_changed(self) -> bool:
+        if not self.changed:
+            return False
+
+        self.save()
+        return True
+
+
+## Reads an inventory file.
+#
+# @param path The path of the inventory file.
+# @return The inventory, or None if the file does not exist or is not a valid inventory file.
+def load_inventory(path: str):
+    try:
+        with open(path, "rb") as file:
+            data = file.read()
+    except FileNotFoundError:
+        return None
+
+    magic, identity_length, entry_count = INVENTORY_HEADER.unpack_from(data.ljust(INVENTORY_HEADER.size, b"\0"))
+    entries_start = INVENTORY_HEADER.size + identity_length
+
+    if magic != INVENTORY_MAGIC or len(data) != entries_start + entry_count * INVENTORY_ENTRY.size:
+        print(f"Ignoring invalid inventory file '{path}'.")
+        return None
+
+    inventory = PointInventory(path, bytes(data[INVENTORY_HEADER.size:entries_start]))
+
+    for values in INVENTORY_ENTRY.iter_unpack(data[entries_start:]):
+        inventory.add(InventoryEntry(*values))
+
+    inventory.changed = False
+
+    return inventory
+
+
+## Returns the path of a panel's inventory file in the configured inventory directory.
+#
+# @param name The name of the panel.
+# @return The path of the inventory file.
+def get_inventory_path(name: str) -> str:
+    directory = config.get_inventory_dir()
+    os.makedirs(directory, exist_ok=True)
+
+    return os.path.join(directory, f"{name}.inv")
+
+
+## Asks a panel for its identity: the contents of its panel details reply.
+#
+# @param engine The transaction engine to send the request through.
+# @return The identity, or None if the panel did not answer.
+def read_panel_identity(engine: TransactionEngine):
+    return get_panel_identity(engine.run([PanelDetailsRequestMX5(engine.link)]))
+
+
+## Asks a panel for its identity: the contents of its panel details reply, from an asyncio event loop.
+#
+# @param engine The transaction engine to send the request through.
+# @return The identity, or None if the panel did not answer.
+async def read_panel_identity_async(engine: TransactionEngine):
+    return get_panel_identity(await engine.run_async([PanelDetailsRequestMX5(engine.link)]))
+
+
+## Returns the identity of a panel from its panel details reply.
+#
+# @param transactions The transactions returned by running a panel details request.
+# @return The identity, or None if the panel did not answer.
+def get_panel_identity(transactions: list):
+    transaction = transactions[0]
+
+    if not transaction.is_complete():
+        return None
+
+    return bytes(transaction.reply[IDENTITY_START:IDENTITY_END])
+
+
+## Opens a panel's inventory.
+#
+# The cached inventory is only used if it was found on the same panel, judged by its panel details reply.
+# If the panel does not answer, the cached inventory is used anyway, and checked as the panel is polled.
+#
+# @param path The path of the inventory file.
+# @param identity The panel's identity, or None if it is not known.
+# @return The inventory, which is empty if there is no usable cached inventory.
+def open_inventory(path: str, identity) -> PointInventory:
+    inventory = load_inventory(path)
+
+    if inventory is None or (identity is not None and inventory.identity != identity):
+        inventory = PointInventory(path)
+
+    if identity is not None:
+        inventory.identity = identity
+
+    return inventory
+
+
+## Probes the points which are not in an inventory a few at a time, so devices added to the panel are found
+# without stopping to sweep every point.
+#
+# Each call to probe() sends the next batch, carrying on from where the last left off and wrapping around
+# once every point has been probed.
+class InventoryRevalidator:
+    ## @param inventory The inventory to add points to.
+    # @param engine The transaction engine to send probes through.
+    # @param batch_size The number of points probed each time.
+    def __init__(self, inventory: PointInventory, engine: TransactionEngine, batch_size: int = None):
+        if batch_size is None:
+            batch_size = config.get_inventory_revalidation_batch()
+
+        self.inventory = inventory
+        self.engine = engine
+        self.batch_size = batch_size
+
+        self._next_point = 0
+
+    ## Probes the next batch of points.
+    def probe(self):
+        self._record(self.engine.run(self._get_requests()))
+
+    ## Probes the next batch of points, from an asyncio event loop.
+    async def probe_async(self):
+        self._record(await self.engine.run_async(self._get_requests()))
+
+    ## Returns the requests for the next batch of points which are not in the inventory.
+    #
+    # @return The requests.
+    def _get_requests(self) -> list:
+        points = []
+        point_count = constants.MAXIMUM_POINT_NUMBER + 1
+
+        for _ in range(point_count):
+            if len(points) == self.batch_size:
+                break
+
+            point = self._next_point
+            self._next_point = (point + 1) % point_count
+
+            if point not in self.inventory:
+                points.append(point)
+
+        return [PointInformationRequestMX5(point, self.engine.link) for point in points]
+
+    ## Adds the points which answered.
+    #
+    # @param transactions The transactions of the batch.
+    def _record(self, transactions: list):
+        for transaction in transactions:
+            if transaction.is_complete():
+                self.inventory.record(transaction.get_point(), transaction.reply)
+
@@ -34,11 +34,21 @@ def create_log_dir():
 # @param entry The log entry.
 # @param logfile The log file.
 def write_log(entry: str, logfile: str):
-    if not config.get_log_enabled():
+    write_logs([entry], logfile)
+
+
+## Writes several log entries within the log directory at once.
+#
+# Each entry is given the same time and date, and the log file is only opened once for all of them.
+#
+# @param entries The log entries.
+# @param logfile The log file.
+def write_logs(entries: list, logfile: str):
+    if not config.get_log_enabled() or not entries:
         return
 
     current_time = time.strftime("%d/%m/%Y @ %H:%M:%S", time.gmtime())
-    entry = "{} - {}\n".format(current_time, entry)
+    entry = "".join("{} - {}\n".format(current_time, entry) for entry in entries)
 
     plat = sys.platform
 
@@ -0,0 +1,269 @@
+## @file async_serial_data_transfer.py
+# @brief Responsible for writing and reading data across a serial data transfer from an asyncio
+# event loop.
+# @author Guy Chamberlain-Webber
+
+import asyncio
+import os
+import sys
+import time
+
+import src.constants as constants
+from src.exceptions.unsupported_platform import UnsupportedPlatformException
+from src.packet.capture import CaptureDirection, CaptureWriter
+from src.packet.frame_parser import FrameParser
+from src.packet.output_queue import OutputQueue
+from src.packet.read_result import ReadResult, frame_result, timeout_result
+from src.packet.serial_data_transfer import SINGLE_BYTES
+from src.transport.transport import ITransport
+from src.transport.transport_factory import create_transport
+
+# The maximum number of bytes read from the port each time it becomes readable.
+READ_CHUNK_SIZE = 4096
+
+# Put on the received frame queue when the other end closes the connection.
+DISCONNECTED = None
+
+
+## A long-lived link session for use from an asyncio event loop.
+#
+# The transport's file descriptor is put into non-blocking mode and registered with the event loop,
+# so bytes are fed into the frame parser as soon as they arrive and nothing ever blocks the loop. The
+# session must be opened from within a running event loop.
+#
+# As with SerialDataTransfer, frames and ACKs may be queued, and are then written together by flush(),
+# when the queue is full, before waiting for a reply or by drain(). If a capture writer is given, every
+# frame sent, and every byte received, is recorded to it.
+#
+# If the other end closes the connection, the transport is closed, and read_frame() raises ConnectionError
+# once every frame received before then has been read.
+#
+# The transport chosen in the configuration file is used, unless one is given.
+class AsyncSerialDataTransfer:
+    def __init__(self, transport: ITransport = None, capture: CaptureWriter = None):
+        if sys.platform == "win32":
+            raise UnsupportedPlatformException(
+                "The asynchronous link is not supported on platforms of type 'win32'.")
+
+        if transport is None:
+            transport = create_transport(timeout=0)
+
+        self.transport = transport
+        self.capture = capture
+        self.open_count = 0
+        self.close_count = 0
+
+        self.parser = FrameParser()
+        self.output = OutputQueue()
+
+        self._loop = None
+        self._fd = None
+        self._frames = None
+        self._pending_output = bytearray()
+        self._drained = None
+        self._disconnected = False
+
+    async def __aenter__(self):
+        self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    ## Opens the transport and registers it with the running event loop.
+    def open(self):
+        if self.is_open():
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._frames = asyncio.Queue()
+        self._drained = asyncio.Event()
+        self._drained.set()
+        self._disconnected = False
+
+        self.transport.open()
+        self._fd = self.transport.fileno()
+        os.set_blocking(self._fd, False)
+
+        self._loop.add_reader(self._fd, self._on_readable)
+        self.open_count += 1
+
+    ## Unregisters the transport from the event loop and closes it.
+    def close(self):
+        if not self.is_open():
+            return
+
+        self.flush()
+        self._loop.remove_reader(self._fd)
+        self._loop.remove_writer(self._fd)
+
+        self.transport.close()
+        self._fd = None
+        self.close_count += 1
+
+        if self.capture is not None:
+            self.capture.flush()
+
+    ## Returns whether the transport is currently open.
+    #
+    # @return True if the transport is open, False if not.
+    def is_open(self) -> bool:
+        return self.transport.is_open()
+
+    ## Writes data across a serial communication port, along with anything already queued.
+    #
+    # As much of the data as possible is written immediately. Anything the port can not yet accept is
+    # written once it becomes writable, see drain().
+    def write(self, data):
+        self.queue(data)
+        self.flush()
+
+    ## Writes a single byte of data across a serial communication port, along with anything already queued.
+    def write_byte(self, value):
+        self.queue_byte(value)
+        self.flush()
+
+    ## Queues data to be written across a serial communication port.
+    #
+    # If the queue becomes full, everything queued is written.
+    #
+    # @param data The data to write.
+    def queue(self, data):
+        if self.output.add(bytes(data)):
+            self.flush()
+
+    ## Queues a single byte of data to be written across a serial communication port.
+    #
+    # @param value The byte to write.
+    def queue_byte(self, value: int):
+        if self.output.add(SINGLE_BYTES[value]):
+            self.flush()
+
+    ## Writes everything queued across a serial communication port, in a single write.
+    def flush(self):
+        if self.capture is not None:
+            self.capture.record_all(CaptureDirection.TX, self.output.peek())
+
+        data = self.output.take()
+
+        if not data:
+            return
+
+        if not self.is_open():
+            raise ConnectionError("The link is not open.")
+
+        if self._pending_output:
+            self._pending_output += data
+            return
+
+        try:
+            written = os.write(self._fd, data)
+        except BlockingIOError:
+            written = 0
+
+        if written < len(data):
+            self._pending_output += data[written:]
+            self._drained.clear()
+            self._loop.add_writer(self._fd, self._on_writable)
+
+    ## Returns how well writes are being coalesced.
+    #
+    # @return A dictionary of the number of writes, frames and bytes, and the mean number of frames per write.
+    def get_coalescing_stats(self) -> dict:
+        return self.output.get_stats()
+
+    ## Writes anything queued, then waits until every byte written has been passed to the port.
+    async def drain(self):
+        self.flush()
+        await self._drained.wait()
+
+    ## Reads the next frame from a serial communication port.
+    #
+    # @param deadline The time.monotonic() time by which a frame must arrive. If not given, the deadline
+    # is RESEND_TIME from now.
+    # @return The result of the read, holding the frame if one was received in time.
+    async def read_frame(self, deadline: float = None) -> ReadResult:
+        # Anything queued may be what the reply is waiting for.
+        self.flush()
+
+        if deadline is None:
+            deadline = time.monotonic() + constants.RESEND_TIME
+
+        if self._disconnected and self._frames.empty():
+            raise ConnectionError("The connection was closed by the other end.")
+
+        try:
+            frame = await asyncio.wait_for(self._frames.get(), deadline - time.monotonic())
+        except asyncio.TimeoutError:
+            pass
+        else:
+            if frame is DISCONNECTED:
+                raise ConnectionError("The connection was closed by the other end.")
+
+            return frame_result(frame)
+
+        # No more bytes have arrived to complete a buffered frame, so it never will be.
+        for frame in self.parser.resync():
+            self._frames.put_nowait(frame)
+
+        if not self._frames.empty():
+            return frame_result(self._frames.get_nowait())
+
+        return timeout_result()
+
+    ## Called by the event loop when the serial port has bytes waiting to be read.
+    def _on_readable(self):
+        try:
+            chunk = os.read(self._fd, READ_CHUNK_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            # Such as EIO once a pseudo-terminal has been hung up.
+            self._on_disconnected()
+            return
+
+        if not chunk:
+            self._on_disconnected()
+            return
+
+        for frame in self.parser.feed(self._capture_received(chunk)):
+            self._frames.put_nowait(frame)
+
+    ## Called when the port is readable but has nothing to read, or can not be read, as the other end has
+    # closed the connection.
+    #
+    # The transport is closed, anything still waiting to be written is discarded and read_frame() is woken.
+    def _on_disconnected(self):
+        self._loop.remove_reader(self._fd)
+        self._loop.remove_writer(self._fd)
+
+        self.transport.close()
+        self._fd = None
+        self._disconnected = True
+
+        self._pending_output.clear()
+        self._drained.set()
+        self._frames.put_nowait(DISCONNECTED)
+
+    ## Records bytes received to the capture file as they were read, before they are parsed, if capturing.
+    #
+    # @param chunk The bytes received.
+    # @return The same bytes.
+    def _capture_received(self, chunk: bytes) -> bytes:
+        if self.capture is not None:
+            self.capture.record(CaptureDirection.RX, chunk)
+
+        return chunk
+
+    ## Called by the event loop when the serial port can accept more output.
+    def _on_writable(self):
+        try:
+            written = os.write(self._fd, self._pending_output)
+        except BlockingIOError:
+            return
+
+        del self._pending_output[:written]
+
+        if not self._pending_output:
+            self._loop.remove_writer(self._fd)
+            self._drained.set()
@@ -0,0 +1,104 @@
+## @file batch_decode.py
+# @brief Contains functions to decode many point information replies at once into a NumPy structured array.
+# @author Guy Chamberlain-Webber
+
+import numpy as np
+
+import src.constants as constants
+from src.config import MXSpeakVersion
+from src.exceptions.invalid_value import InvalidValueException
+from src.packet.capture import CaptureReader, received_frames
+from src.packet.packet_ids import PacketID
+from src.packet.packet_types import PointInformationReplyMX5, PointInformationReplyMX6
+
+# The reply class for each version, whose schema gives the offset of each field.
+REPLY_TYPES = {
+    MXSpeakVersion.MX_SPEAK5: PointInformationReplyMX5,
+    MXSpeakVersion.MX_SPEAK6: PointInformationReplyMX6
+}
+
+# The name of the checksum field, which follows the last field in the schema.
+CHECKSUM_FIELD = "checksum"
+
+# The dtype built for each version, so each is only built once.
+dtypes = dict()
+
+
+## Returns the NumPy dtype of a point information reply.
+#
+# The dtype has a single byte field for each parameter in the reply's schema, at its index in the frame,
+# followed by the checksum. Its item size is the size of the frame, so a buffer of replies laid end to end
+# can be viewed as an array of them.
+#
+# @param version The MX Speak version of the replies.
+# @return The dtype.
+def get_reply_dtype(version: MXSpeakVersion) -> np.dtype:
+    dtype = dtypes.get(version)
+
+    if dtype is None:
+        schema = REPLY_TYPES[version].SCHEMA
+        checksum_index = max(index for _, index in schema) + 1
+
+        dtype = dtypes[version] = np.dtype({
+            "names": [name for name, _ in schema] + [CHECKSUM_FIELD],
+            "formats": [np.uint8] * (len(schema) + 1),
+            "offsets": [index for _, index in schema] + [checksum_index],
+            "itemsize": checksum_index + 1
+        })
+
+    return dtype
+
+
+## Returns the size in bytes of a point information reply.
+#
+# @param version The MX Speak version of the reply.
+# @return The size of the reply.
+def get_reply_size(version: MXSpeakVersion) -> int:
+    return get_reply_dtype(version).itemsize
+
+
+## Decodes a buffer of point information replies laid end to end.
+#
+# No bytes are copied: the array is a view of the buffer.
+#
+# @param buffer The replies.
+# @param version The MX Speak version of the replies.
+# @return A structured array with an element for each reply, and a field for each parameter.
+def decode_replies(buffer, version: MXSpeakVersion) -> np.ndarray:
+    dtype = get_reply_dtype(version)
+
+    if len(buffer) % dtype.itemsize != 0:
+        raise InvalidValueException(
+            f"Invalid buffer length '{len(buffer)}': Length must be a multiple of the reply size, {dtype.itemsize}.")
+
+    return np.frombuffer(buffer, dtype=dtype)
+
+
+## Returns which of a buffer of point information replies have a valid checksum.
+#
+# @param buffer The replies, laid end to end.
+# @param version The MX Speak version of the replies.
+# @return A boolean array, True for each reply whose checksum is valid.
+def checksum_mask(buffer, version: MXSpeakVersion) -> np.ndarray:
+    size = get_reply_size(version)
+    frames = np.frombuffer(buffer, dtype=np.uint8).reshape(-1, size)
+
+    return frames[:, 1:-1].sum(axis=1, dtype=np.uint32) % 256 == frames[:, -1]
+
+
+## Collects every point information reply received in a capture file into one buffer, ready to be decoded.
+#
+# @param path The path of the capture file.
+# @param version The MX Speak version of the replies.
+# @return The replies, laid end to end.
+def read_capture_replies(path: str, version: MXSpeakVersion) -> bytearray:
+    size = get_reply_size(version)
+    packet_id_index = get_reply_dtype(version).fields[constants.PNAME_PACKET_ID][1]
+    buffer = bytearray()
+
+    with CaptureReader(path) as reader:
+        for frame in received_frames(reader):
+            if len(frame) == size and frame[packet_id_index] == PacketID.POINT_INFO_REPLY.value:
+                buffer += frame
+
+    return buffer
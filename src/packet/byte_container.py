@@ -8,6 +8,8 @@ import abc
 
 ## An interface containing specific byte-related functions.
 class IByteContainer(abc.ABC):
+    __slots__ = ()
+
     ## Gets an object as an array of bytes.
     #
     # @return The containing object as an array of bytes.
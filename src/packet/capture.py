@@ -0,0 +1,228 @@
+## @file capture.py
+# @brief Contains the CaptureWriter and CaptureReader, which record everything sent and received on a link
+# to a compact binary file, and read it back.
+# @author Guy Chamberlain-Webber
+
+import enum
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+
+import src.config as config
+from src.packet.frame_parser import FrameParser
+
+# Written at the start of every capture file.
+CAPTURE_MAGIC = b"BBXCAP01"
+
+# The header of each record: direction, time.monotonic_ns() timestamp and the number of bytes which follow.
+RECORD_HEADER = struct.Struct("<BQH")
+
+
+## An enum used to represent the direction a captured frame travelled in.
+class CaptureDirection(enum.Enum):
+    TX = 0  # Sent to the panel.
+    RX = 1  # Received from the panel.
+
+
+## A single captured frame, or chunk of received bytes.
+#
+# Frames sent are recorded whole. Bytes received are recorded exactly as they were read from the transport,
+# before being split into frames, so anything which did not form a valid frame, such as line noise or a
+# frame with a bad checksum, is kept too. A received record may therefore hold part of a frame, or several.
+#
+# The frame is a memoryview into the capture file, so no bytes are copied to read it.
+class CaptureRecord:
+    __slots__ = ("direction", "timestamp_ns", "frame")
+
+    def __init__(self, direction: CaptureDirection, timestamp_ns: int, frame: memoryview):
+        self.direction = direction
+        self.timestamp_ns = timestamp_ns
+        self.frame = frame
+
+
+## Appends frames sent, and chunks of bytes received, to a capture file.
+#
+# Records may be written from several threads, such as a link's reader and writer threads.
+class CaptureWriter:
+    def __init__(self, path: str):
+        self.path = path
+        self.record_count = 0
+
+        self._lock = threading.Lock()
+        self._file = open(path, "ab")
+
+        if self._file.tell() == 0:
+            self._file.write(CAPTURE_MAGIC)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    ## Appends a frame to the capture file.
+    #
+    # @param direction The direction the frame travelled in.
+    # @param frame The bytes of the frame.
+    # @param timestamp_ns The time.monotonic_ns() time the frame was sent or received. The current time is
+    # used if not given.
+    def record(self, direction: CaptureDirection, frame, timestamp_ns: int = None):
+        if timestamp_ns is None:
+            timestamp_ns = time.monotonic_ns()
+
+        with self._lock:
+            self._file.write(RECORD_HEADER.pack(direction.value, timestamp_ns, len(frame)))
+            self._file.write(frame)
+            self.record_count += 1
+
+    ## Appends several frames to the capture file, all with the same timestamp.
+    #
+    # @param direction The direction the frames travelled in.
+    # @param frames The bytes of each frame.
+    def record_all(self, direction: CaptureDirection, frames):
+        timestamp_ns = time.monotonic_ns()
+
+        for frame in frames:
+            self.record(direction, frame, timestamp_ns)
+
+    ## Writes any buffered records to the capture file.
+    def flush(self):
+        with self._lock:
+            self._file.flush()
+
+    ## Closes the capture file.
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+## Reads the frames in a capture file.
+#
+# The file is memory-mapped, and each record's frame is a view into the mapping, so no bytes are copied
+# while iterating. A record cut short at the end of the file, for example by a power cut while it was being
+# written, is ignored.
+class CaptureReader:
+    def __init__(self, path: str):
+        self.path = path
+
+        with open(path, "rb") as fd:
+            self._mmap = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._view = memoryview(self._mmap)
+
+        if self._view[:len(CAPTURE_MAGIC)] != CAPTURE_MAGIC:
+            self.close()
+            raise ValueError(f"'{path}' is not a capture file.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __iter__(self):
+        view = self._view
+        offset = len(CAPTURE_MAGIC)
+        end = len(view)
+
+        while offset + RECORD_HEADER.size <= end:
+            direction, timestamp_ns, length = RECORD_HEADER.unpack_from(view, offset)
+            offset += RECORD_HEADER.size
+
+            if offset + length > end:
+                return
+
+            yield CaptureRecord(CaptureDirection(direction), timestamp_ns, view[offset:offset + length])
+            offset += length
+
+    ## Closes the capture file.
+    #
+    # If any frames are still referenced, the file stays mapped until the last of them is released.
+    def close(self):
+        if self._view is None:
+            return
+
+        self._view.release()
+        self._view = None
+
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+
+## Opens a new capture file for a panel in the configured capture directory.
+#
+# @param name The name of the panel.
+# @return The capture writer.
+def open_capture(name: str) -> CaptureWriter:
+    directory = config.get_capture_dir()
+    os.makedirs(directory, exist_ok=True)
+
+    return CaptureWriter(os.path.join(directory, f"{name}-{time.strftime('%Y%m%d-%H%M%S')}.cap"))
+
+
+## Splits the bytes received in a capture file into frames, as the link did when they were received.
+#
+# @param reader The capture reader.
+# @return A generator of the valid frames received, in order.
+def received_frames(reader: CaptureReader):
+    parser = FrameParser()
+
+    for record in reader:
+        if record.direction is CaptureDirection.RX:
+            yield from parser.feed(record.frame)
+
+    yield from parser.resync()
+
+
+## Decodes every point information reply received in a capture file, as fast as possible.
+#
+# Each reply is decoded as the version whose reply type is the same size, using the indices in that type's
+# schema.
+#
+# @param path The path of the capture file.
+# @param handler A function called with each decoded reply.
+# @return The number of replies decoded.
+def replay(path: str, handler) -> int:
+    # Imported here, as the packet types depend on the links, which depend on this module.
+    from src.packet.batch_decode import REPLY_TYPES, get_reply_dtype
+    from src.packet.packet_ids import PacketID
+    import src.constants as constants
+
+    # The reply type, and the indices of its packet ID and point number, for each size of reply.
+    layouts = dict()
+
+    for version, reply_type in REPLY_TYPES.items():
+        dtype = get_reply_dtype(version)
+        layouts[dtype.itemsize] = (reply_type, dtype.fields[constants.PNAME_PACKET_ID][1],
+                                   dtype.fields[constants.PNAME_POINT_NUMBER][1])
+
+    count = 0
+
+    with CaptureReader(path) as reader:
+        for frame in received_frames(reader):
+            layout = layouts.get(len(frame))
+
+            if layout is None:
+                continue
+
+            reply_type, packet_id_index, point_number_index = layout
+
+            if frame[packet_id_index] == PacketID.POINT_INFO_REPLY.value:
+                handler(reply_type(frame[point_number_index], frame))
+                count += 1
+
+    return count
+
+
+if __name__ == "__main__":
+    start_time = time.perf_counter()
+    replayed = replay(sys.argv[1], lambda reply: reply.get_as_csv() if hasattr(reply, "get_as_csv") else str(reply))
+    elapsed = time.perf_counter() - start_time
+
+    print(f"Decoded {replayed} repl(ies) in {elapsed:.3f}s ({replayed / max(elapsed, 1e-9):.0f} per second).")
@@ -0,0 +1,122 @@
+## @file circuit_breaker.py
+# @brief Contains circuit breakers, which take points that keep failing out of the polling rotation.
+# @author Guy Chamberlain-Webber
+
+import enum
+
+import src.config as config
+
+
+## An enum used to represent the state of a circuit breaker.
+class BreakerState(enum.Enum):
+    CLOSED = 0      # Requests are sent as normal.
+    OPEN = 1        # Requests are not sent.
+    HALF_OPEN = 2   # A single probe request is being sent.
+
+
+## A circuit breaker for a single point.
+#
+# Once 'failure_threshold' requests in a row have failed, the breaker opens and no more requests are sent.
+# After 'probe_interval' seconds, a single probe request is allowed. If it succeeds, the breaker closes
+# again, otherwise it stays open until the next probe.
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int, probe_interval: float):
+        self.failure_threshold = failure_threshold
+        self.probe_interval = probe_interval
+
+        self.state = BreakerState.CLOSED
+        self.failure_count = 0
+        self.opened_time = None
+
+    ## Returns whether a request may be sent.
+    #
+    # If the breaker is open and a probe is due, the breaker moves to half open and the probe is allowed.
+    #
+    # @param now The current time.monotonic() time.
+    # @return True if a request may be sent, False if not.
+    def allow_request(self, now: float) -> bool:
+        if self.state is BreakerState.CLOSED:
+            return True
+
+        if self.state is BreakerState.OPEN and now - self.opened_time >= self.probe_interval:
+            self.state = BreakerState.HALF_OPEN
+            return True
+
+        return False
+
+    ## Records that a request succeeded.
+    def record_success(self):
+        self.state = BreakerState.CLOSED
+        self.failure_count = 0
+        self.opened_time = None
+
+    ## Records that a request failed.
+    #
+    # @param now The current time.monotonic() time.
+    def record_failure(self, now: float):
+        self.failure_count += 1
+
+        if self.state is BreakerState.HALF_OPEN or self.failure_count >= self.failure_threshold:
+            self.state = BreakerState.OPEN
+            self.opened_time = now
+
+
+## Keeps a circuit breaker for each point on a panel.
+class PointBreakers:
+    def __init__(self, failure_threshold: int = None, probe_interval: float = None):
+        if failure_threshold is None:
+            failure_threshold = config.get_breaker_failure_threshold()
+
+        if probe_interval is None:
+            probe_interval = config.get_breaker_probe_interval()
+
+        self.failure_threshold = failure_threshold
+        self.probe_interval = probe_interval
+
+        self._breakers = dict()
+
+    ## Returns whether a request may be sent to a point.
+    #
+    # @param point The point number, or None if the request is not for a point.
+    # @param now The current time.monotonic() time.
+    # @return True if a request may be sent, False if not.
+    def allow_request(self, point: int, now: float) -> bool:
+        if point is None:
+            return True
+
+        return self.get_breaker(point).allow_request(now)
+
+    ## Records that a request to a point succeeded.
+    #
+    # @param point The point number, or None if the request was not for a point.
+    def record_success(self, point: int):
+        if point is not None:
+            self.get_breaker(point).record_success()
+
+    ## Records that a request to a point failed.
+    #
+    # @param point The point number, or None if the request was not for a point.
+    # @param now The current time.monotonic() time.
+    def record_failure(self, point: int, now: float):
+        if point is not None:
+            self.get_breaker(point).record_failure(now)
+
+    ## Returns the breaker for a point, creating it if it does not exist.
+    #
+    # @param point The point number.
+    # @return The breaker for the point.
+    def get_breaker(self, point: int) -> CircuitBreaker:
+        breaker = self._breakers.get(point)
+
+        if breaker is None:
+            breaker = CircuitBreaker(self.failure_threshold, self.probe_interval)
+            self._breakers[point] = breaker
+
+        return breaker
+
+    ## Returns the points whose breakers are not closed.
+    #
+    # @return A dictionary of breaker states, keyed by point number.
+    def get_open_points(self) -> dict:
+        return {point: breaker.state for point, breaker in self._breakers.items()
+                if breaker.state is not BreakerState.CLOSED}
@@ -19,11 +19,7 @@ class Content(IByteContainer):
     #
     # @return True if 'key' exists, False if it doesn't.
     def check_exists(self, key: str) -> bool:
-        for attr in self._params:
-            if attr == key:
-                return True
-
-        return False
+        return key in self._params
 
     ## Gets an object as an array of bytes.
     #
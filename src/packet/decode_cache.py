@@ -0,0 +1,110 @@
+## @file decode_cache.py
+# @brief Contains the DecodeCache, which remembers the decoded form of recently received replies.
+# @author Guy Chamberlain-Webber
+
+import collections
+import threading
+
+import src.config as config
+from src.exceptions.invalid_value import InvalidValueException
+
+# The decode cache shared by the whole process.
+decode_cache = None
+
+# The bytes at the start and end of a frame which are left out of the key, as they change between
+# otherwise identical replies: SOH, SEQ and the checksum.
+KEY_START = 2
+KEY_END = -1
+
+
+## A bounded, least recently used cache of decoded replies.
+#
+# Most points return byte for byte the same reply every poll. Replies are keyed by their bytes, leaving out
+# the SOH, SEQ and checksum, so an unchanged reply is only decoded the first time it is seen. The number of
+# hits and misses is recorded, to show how often decoding is avoided.
+class DecodeCache:
+    def __init__(self, capacity: int = None):
+        if capacity is None:
+            capacity = config.get_decode_cache_capacity()
+
+        if capacity < 0:
+            raise InvalidValueException(f"Invalid capacity value '{capacity}': Capacity must be at least 0.")
+
+        self.capacity = capacity
+        self.hit_count = 0
+        self.miss_count = 0
+
+        self._entries = collections.OrderedDict()
+
+        # Replies may be decoded on several threads, such as the record sink and a panel's thread.
+        self._lock = threading.Lock()
+
+    ## Returns the decoded form of a reply, decoding it if it is not already cached.
+    #
+    # The value returned is shared with every other identical reply, so must not be modified.
+    #
+    # @param frame The bytes of the reply.
+    # @param decode A function which decodes the reply, called if it is not cached.
+    # @return The decoded form of the reply.
+    def get(self, frame, decode):
+        key = bytes(frame[KEY_START:KEY_END])
+
+        with self._lock:
+            value = self._entries.get(key)
+
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hit_count += 1
+                return value
+
+            self.miss_count += 1
+
+        value = decode()
+
+        if self.capacity > 0:
+            with self._lock:
+                self._entries[key] = value
+
+                if len(self._entries) > self.capacity:
+                    self._entries.popitem(last=False)
+
+        return value
+
+    ## Returns the number of replies cached.
+    #
+    # @return The number of replies cached.
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    ## Removes every reply from the cache.
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    ## Returns the cache statistics.
+    #
+    # @return A dictionary of the number of hits, misses and replies cached, and the fraction of lookups
+    # which were hits.
+    def get_stats(self) -> dict:
+        lookups = self.hit_count + self.miss_count
+
+        return {
+            "hits": self.hit_count,
+            "misses": self.miss_count,
+            "size": len(self._entries),
+            "hit_rate": self.hit_count / lookups if lookups else 0.0
+        }
+
+
+## Returns the process-wide decode cache.
+#
+# The cache is created on first use. Every subsequent call returns the same cache.
+#
+# @return The process-wide decode cache.
+def get_decode_cache() -> DecodeCache:
+    global decode_cache
+
+    if decode_cache is None:
+        decode_cache = DecodeCache()
+
+    return decode_cache
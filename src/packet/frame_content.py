@@ -0,0 +1,112 @@
+## @file frame_content.py
+# @brief Contains FrameContent, a view of the contents of a received frame, read straight from the frame's
+# bytes.
+# @author Guy Chamberlain-Webber
+
+from src.packet.byte_container import IByteContainer
+
+
+## Returns a property which reads a single byte of a frame.
+#
+# @param index The index of the byte in the frame.
+# @return The property.
+def frame_property(index: int) -> property:
+    return property(lambda self: self._data[index])
+
+
+## A view of the contents of a received frame, with a fixed field schema per class.
+#
+# Each subclass gives its SCHEMA, a tuple of (parameter name, index in the frame) pairs. A name to index
+# mapping is built once per class, along with a read-only property for each parameter, so 'reply.pdevice_type'
+# reads the byte straight from the frame.
+#
+# The frame given, whether bytes, a memoryview or a list, is kept rather than copied, and nothing is decoded
+# until it is asked for. A dictionary of the parameters is only built by get_parameters(). The frame is
+# copied the first time a parameter is set.
+class FrameContent(IByteContainer):
+    __slots__ = ("_data",)
+
+    SCHEMA = ()
+
+    # Slices of the frame holding the values which change while a point is in use, such as its states and
+    # analogue values.
+    DYNAMIC_RANGES = ()
+
+    # The index of each parameter in the frame, built from SCHEMA.
+    _index = dict()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._index = dict(cls.SCHEMA)
+
+        for name, index in cls.SCHEMA:
+            if not hasattr(cls, name):
+                setattr(cls, name, frame_property(index))
+
+    def __init__(self, data):
+        self._data = data
+
+    ## Checks whether 'key' exists in the content parameters.
+    #
+    # @return True if 'key' exists, False if it doesn't.
+    def check_exists(self, key: str) -> bool:
+        return key in self._index
+
+    ## Returns the frame the content was read from.
+    #
+    # @return The bytes of the frame.
+    def get_frame(self) -> bytes:
+        return bytes(self._data)
+
+    ## Gets an object as an array of bytes.
+    #
+    # @return The value of each parameter, in the order of the schema.
+    def get_byte_array(self) -> list:
+        data = self._data
+        return [data[index] for _, index in self.SCHEMA]
+
+    ## Returns the bytes of the frame which change while a point is in use.
+    #
+    # @return A tuple of the bytes in each of the DYNAMIC_RANGES.
+    def get_dynamic_bytes(self) -> tuple:
+        data = self._data
+        return tuple(bytes(data[dynamic_range]) for dynamic_range in self.DYNAMIC_RANGES)
+
+    ## Sets the parameter contained at 'key' to 'value'.
+    def set_parameter(self, key: str, value):
+        if key not in self._index:
+            raise AttributeError(f"'{key}' can not be found in content parameters.")
+
+        if type(self._data) != bytearray:
+            self._data = bytearray(self._data)
+
+        self._data[self._index[key]] = value
+
+    ## Gets the parameter contained at 'key'.
+    #
+    # @return The parameter contained at the specified key.
+    def get_parameter(self, key: str):
+        index = self._index.get(key)
+
+        if index is None:
+            raise AttributeError(f"'{key}' can not be found in content parameters.")
+
+        return self._data[index]
+
+    ## Gets all the content parameters
+    #
+    # @return The parameters of the content object, as a new dictionary.
+    def get_parameters(self) -> dict:
+        data = self._data
+        return {name: data[index] for name, index in self.SCHEMA}
+
+    ## Returns the content object as a string.
+    #
+    # @return The string representation of the content object.
+    def __str__(self) -> str:
+        string = "Packet contents:\n"
+
+        for name, value in self.get_parameters().items():
+            string += "{}: {}\n".format(name, value)
+
+        return string
@@ -0,0 +1,68 @@
+## @file frame_encoder.py
+# @brief Contains the FrameEncoder, which packs a packet's parameters straight into the bytes of a frame.
+# @author Guy Chamberlain-Webber
+
+import struct
+
+import src.constants as constants
+
+# The encoder compiled for each field layout, so each layout is only compiled once.
+encoders = dict()
+
+
+## Packs a frame with a fixed field layout: SOH, SEQ, each parameter, then the checksum.
+#
+# The layout is compiled once into a struct.Struct, so encoding a frame is a single call to pack() after
+# summing the checksum.
+class FrameEncoder:
+    ## @param layout A tuple with an entry for each parameter, in order: None for a single byte, or the
+    # length of a string in bytes.
+    def __init__(self, layout: tuple):
+        self.layout = layout
+        self._has_strings = any(length is not None for length in layout)
+
+        fields = "".join("B" if length is None else f"{length}s" for length in layout)
+        self._struct = struct.Struct(f"<BB{fields}B")
+
+    ## Returns the number of bytes in each frame.
+    #
+    # @return The frame size.
+    def get_size(self) -> int:
+        return self._struct.size
+
+    ## Packs a frame.
+    #
+    # @param seq The sequence number to stamp the frame with.
+    # @param values The value of each parameter, in the order of the layout.
+    # @return The bytes of the frame.
+    def encode(self, seq: int, values) -> bytes:
+        if self._has_strings:
+            values = [value.encode("utf-8") if type(value) == str else value for value in values]
+            checksum = seq + sum(sum(value) if type(value) == bytes else value for value in values)
+        else:
+            checksum = seq + sum(values)
+
+        # Modulus operation to ensure checksum can be contained within one byte.
+        return self._struct.pack(constants.SOH, seq, *values, checksum % 256)
+
+
+## Returns the layout of a set of parameters.
+#
+# @param values The value of each parameter, in order.
+# @return A tuple with an entry for each parameter: None for a single byte, or the length of a string in bytes.
+def get_layout(values) -> tuple:
+    return tuple(len(value.encode("utf-8")) if type(value) == str else None for value in values)
+
+
+## Returns the encoder for a set of parameters, compiling it if its layout has not been seen before.
+#
+# @param values The value of each parameter, in order.
+# @return The encoder.
+def get_encoder(values) -> FrameEncoder:
+    layout = get_layout(values)
+    encoder = encoders.get(layout)
+
+    if encoder is None:
+        encoder = encoders[layout] = FrameEncoder(layout)
+
+    return encoder
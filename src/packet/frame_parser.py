@@ -0,0 +1,113 @@
+## @file frame_parser.py
+# @brief Contains the FrameParser, which splits a stream of bytes received from the panel into frames.
+# @author Guy Chamberlain-Webber
+
+import src.constants as constants
+
+# The index of the packet length byte within a frame.
+PACKET_LENGTH_INDEX = 2
+
+# The number of bytes in a frame which are not counted by its packet length (SOH, SEQ and checksum).
+FRAME_OVERHEAD = 3
+
+
+## Returns whether a frame's checksum is valid.
+#
+# The checksum is the sum of every byte after the SOH, excluding the checksum itself, modulo 256.
+#
+# @param frame The frame to check.
+# @return True if the checksum is valid, False if not.
+def checksum_valid(frame) -> bool:
+    return sum(frame[1:-1]) % 256 == frame[-1]
+
+
+## An incremental frame parser.
+#
+# Chunks of any size may be fed into the parser as they are read from the port. The parser keeps any
+# incomplete frame in a reusable buffer, resynchronises on SOH, uses the packet length byte of the header
+# to find where each frame ends and only returns frames with a valid checksum.
+class FrameParser:
+    def __init__(self):
+        self._buffer = bytearray()
+
+        self.frame_count = 0
+        self.ack_count = 0
+        self.discarded_count = 0
+        self.checksum_error_count = 0
+
+    ## Feeds a chunk of received bytes into the parser.
+    #
+    # @param chunk The bytes received.
+    # @return A list of the complete, valid frames found, in the order they were received.
+    def feed(self, chunk) -> list:
+        buffer = self._buffer
+        buffer += chunk
+
+        frames = []
+
+        while buffer:
+            start = buffer.find(constants.SOH)
+
+            if start != 0:
+                # Skip anything before the next SOH, such as ACKs or line noise.
+                skipped = len(buffer) if start < 0 else start
+                self._skip(skipped)
+
+                if start < 0:
+                    break
+
+            if len(buffer) <= PACKET_LENGTH_INDEX:
+                break
+
+            size = buffer[PACKET_LENGTH_INDEX] + FRAME_OVERHEAD
+            if len(buffer) < size:
+                break
+
+            frame = bytes(buffer[:size])
+
+            if checksum_valid(frame):
+                frames.append(frame)
+                self.frame_count += 1
+                del buffer[:size]
+            else:
+                # The SOH was not the start of a frame, resynchronise on the next one.
+                self.checksum_error_count += 1
+                self._skip(1)
+
+        return frames
+
+    ## Gives up on the incomplete frame at the start of the buffer and resynchronises on the next SOH.
+    #
+    # This is used when no more bytes arrive to complete a frame, for example if its packet length byte
+    # was corrupted.
+    #
+    # @return A list of the complete, valid frames found after resynchronising.
+    def resync(self) -> list:
+        if not self._buffer:
+            return []
+
+        self._skip(1)
+
+        return self.feed(b"")
+
+    ## Returns the number of bytes of an incomplete frame currently buffered.
+    #
+    # @return The number of buffered bytes.
+    def buffered(self) -> int:
+        return len(self._buffer)
+
+    ## Discards any buffered bytes.
+    def reset(self):
+        self._buffer.clear()
+
+    ## Skips bytes from the start of the buffer, counting any ACKs among them.
+    #
+    # @param count The number of bytes to skip.
+    def _skip(self, count: int):
+        skipped = self._buffer[:count]
+        acks = skipped.count(constants.ACK)
+
+        self.ack_count += acks
+        self.discarded_count += count - acks
+
+        del self._buffer[:count]
@@ -7,6 +7,8 @@ import abc
 
 ## An interface used containing specific logging functions.
 class ILoggable(abc.ABC):
+    __slots__ = ()
+
     ## Returns an object as a series of comma-separated values (CSV).
     #
     # @return The object as a series of comma-separated values (CSV).
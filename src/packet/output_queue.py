@@ -0,0 +1,76 @@
+## @file output_queue.py
+# @brief Contains the OutputQueue, which coalesces frames and ACKs waiting to be sent into a single write.
+# @author Guy Chamberlain-Webber
+
+import src.config as config
+from src.exceptions.invalid_value import InvalidValueException
+
+
+## A queue of frames and ACKs waiting to be written to a link.
+#
+# Everything queued is joined into a single bytes object when the queue is taken, so it can be passed to
+# the operating system in one write. The queue holds at most 'limit' frames, after which it must be
+# taken before anything more is queued. The number of writes, frames and bytes are recorded, to show how
+# well writes are being coalesced.
+class OutputQueue:
+    def __init__(self, limit: int = None):
+        if limit is None:
+            limit = config.get_output_queue_limit()
+
+        if limit < 1:
+            raise InvalidValueException(f"Invalid limit value '{limit}': Limit must be at least 1.")
+
+        self.limit = limit
+
+        self._frames = []
+        self.write_count = 0
+        self.frame_count = 0
+        self.byte_count = 0
+
+    ## Adds a frame to the queue.
+    #
+    # @param frame The bytes of the frame.
+    # @return True if the queue is now full, and must be taken before anything more is queued, False if not.
+    def add(self, frame: bytes) -> bool:
+        self._frames.append(frame)
+
+        return len(self._frames) >= self.limit
+
+    ## Removes everything from the queue, joined together.
+    #
+    # @return The bytes of every frame queued, in order, or an empty bytes object if nothing was queued.
+    def take(self) -> bytes:
+        if not self._frames:
+            return b""
+
+        data = b"".join(self._frames)
+
+        self.write_count += 1
+        self.frame_count += len(self._frames)
+        self.byte_count += len(data)
+        self._frames.clear()
+
+        return data
+
+    ## Returns the frames queued, without removing them.
+    #
+    # @return The frames queued, in order.
+    def peek(self) -> list:
+        return self._frames
+
+    ## Returns whether anything is queued.
+    #
+    # @return True if nothing is queued, False if not.
+    def is_empty(self) -> bool:
+        return not self._frames
+
+    ## Returns the coalescing statistics.
+    #
+    # @return A dictionary of the number of writes, frames and bytes, and the mean number of frames per write.
+    def get_stats(self) -> dict:
+        return {
+            "writes": self.write_count,
+            "frames": self.frame_count,
+            "bytes": self.byte_count,
+            "frames_per_write": self.frame_count / self.write_count if self.write_count else 0.0
+        }
@@ -2,24 +2,35 @@
 # @brief Contains definition for the Packet class.
 # @author Guy Chamberlain-Webber
 
+import asyncio
+import threading
+import time
+
 import src.constants as constants
 
 from src.packet.content import Content
+from src.packet.frame_encoder import FrameEncoder, get_encoder
 from src.packet.headers import BaseHeader
 from src.packet.readable import IReadable
-from src.packet.serial_data_transfer import SerialDataTransfer
+from src.packet.retry_policy import RetryPolicy
+from src.packet.serial_data_transfer import SerialDataTransfer, get_session
 from src.packet.writable import IWritable
 
 
+# Held while the sequence number is read and incremented, as several panels may be polled at once.
+seq_lock = threading.RLock()
+
+
 ## Increments the sequence number.
 #
 # Once the sequence number becomes greater than the
 # max sequence number (15), it will wrap back round to zero.
 def increment_seq():
-    Packet.seq += 1
+    with seq_lock:
+        Packet.seq += 1
 
-    if Packet.seq > constants.SEQ_WRAP:
-        Packet.seq = 0x01
+        if Packet.seq > constants.SEQ_WRAP:
+            Packet.seq = 0x01
 
 
 ## Provides an abstraction of a data packet, which will be able to be transmitted to, and received
@@ -27,17 +38,18 @@ def increment_seq():
 class Packet(Content, IWritable, IReadable):
     seq = 0x01  # Sequence number
 
-    def __init__(self, header: BaseHeader, **kwargs):
+    def __init__(self, header: BaseHeader, link: SerialDataTransfer = None, **kwargs):
         super().__init__(**kwargs)
+        self._encoder = None
+
         if not isinstance(header, BaseHeader):
             raise AttributeError(f"'{type(header)}' is not of expected type, BaseHeader.")
 
         self._header = header
+        self._link = link
 
         # Combine parameters of header and kwargs together
-        _params_copy = self._params
-        self._params = header.get_parameters()
-        self._params.update(_params_copy)
+        self._params = {**header.get_parameters(), **self._params}
 
         # Update packet length
         self.set_parameter("packet_length", len(self._params))
@@ -47,58 +59,132 @@ class Packet(Content, IWritable, IReadable):
     # The packet will provide SOH and SEQ numbers to the byte array, as well
     # as a checksum at the end based on all previous bytes.
     #
+    # @param seq The sequence number to stamp the packet with. The current sequence number is used if not given.
     # @return The containing object as an array of bytes.
-    def get_byte_array(self) -> list:
-        default_array = super().get_byte_array()
+    def get_byte_array(self, seq: int = None) -> list:
+        return list(self.encode(seq))
 
-        default_array.insert(0, Packet.seq)
+    ## Encodes the packet as the bytes of a frame, ready to be written.
+    #
+    # The packet's field layout is compiled into an encoder the first time it is encoded, and again only
+    # if a parameter is changed.
+    #
+    # @param seq The sequence number to stamp the packet with. The current sequence number is used if not given.
+    # @return The bytes of the frame.
+    def encode(self, seq: int = None) -> bytes:
+        if seq is None:
+            seq = Packet.seq
 
-        checksum = 0
-        for byte in default_array:
-            checksum += byte
+        return self.get_encoder().encode(seq, self._params.values())
 
-        # Modulus operation to ensure checksum can be contained within one byte.
-        checksum %= 256
+    ## Returns the encoder compiled for the packet's field layout.
+    #
+    # @return The encoder.
+    def get_encoder(self) -> FrameEncoder:
+        if self._encoder is None:
+            self._encoder = get_encoder(self._params.values())
 
-        default_array.insert(0, constants.SOH)
-        default_array.append(checksum)
+        return self._encoder
 
-        return default_array
+    ## Sets the parameter contained at 'key' to 'value'.
+    def set_parameter(self, key: str, value):
+        super().set_parameter(key, value)
 
-    ## Writes to a serial communications port.
-    def write(self):
-        serial = SerialDataTransfer()
+        # A string of a different length changes the field layout.
+        self._encoder = None
 
-        data = self.get_byte_array()
-        serial.write(data)
+    ## Returns the link session used by this packet.
+    #
+    # If no link was injected when the packet was created, the process-wide session is used.
+    #
+    # @return The link session used by this packet.
+    def get_link(self) -> SerialDataTransfer:
+        if self._link is None:
+            return get_session()
 
-        increment_seq()
+        return self._link
 
-        serial.__del__()
+    ## Writes to a serial communications port.
+    def write(self):
+        with seq_lock:
+            data = self.encode()
+            increment_seq()
+
+        self.get_link().write(data)
 
     ## Reads from a serial communication port.
     #
-    # The data read (if any) from the communication port.
-    def read(self, size: int) -> list:
-        serial = SerialDataTransfer()
-        has_data = False
-        read_data = bytes
-
-        while not has_data:
-            read_data = serial.read(size)
-
-            if read_data is None:
-                # No data could be read so try another packet.
-                serial.__del__()
-                self.write()
-                serial = SerialDataTransfer()
-            elif len(read_data) > 1:
-                # Data has been found.
-                has_data = True
+    # If no reply arrives in time, the packet is sent again as allowed by the retry policy.
+    #
+    # @param retry_policy The retry policy to follow. The configured policy is used if not given.
+    # @return The data read from the communication port, or None if no reply was received.
+    def read(self, retry_policy: RetryPolicy = None) -> list:
+        if retry_policy is None:
+            retry_policy = RetryPolicy()
+
+        link = self.get_link()
+        result = link.read_frame()
+        attempts = 1
+
+        while result.is_timeout():
+            if not retry_policy.should_retry(attempts):
+                print(f"No response from sent packet after {attempts} attempts, giving up.")
+                return None
+
+            # No data could be read so try another packet.
+            print("No response from sent packet, resending...")
+            time.sleep(retry_policy.get_delay(attempts))
+            self.write()
+            attempts += 1
+            result = link.read_frame()
 
         # If data has been read, we should send back an acknowledgement (ACK) byte,
-        # so we will longer receive data.
-        if read_data:
-            serial.write_byte(constants.ACK)
+        # so we will longer receive data. It is sent along with the next packet written.
+        link.queue_byte(constants.ACK)
+
+        return list(result.frame)
+
+    ## Writes to a serial communications port from an asyncio event loop.
+    #
+    # The packet must have been created with an asynchronous link.
+    async def write_async(self):
+        link = self.get_link()
 
-        return list(read_data)
+        with seq_lock:
+            data = self.encode()
+            increment_seq()
+
+        link.write(data)
+
+        await link.drain()
+
+    ## Reads from a serial communications port from an asyncio event loop.
+    #
+    # The packet must have been created with an asynchronous link. If no reply arrives in time, the packet
+    # is sent again as allowed by the retry policy.
+    #
+    # @param retry_policy The retry policy to follow. The configured policy is used if not given.
+    # @return The data read from the communication port, or None if no reply was received.
+    async def read_async(self, retry_policy: RetryPolicy = None) -> list:
+        if retry_policy is None:
+            retry_policy = RetryPolicy()
+
+        link = self.get_link()
+        result = await link.read_frame()
+        attempts = 1
+
+        while result.is_timeout():
+            if not retry_policy.should_retry(attempts):
+                print(f"No response from sent packet after {attempts} attempts, giving up.")
+                return None
+
+            # No data could be read so try another packet.
+            print("No response from sent packet, resending...")
+            await asyncio.sleep(retry_policy.get_delay(attempts))
+            await self.write_async()
+            attempts += 1
+            result = await link.read_frame()
+
+        link.queue_byte(constants.ACK)
+
+        return list(result.frame)
@@ -140,133 +140,108 @@ output_forced_state = {
 }
 
 
-## Decodes an MX6 Point Information Request packet.
-def decode_pirmx5(data: dict):
-    new_data = dict()
-
-    # Reply status
-    new_data[constants.PNAME_REPLY_STATUS] = reply_status[data[constants.PNAME_REPLY_STATUS]]
-
-    # Flags
-    new_data[constants.PNAME_FLAGS] = flags[data[constants.PNAME_FLAGS]]
-
-    # Node
-    new_data[constants.PNAME_NODE] = data[constants.PNAME_NODE]
-
-    # Channel
-    new_data[constants.PNAME_CHANNEL] = channel[data[constants.PNAME_CHANNEL]]
-
-    # Channel address
-    try:
-        new_data[constants.PNAME_CHANNEL_ADDRESS] = channel_address[data[constants.PNAME_CHANNEL_ADDRESS]]
-    except KeyError:
-        new_data[constants.PNAME_CHANNEL_ADDRESS] = data[constants.PNAME_CHANNEL_ADDRESS]
-
-    # Point category
-    new_data[constants.PNAME_POINT_CATEGORY] = point_category[data[constants.PNAME_POINT_CATEGORY]]
-
-    # Point number (physical)
-    try:
-        new_data[constants.PNAME_POINT_NUMBER] = channel_address[data[constants.PNAME_POINT_NUMBER]]
-    except KeyError:
-        new_data[constants.PNAME_POINT_NUMBER] = data[constants.PNAME_POINT_NUMBER]
-
-    # Logical point number
-    new_data[constants.PNAME_LOGICAL_POINT_NUMBER] = data[constants.PNAME_LOGICAL_POINT_NUMBER]
-
-    # Logical point zone
-    try:
-        new_data[constants.PNAME_LOGICAL_POINT_ZONE] = logical_point_zone[data[constants.PNAME_LOGICAL_POINT_ZONE]]
-    except KeyError:
-        new_data[constants.PNAME_LOGICAL_POINT_ZONE] = data[constants.PNAME_LOGICAL_POINT_ZONE]
-
-    # Device type
-    new_data[constants.PNAME_DEVICE_TYPE] = devices_codes[data[constants.PNAME_DEVICE_TYPE]]
-
-    # Auxiliary point attributes
-    new_data[constants.PNAME_AUXILIARY_POINT_ATTRIBUTES] = data[constants.PNAME_AUXILIARY_POINT_ATTRIBUTES]
-
-    # Group
-    group1 = data[constants.PNAME_GROUP1]
-    group2 = data[constants.PNAME_GROUP2]
-    group = (group1 << 8) + group2
-
-    new_data[constants.PNAME_GROUP] = group
-
-    # Area type
-    new_data[constants.PNAME_AREA_TYPE] = data[constants.PNAME_AREA_TYPE]
-
-    # Area number
-    new_data[constants.PNAME_AREA_NUMBER] = data[constants.PNAME_AREA_NUMBER]
-
-    # Sector ID
-    try:
-        new_data[constants.PNAME_SECTOR_ID] = sector_id[data[constants.PNAME_SECTOR_ID]]
-    except KeyError:
-        new_data[constants.PNAME_SECTOR_ID] = data[constants.PNAME_SECTOR_ID]
-
-    # Loop type
-    new_data[constants.PNAME_LOOP_TYPE] = loop_type[data[constants.PNAME_LOOP_TYPE]]
-
-    # Raw identity
-    new_data[constants.PNAME_RAW_IDENTITY] = loop_type[data[constants.PNAME_RAW_IDENTITY]]
-
-    # Actual device type
-    new_data[constants.PNAME_ACTUAL_DEVICE_TYPE] = data[constants.PNAME_ACTUAL_DEVICE_TYPE]
-
-    # Mode & sensitivity
-    new_data[constants.PNAME_MODE_AND_SENSITIVITY] = data[constants.PNAME_MODE_AND_SENSITIVITY]
-
-    # Raw analogue values
-    new_data[constants.PNAME_RAW_ANALOGUE_VALUES1] = data[constants.PNAME_RAW_ANALOGUE_VALUES1]
-    new_data[constants.PNAME_RAW_ANALOGUE_VALUES2] = data[constants.PNAME_RAW_ANALOGUE_VALUES2]
-    new_data[constants.PNAME_RAW_ANALOGUE_VALUES3] = data[constants.PNAME_RAW_ANALOGUE_VALUES3]
-
-    # LTA flags
-    try:
-        new_data[constants.PNAME_LTA_FLAGS] = lta_flags[data[constants.PNAME_LTA_FLAGS]]
-    except KeyError:
-        new_data[constants.PNAME_LTA_FLAGS] = data[constants.PNAME_LTA_FLAGS]
-
-    # Raw LTA
-    new_data[constants.PNAME_RAW_IDENTITY] = data[constants.PNAME_RAW_LTA]
-
-    # Dirtiness
-    new_data[constants.PNAME_DIRTINESS] = data[constants.PNAME_DIRTINESS]
-
-    # Units of measurement
-    new_data[constants.PNAME_UNITS_OF_MEASURE1] = unit_of_measurement[data[constants.PNAME_UNITS_OF_MEASURE1]]
-    new_data[constants.PNAME_UNITS_OF_MEASURE2] = unit_of_measurement[data[constants.PNAME_UNITS_OF_MEASURE2]]
-    new_data[constants.PNAME_UNITS_OF_MEASURE3] = unit_of_measurement[data[constants.PNAME_UNITS_OF_MEASURE3]]
-
-    # Converted values
-    new_data[constants.PNAME_CONVERTED_VALUES1] = data[constants.PNAME_CONVERTED_VALUES1]
-    new_data[constants.PNAME_CONVERTED_VALUES2] = data[constants.PNAME_CONVERTED_VALUES2]
-    new_data[constants.PNAME_CONVERTED_VALUES3] = data[constants.PNAME_CONVERTED_VALUES3]
-
-    # Instantaneous states
-    new_data[constants.PNAME_INSTANTANEOUS_ACTIVE_STATE] = instantaneous_active_state[
-        data[constants.PNAME_INSTANTANEOUS_ACTIVE_STATE]]
-    new_data[constants.PNAME_INSTANTANEOUS_FAULT_STATE] = data[constants.PNAME_INSTANTANEOUS_FAULT_STATE]
-
-    # Confirmed states
-    try:
-        new_data[constants.PNAME_CONFIRMED_ACTIVE_STATE] = confirmed_active_state[
-            data[constants.PNAME_CONFIRMED_ACTIVE_STATE]]
-    except KeyError:
-        new_data[constants.PNAME_CONFIRMED_ACTIVE_STATE] = data[constants.PNAME_CONFIRMED_ACTIVE_STATE]
-        
-    new_data[constants.PNAME_CONFIRMED_FAULT_STATE] = data[constants.PNAME_INSTANTANEOUS_FAULT_STATE]
-
-    # Acknowledged states
-    new_data[constants.PNAME_ACKNOWLEDGED_ACTIVE_STATE] = data[constants.PNAME_ACKNOWLEDGED_ACTIVE_STATE]
-    new_data[constants.PNAME_ACKNOWLEDGED_FAULT_STATE] = data[constants.PNAME_ACKNOWLEDGED_FAULT_STATE]
-
-    # Output forced mode
-    new_data[constants.PNAME_OUTPUT_FORCED_MODE] = output_forced_mode[data[constants.PNAME_OUTPUT_FORCED_MODE]]
-
-    # Output states
-    new_data[constants.PNAME_OUTPUT_UNFORCED_STATE] = output_unforced_state[data[constants.PNAME_OUTPUT_UNFORCED_STATE]]
-    new_data[constants.PNAME_OUTPUT_FORCED_STATE] = output_forced_state[data[constants.PNAME_OUTPUT_FORCED_STATE]]
-
-    return new_data
+## Compiles a dictionary into a table with an entry for every possible byte value.
+#
+# Values the dictionary does not give are left as they are.
+#
+# @param mapping The meaning of each known value.
+# @return A tuple of 256 entries.
+def compile_table(mapping: dict) -> tuple:
+    return tuple(mapping.get(value, value) for value in range(256))
+
+
+## Compiles a dictionary of bit flags into a table with an entry for every possible byte value.
+#
+# Values the dictionary gives are used as they are. Any other value is expanded into the meaning of each
+# bit it has set, joined by " | ". A bit the dictionary does not give is shown as its value.
+#
+# @param mapping The meaning of each known value and bit.
+# @return A tuple of 256 entries.
+def compile_flags_table(mapping: dict) -> tuple:
+    table = []
+
+    for value in range(256):
+        if value in mapping:
+            table.append(mapping[value])
+            continue
+
+        bits = [1 << bit for bit in range(8) if value & (1 << bit)]
+        table.append(" | ".join(str(mapping.get(bit, bit)) for bit in bits))
+
+    return tuple(table)
+
+
+# Tables compiled from the dictionaries above, indexed by the received byte.
+reply_status_table = compile_table(reply_status)
+flags_table = compile_flags_table(flags)
+channel_table = compile_table(channel)
+channel_address_table = compile_table(channel_address)
+point_category_table = compile_table(point_category)
+logical_point_zone_table = compile_table(logical_point_zone)
+device_type_table = compile_table(devices_codes)
+auxiliary_point_attributes_table = compile_flags_table(auxiliary_point_attributes)
+sector_id_table = compile_table(sector_id)
+loop_type_table = compile_table(loop_type)
+lta_flags_table = compile_table(lta_flags)
+unit_of_measurement_table = compile_table(unit_of_measurement)
+instantaneous_active_state_table = compile_table(instantaneous_active_state)
+confirmed_active_state_table = compile_table(confirmed_active_state)
+output_forced_mode_table = compile_table(output_forced_mode)
+output_unforced_state_table = compile_table(output_unforced_state)
+output_forced_state_table = compile_table(output_forced_state)
+
+
+## Decodes an MX5 Point Information Reply packet.
+#
+# Each decoded field is looked up in its table by the byte received, so a value missing from a table is shown
+# as it is rather than failing.
+#
+# @param data The parameters of the reply.
+# @return The decoded fields, in order.
+def decode_pirmx5(data: dict) -> dict:
+    return {
+        constants.PNAME_REPLY_STATUS: reply_status_table[data[constants.PNAME_REPLY_STATUS]],
+        constants.PNAME_FLAGS: flags_table[data[constants.PNAME_FLAGS]],
+        constants.PNAME_NODE: data[constants.PNAME_NODE],
+        constants.PNAME_CHANNEL: channel_table[data[constants.PNAME_CHANNEL]],
+        constants.PNAME_CHANNEL_ADDRESS: channel_address_table[data[constants.PNAME_CHANNEL_ADDRESS]],
+        constants.PNAME_POINT_CATEGORY: point_category_table[data[constants.PNAME_POINT_CATEGORY]],
+        constants.PNAME_POINT_NUMBER: channel_address_table[data[constants.PNAME_POINT_NUMBER]],
+        constants.PNAME_LOGICAL_POINT_NUMBER: data[constants.PNAME_LOGICAL_POINT_NUMBER],
+        constants.PNAME_LOGICAL_POINT_ZONE: logical_point_zone_table[data[constants.PNAME_LOGICAL_POINT_ZONE]],
+        constants.PNAME_DEVICE_TYPE: device_type_table[data[constants.PNAME_DEVICE_TYPE]],
+        constants.PNAME_AUXILIARY_POINT_ATTRIBUTES:
+            auxiliary_point_attributes_table[data[constants.PNAME_AUXILIARY_POINT_ATTRIBUTES]],
+        constants.PNAME_GROUP: (data[constants.PNAME_GROUP1] << 8) + data[constants.PNAME_GROUP2],
+        constants.PNAME_AREA_TYPE: data[constants.PNAME_AREA_TYPE],
+        constants.PNAME_AREA_NUMBER: data[constants.PNAME_AREA_NUMBER],
+        constants.PNAME_SECTOR_ID: sector_id_table[data[constants.PNAME_SECTOR_ID]],
+        constants.PNAME_LOOP_TYPE: loop_type_table[data[constants.PNAME_LOOP_TYPE]],
+        # The raw identity column has always held the raw LTA.
+        constants.PNAME_RAW_IDENTITY: data[constants.PNAME_RAW_LTA],
+        constants.PNAME_ACTUAL_DEVICE_TYPE: data[constants.PNAME_ACTUAL_DEVICE_TYPE],
+        constants.PNAME_MODE_AND_SENSITIVITY: data[constants.PNAME_MODE_AND_SENSITIVITY],
+        constants.PNAME_RAW_ANALOGUE_VALUES1: data[constants.PNAME_RAW_ANALOGUE_VALUES1],
+        constants.PNAME_RAW_ANALOGUE_VALUES2: data[constants.PNAME_RAW_ANALOGUE_VALUES2],
+        constants.PNAME_RAW_ANALOGUE_VALUES3: data[constants.PNAME_RAW_ANALOGUE_VALUES3],
+        constants.PNAME_LTA_FLAGS: lta_flags_table[data[constants.PNAME_LTA_FLAGS]],
+        constants.PNAME_DIRTINESS: data[constants.PNAME_DIRTINESS],
+        constants.PNAME_UNITS_OF_MEASURE1: unit_of_measurement_table[data[constants.PNAME_UNITS_OF_MEASURE1]],
+        constants.PNAME_UNITS_OF_MEASURE2: unit_of_measurement_table[data[constants.PNAME_UNITS_OF_MEASURE2]],
+        constants.PNAME_UNITS_OF_MEASURE3: unit_of_measurement_table[data[constants.PNAME_UNITS_OF_MEASURE3]],
+        constants.PNAME_CONVERTED_VALUES1: data[constants.PNAME_CONVERTED_VALUES1],
+        constants.PNAME_CONVERTED_VALUES2: data[constants.PNAME_CONVERTED_VALUES2],
+        constants.PNAME_CONVERTED_VALUES3: data[constants.PNAME_CONVERTED_VALUES3],
+        constants.PNAME_INSTANTANEOUS_ACTIVE_STATE:
+            instantaneous_active_state_table[data[constants.PNAME_INSTANTANEOUS_ACTIVE_STATE]],
+        constants.PNAME_INSTANTANEOUS_FAULT_STATE: data[constants.PNAME_INSTANTANEOUS_FAULT_STATE],
+        constants.PNAME_CONFIRMED_ACTIVE_STATE:
+            confirmed_active_state_table[data[constants.PNAME_CONFIRMED_ACTIVE_STATE]],
+        # The confirmed fault state column has always held the instantaneous fault state.
+        constants.PNAME_CONFIRMED_FAULT_STATE: data[constants.PNAME_INSTANTANEOUS_FAULT_STATE],
+        constants.PNAME_ACKNOWLEDGED_ACTIVE_STATE: data[constants.PNAME_ACKNOWLEDGED_ACTIVE_STATE],
+        constants.PNAME_ACKNOWLEDGED_FAULT_STATE: data[constants.PNAME_ACKNOWLEDGED_FAULT_STATE],
+        constants.PNAME_OUTPUT_FORCED_MODE: output_forced_mode_table[data[constants.PNAME_OUTPUT_FORCED_MODE]],
+        constants.PNAME_OUTPUT_UNFORCED_STATE: output_unforced_state_table[data[constants.PNAME_OUTPUT_UNFORCED_STATE]],
+        constants.PNAME_OUTPUT_FORCED_STATE: output_forced_state_table[data[constants.PNAME_OUTPUT_FORCED_STATE]]
+    }
@@ -3,21 +3,51 @@
 # @author Guy Chamberlain-Webber
 
 import src.constants as constants
-from src.packet.content import Content
+from src.packet.decode_cache import get_decode_cache
+from src.packet.frame_content import FrameContent
 from src.packet.headers import LocalHeaderMX5
 from src.packet.headers import LocalHeaderMX6
 from src.packet.loggable import ILoggable
 from src.packet.packet import Packet
 from src.packet.packet_decode import decode_pirmx5
 from src.packet.packet_ids import PacketID
+from src.packet.request_template import get_template
+from src.packet.serial_data_transfer import SerialDataTransfer
 from src.packet.writable import IWritable
 
 
 ## A class to be used as the base class for all writable packets.
+#
+# The underlying packet is only built when it is first used, so a request which is only ever encoded from a
+# template costs little more than its own attributes.
 class PacketImplementation(IWritable):
-    def __init__(self):
+    def __init__(self, link: SerialDataTransfer = None):
+        self.link = link
+        self._packet = None
+
+    ## Returns the underlying packet, building it the first time.
+    #
+    # @return The packet.
+    @property
+    def packet(self) -> Packet:
+        if self._packet is None:
+            self._packet = self.create_packet()
+
+        return self._packet
+
+    ## Builds the underlying packet.
+    #
+    # @return The packet.
+    def create_packet(self) -> Packet:
         header = LocalHeaderMX5(PacketID.INVALID)
-        self.packet = Packet(header)
+        return Packet(header, link=self.link)
+
+    ## Encodes the packet as the bytes of a frame, ready to be written.
+    #
+    # @param seq The sequence number to stamp the frame with.
+    # @return The bytes of the frame.
+    def encode(self, seq: int) -> bytes:
+        return self.packet.encode(seq)
 
     ## Writes to a serial communication port.
     def write(self):
@@ -26,132 +56,182 @@ class PacketImplementation(IWritable):
     # Reads data from a communications port by calling the underlying
     # packet read method.
     #
-    # @return The data read (if any).
-    def read(self) -> list:
-        # noinspection PyTypeChecker
-        # Due to it being the base class, when used by child classes, type will change.
-        return self.packet.read(response_sizes.get(type(self)))
+    # @return The reply read, or None if no reply was received.
+    def read(self):
+        data = self.packet.read()
+        print(f"Read data: {data}")
+
+        if data is None:
+            return None
+
+        return self.create_reply(data)
+
+    ## Writes to a serial communication port from an asyncio event loop.
+    async def write_async(self):
+        await self.packet.write_async()
+
+    ## Reads data from a communications port from an asyncio event loop, by calling the underlying
+    # packet read method.
+    #
+    # @return The reply read, or None if no reply was received.
+    async def read_async(self):
+        data = await self.packet.read_async()
+        print(f"Read data: {data}")
+
+        if data is None:
+            return None
+
+        return self.create_reply(data)
+
+    ## Creates the reply object for data received in response to this packet.
+    #
+    # @param data The reply data received.
+    # @return The reply object. By default, this is the reply data itself.
+    def create_reply(self, data: list):
+        return data
 
 
 ## A class representing a restart panel packet (MX5).
 class RestartPanelMX5(PacketImplementation):
-    def __init__(self):
-        super().__init__()
+    ## Builds the underlying packet.
+    #
+    # @return The packet.
+    def create_packet(self) -> Packet:
         header = LocalHeaderMX5(PacketID.RESTART_REQUEST)
-        self.packet = Packet(header)
+        return Packet(header, link=self.link)
 
 
 ## A class representing a restart panel packet (MX6).
 class RestartPanelMX6(PacketImplementation):
-    def __init__(self):
-        super().__init__()
+    ## Builds the underlying packet.
+    #
+    # @return The packet.
+    def create_packet(self) -> Packet:
         header = LocalHeaderMX5(PacketID.RESTART_REQUEST)
-        self.packet = Packet(header)
+        return Packet(header, link=self.link)
 
 
 ## A class representing a panel information request (MX5).
 class PanelDetailsRequestMX5(PacketImplementation):
-    def __init__(self):
-        super().__init__()
+    ## Builds the underlying packet.
+    #
+    # @return The packet.
+    def create_packet(self) -> Packet:
         header = LocalHeaderMX5(PacketID.PANEL_DETAILS_REQUEST)
-        self.packet = Packet(header)
+        return Packet(header, link=self.link)
 
 
 ## A class representing a panel information request (MX6).
 class PanelDetailsRequestMX6(PacketImplementation):
-    def __init__(self):
-        super().__init__()
+    ## Builds the underlying packet.
+    #
+    # @return The packet.
+    def create_packet(self) -> Packet:
         header = LocalHeaderMX6(PacketID.PANEL_DETAILS_REQUEST)
-        self.packet = Packet(header)
+        return Packet(header, link=self.link)
 
 
 ## A class representing a point information reply packet (MX5).
-class PointInformationReplyMX5(Content, ILoggable):
+class PointInformationReplyMX5(FrameContent, ILoggable):
+    __slots__ = ("point_number",)
+
+    SCHEMA = (
+        (constants.PNAME_SOH, constants.PIRMX5_SOH_INDEX),
+        (constants.PNAME_SEQ, constants.PIRMX5_SEQ_INDEX),
+        (constants.PNAME_PACKET_LENGTH, constants.PIRMX5_PACKET_LENGTH_INDEX),
+        (constants.PNAME_NETWORK_NODE, constants.PIRMX5_NETWORK_NODE_INDEX),
+        (constants.PNAME_CHANNEL, constants.PIRMX5_POINT_ADDRESS_CHANNEL_INDEX),
+        (constants.PNAME_DESTINATION_CHANNEL_ADDRESS, constants.PIRMX5_DESTINATION_CHANNEL_ADDRESS_INDEX),
+        (constants.PNAME_DESTINATION_TASK, constants.PIRMX5_DESTINATION_TASK_INDEX),
+        (constants.PNAME_SOURCE_CHANNEL_ADDRESS, constants.PIRMX5_SOURCE_CHANNEL_ADDRESS_INDEX),
+        (constants.PNAME_SOURCE_TASK, constants.PIRMX5_SOURCE_TASK_INDEX),
+        (constants.PNAME_MARKER, constants.PIRMX5_MARKER_INDEX),
+        (constants.PNAME_PACKET_ID, constants.PIRMX5_PACKET_ID_INDEX),
+        (constants.PNAME_REPLY_STATUS, constants.PIRMX5_REPLY_STATUS_INDEX),
+        (constants.PNAME_FLAGS, constants.PIRMX5_FLAGS_INDEX),
+        (constants.PNAME_NODE, constants.PIRMX5_NODE_INDEX),
+        (constants.PNAME_PCHANNEL, constants.PIRMX5_POINT_ADDRESS_CHANNEL_INDEX),
+        (constants.PNAME_CHANNEL_ADDRESS, constants.PIRMX5_CHANNEL_ADDRESS_INDEX),
+        (constants.PNAME_POINT_CATEGORY, constants.PIRMX5_POINT_CATEGORY_INDEX),
+        (constants.PNAME_POINT_NUMBER, constants.PIRMX5_POINT_NUMBER_INDEX),
+        (constants.PNAME_LOGICAL_POINT_NUMBER, constants.PIRMX5_LOGICAL_POINT_NUMBER_INDEX),
+        (constants.PNAME_LOGICAL_POINT_ZONE, constants.PIRMX5_LOGICAL_POINT_ZONE_INDEX),
+        (constants.PNAME_DEVICE_TYPE, constants.PIRMX5_DEVICE_TYPE_INDEX),
+        (constants.PNAME_AUXILIARY_POINT_ATTRIBUTES, constants.PIRMX5_AUXILIARY_POINT_ATTRIBUTES_INDEX),
+        (constants.PNAME_GROUP1, constants.PIRMX5_GROUP1_INDEX),
+        (constants.PNAME_GROUP2, constants.PIRMX5_GROUP2_INDEX),
+        (constants.PNAME_AREA_TYPE, constants.PIRMX5_AREA_TYPE_INDEX),
+        (constants.PNAME_AREA_NUMBER, constants.PIRMX5_AREA_NUMBER_INDEX),
+        (constants.PNAME_SECTOR_ID, constants.PIRMX5_SECTOR_ID_INDEX),
+        (constants.PNAME_LOOP_TYPE, constants.PIRMX5_LOOP_TYPE_INDEX),
+        (constants.PNAME_RAW_IDENTITY, constants.PIRMX5_RAW_IDENTITY_INDEX),
+        (constants.PNAME_ACTUAL_DEVICE_TYPE, constants.PIRMX5_ACTUAL_DEVICE_TYPE_INDEX),
+        (constants.PNAME_MODE_AND_SENSITIVITY, constants.PIRMX5_MODE_AND_SENSITIVITY_INDEX),
+        (constants.PNAME_RAW_ANALOGUE_VALUES1, constants.PIRMX5_RAW_ANALOGUE_VALUES1_INDEX),
+        (constants.PNAME_RAW_ANALOGUE_VALUES2, constants.PIRMX5_RAW_ANALOGUE_VALUES2_INDEX),
+        (constants.PNAME_RAW_ANALOGUE_VALUES3, constants.PIRMX5_RAW_ANALOGUE_VALUES3_INDEX),
+        (constants.PNAME_LTA_FLAGS, constants.PIRMX5_LTA_FLAGS_INDEX),
+        (constants.PNAME_RAW_LTA, constants.PIRMX5_RAW_LTA_INDEX),
+        (constants.PNAME_DIRTINESS, constants.PIRMX5_DIRTINESS_INDEX),
+        (constants.PNAME_UNITS_OF_MEASURE1, constants.PIRMX5_UNITS_OF_MEASURE1_INDEX),
+        (constants.PNAME_UNITS_OF_MEASURE2, constants.PIRMX5_UNITS_OF_MEASURE2_INDEX),
+        (constants.PNAME_UNITS_OF_MEASURE3, constants.PIRMX5_UNITS_OF_MEASURE3_INDEX),
+        (constants.PNAME_CONVERTED_VALUES1, constants.PIRMX5_CONVERTED_VALUE1_INDEX),
+        (constants.PNAME_CONVERTED_VALUES2, constants.PIRMX5_CONVERTED_VALUE2_INDEX),
+        (constants.PNAME_CONVERTED_VALUES3, constants.PIRMX5_CONVERTED_VALUE3_INDEX),
+        (constants.PNAME_INSTANTANEOUS_ACTIVE_STATE, constants.PIRMX5_INSTANTANEOUS_ACTIVE_STATE_INDEX),
+        (constants.PNAME_INSTANTANEOUS_FAULT_STATE, constants.PIRMX5_INSTANTANEOUS_FAULT_STATE_INDEX),
+        (constants.PNAME_CONFIRMED_ACTIVE_STATE, constants.PIRMX5_CONFIRMED_ACTIVE_STATE_INDEX),
+        (constants.PNAME_CONFIRMED_FAULT_STATE, constants.PIRMX5_CONFIRMED_FAULT_STATE_INDEX),
+        (constants.PNAME_ACKNOWLEDGED_ACTIVE_STATE, constants.PIRMX5_ACKNOWLEDGED_ACTIVE_STATE_INDEX),
+        (constants.PNAME_ACKNOWLEDGED_FAULT_STATE, constants.PIRMX5_ACKNOWLEDGED_FAULT_STATE_INDEX),
+        (constants.PNAME_OUTPUT_FORCED_MODE, constants.PIRMX5_OUTPUT_FORCED_MODE_INDEX),
+        (constants.PNAME_OUTPUT_UNFORCED_STATE, constants.PIRMX5_OUTPUT_UNFORCED_STATE_INDEX),
+        (constants.PNAME_OUTPUT_FORCED_STATE, constants.PIRMX5_OUTPUT_FORCED_STATE_INDEX),
+        (constants.PNAME_CLIENTID1, constants.PIRMX5_CLIENT_ID1_INDEX),
+        (constants.PNAME_CLIENTID2, constants.PIRMX5_CLIENT_ID2_INDEX)
+    )
+
+    # The reply status and flags, and everything from the mode and sensitivity to the output states.
+    DYNAMIC_RANGES = (
+        slice(constants.PIRMX5_REPLY_STATUS_INDEX, constants.PIRMX5_FLAGS_INDEX + 1),
+        slice(constants.PIRMX5_MODE_AND_SENSITIVITY_INDEX, constants.PIRMX5_OUTPUT_FORCED_STATE_INDEX + 1)
+    )
+
     def __init__(self, point_number: int, data: list, **kwargs):
+        super().__init__(data)
         self.point_number = point_number
-        self._data = data
-
-        params = {
-            constants.PNAME_SOH: self._data[constants.PIRMX5_SOH_INDEX],
-            constants.PNAME_SEQ: self._data[constants.PIRMX5_SEQ_INDEX],
-            constants.PNAME_PACKET_LENGTH: self._data[constants.PIRMX5_PACKET_LENGTH_INDEX],
-            constants.PNAME_NETWORK_NODE: self._data[constants.PIRMX5_NETWORK_NODE_INDEX],
-            constants.PNAME_CHANNEL: self._data[constants.PIRMX5_POINT_ADDRESS_CHANNEL_INDEX],
-            constants.PNAME_DESTINATION_CHANNEL_ADDRESS: self._data[constants.PIRMX5_DESTINATION_CHANNEL_ADDRESS_INDEX],
-            constants.PNAME_DESTINATION_TASK: self._data[constants.PIRMX5_DESTINATION_TASK_INDEX],
-            constants.PNAME_SOURCE_CHANNEL_ADDRESS: self._data[constants.PIRMX5_SOURCE_CHANNEL_ADDRESS_INDEX],
-            constants.PNAME_SOURCE_TASK: self._data[constants.PIRMX5_SOURCE_TASK_INDEX],
-            constants.PNAME_MARKER: self._data[constants.PIRMX5_MARKER_INDEX],
-            constants.PNAME_PACKET_ID: self._data[constants.PIRMX5_PACKET_ID_INDEX],
-            constants.PNAME_REPLY_STATUS: self._data[constants.PIRMX5_REPLY_STATUS_INDEX],
-            constants.PNAME_FLAGS: self._data[constants.PIRMX5_FLAGS_INDEX],
-            constants.PNAME_NODE: self._data[constants.PIRMX5_NODE_INDEX],
-            constants.PNAME_PCHANNEL: self._data[constants.PIRMX5_POINT_ADDRESS_CHANNEL_INDEX],
-            constants.PNAME_CHANNEL_ADDRESS: self._data[constants.PIRMX5_CHANNEL_ADDRESS_INDEX],
-            constants.PNAME_POINT_CATEGORY: self._data[constants.PIRMX5_POINT_CATEGORY_INDEX],
-            constants.PNAME_POINT_NUMBER: self._data[constants.PIRMX5_POINT_NUMBER_INDEX],
-            constants.PNAME_LOGICAL_POINT_NUMBER: self._data[constants.PIRMX5_LOGICAL_POINT_NUMBER_INDEX],
-            constants.PNAME_LOGICAL_POINT_ZONE: self._data[constants.PIRMX5_LOGICAL_POINT_ZONE_INDEX],
-            constants.PNAME_DEVICE_TYPE: self._data[constants.PIRMX5_DEVICE_TYPE_INDEX],
-            constants.PNAME_AUXILIARY_POINT_ATTRIBUTES: self._data[constants.PIRMX5_AUXILIARY_POINT_ATTRIBUTES_INDEX],
-            constants.PNAME_GROUP1: self._data[constants.PIRMX5_GROUP1_INDEX],
-            constants.PNAME_GROUP2: self._data[constants.PIRMX5_GROUP2_INDEX],
-            constants.PNAME_AREA_TYPE: self._data[constants.PIRMX5_AREA_TYPE_INDEX],
-            constants.PNAME_AREA_NUMBER: self._data[constants.PIRMX5_AREA_NUMBER_INDEX],
-            constants.PNAME_SECTOR_ID: self._data[constants.PIRMX5_SECTOR_ID_INDEX],
-            constants.PNAME_LOOP_TYPE: self._data[constants.PIRMX5_LOOP_TYPE_INDEX],
-            constants.PNAME_RAW_IDENTITY: self._data[constants.PIRMX5_RAW_IDENTITY_INDEX],
-            constants.PNAME_ACTUAL_DEVICE_TYPE: self._data[constants.PIRMX5_ACTUAL_DEVICE_TYPE_INDEX],
-            constants.PNAME_MODE_AND_SENSITIVITY: self._data[constants.PIRMX5_MODE_AND_SENSITIVITY_INDEX],
-            constants.PNAME_RAW_ANALOGUE_VALUES1: self._data[constants.PIRMX5_RAW_ANALOGUE_VALUES1_INDEX],
-            constants.PNAME_RAW_ANALOGUE_VALUES2: self._data[constants.PIRMX5_RAW_ANALOGUE_VALUES2_INDEX],
-            constants.PNAME_RAW_ANALOGUE_VALUES3: self._data[constants.PIRMX5_RAW_ANALOGUE_VALUES3_INDEX],
-            constants.PNAME_LTA_FLAGS: self._data[constants.PIRMX5_LTA_FLAGS_INDEX],
-            constants.PNAME_RAW_LTA: self._data[constants.PIRMX5_RAW_LTA_INDEX],
-            constants.PNAME_DIRTINESS: self._data[constants.PIRMX5_DIRTINESS_INDEX],
-            constants.PNAME_UNITS_OF_MEASURE1: self._data[constants.PIRMX5_UNITS_OF_MEASURE1_INDEX],
-            constants.PNAME_UNITS_OF_MEASURE2: self._data[constants.PIRMX5_UNITS_OF_MEASURE2_INDEX],
-            constants.PNAME_UNITS_OF_MEASURE3: self._data[constants.PIRMX5_UNITS_OF_MEASURE3_INDEX],
-            constants.PNAME_CONVERTED_VALUES1: self._data[constants.PIRMX5_CONVERTED_VALUE1_INDEX],
-            constants.PNAME_CONVERTED_VALUES2: self._data[constants.PIRMX5_CONVERTED_VALUE2_INDEX],
-            constants.PNAME_CONVERTED_VALUES3: self._data[constants.PIRMX5_CONVERTED_VALUE3_INDEX],
-            constants.PNAME_INSTANTANEOUS_ACTIVE_STATE: self._data[constants.PIRMX5_INSTANTANEOUS_ACTIVE_STATE_INDEX],
-            constants.PNAME_INSTANTANEOUS_FAULT_STATE: self._data[constants.PIRMX5_INSTANTANEOUS_FAULT_STATE_INDEX],
-            constants.PNAME_CONFIRMED_ACTIVE_STATE: self._data[constants.PIRMX5_CONFIRMED_ACTIVE_STATE_INDEX],
-            constants.PNAME_CONFIRMED_FAULT_STATE: self._data[constants.PIRMX5_CONFIRMED_FAULT_STATE_INDEX],
-            constants.PNAME_ACKNOWLEDGED_ACTIVE_STATE: self._data[constants.PIRMX5_ACKNOWLEDGED_ACTIVE_STATE_INDEX],
-            constants.PNAME_ACKNOWLEDGED_FAULT_STATE: self._data[constants.PIRMX5_ACKNOWLEDGED_FAULT_STATE_INDEX],
-            constants.PNAME_OUTPUT_FORCED_MODE: self._data[constants.PIRMX5_OUTPUT_FORCED_MODE_INDEX],
-            constants.PNAME_OUTPUT_UNFORCED_STATE: self._data[constants.PIRMX5_OUTPUT_UNFORCED_STATE_INDEX],
-            constants.PNAME_OUTPUT_FORCED_STATE: self._data[constants.PIRMX5_OUTPUT_FORCED_STATE_INDEX],
-            constants.PNAME_CLIENTID1: self._data[constants.PIRMX5_CLIENT_ID1_INDEX],
-            constants.PNAME_CLIENTID2: self._data[constants.PIRMX5_CLIENT_ID2_INDEX]
-        }
-
-        super().__init__(**params)
 
     ## Returns whether the reply packet has been successful in finding a device on the network.
     #
     # @return True is a device has been found at a particular point on the network, otherwise False.
     def reply_successful(self) -> bool:
-        return self.get_parameter("preply_status") == 0
+        return self.preply_status == 0
+
+    ## Returns the reply decoded into a human-readable format.
+    #
+    # An identical reply decoded before is taken from the decode cache, so the dictionary returned must not
+    # be modified.
+    #
+    # @return The decoded fields, in order.
+    def decode(self) -> dict:
+        return get_decode_cache().get(self._data, self._decode)[0]
 
     ## Returns an object as a series of comma-separated values (CSV).
     #
+    # An identical reply decoded before is taken from the decode cache.
+    #
     # @return The object as a series of comma-separated values (CSV).
     def get_as_csv(self) -> str:
-        csv_string = ""
-        params = self.get_parameters()
+        return get_decode_cache().get(self._data, self._decode)[1]
 
-        converted_params = decode_pirmx5(params)
-
-        for param in converted_params:
-            csv_string += f"{converted_params[param]},"
-
-        # Remove final ','.
-        csv_string = csv_string[:-1]
+    ## Decodes the reply.
+    #
+    # @return A tuple of the decoded fields and the same fields as comma-separated values.
+    def _decode(self) -> tuple:
+        converted_params = decode_pirmx5(self.get_parameters())
 
-        return csv_string
+        return converted_params, ",".join(f"{value}" for value in converted_params.values())
 
     def __str__(self):
         if self.reply_successful():
@@ -161,73 +241,79 @@ class PointInformationReplyMX5(Content, ILoggable):
 
 
 ## A class representing a point information reply packet (MX6).
-class PointInformationReplyMX6(Content):
+class PointInformationReplyMX6(FrameContent):
+    __slots__ = ("point_number",)
+
+    SCHEMA = (
+        (constants.PNAME_SOH, constants.PIRMX6_SOH_INDEX),
+        (constants.PNAME_SEQ, constants.PIRMX6_SEQ_INDEX),
+        (constants.PNAME_PACKET_LENGTH, constants.PIRMX6_PACKET_LENGTH_INDEX),
+        (constants.PNAME_MX6_SPEAKSIGNATURE, constants.PIRMX6_MX6_SPEAKSIGNATURE_INDEX),
+        (constants.PNAME_NETWORK_NODE, constants.PIRMX6_NETWORK_NODE_INDEX),
+        (constants.PNAME_CHANNEL, constants.PIRMX6_POINT_ADDRESS_CHANNEL_INDEX),
+        (constants.PNAME_DESTINATION_CHANNEL_ADDRESS, constants.PIRMX6_DESTINATION_CHANNEL_ADDRESS_INDEX),
+        (constants.PNAME_DESTINATION_TASK, constants.PIRMX6_DESTINATION_TASK_INDEX),
+        (constants.PNAME_SOURCE_CHANNEL_ADDRESS, constants.PIRMX6_SOURCE_CHANNEL_ADDRESS_INDEX),
+        (constants.PNAME_SOURCE_TASK, constants.PIRMX6_SOURCE_TASK_INDEX),
+        (constants.PNAME_MARKER, constants.PIRMX6_MARKER_INDEX),
+        (constants.PNAME_PACKET_ID, constants.PIRMX6_PACKET_ID_INDEX),
+        (constants.PNAME_REPLY_STATUS, constants.PIRMX6_REPLY_STATUS_INDEX),
+        (constants.PNAME_FLAGS, constants.PIRMX6_FLAGS_INDEX),
+        (constants.PNAME_NODE, constants.PIRMX6_NODE_INDEX),
+        (constants.PNAME_PCHANNEL, constants.PIRMX6_POINT_ADDRESS_CHANNEL_INDEX),
+        (constants.PNAME_CHANNEL_ADDRESS, constants.PIRMX6_CHANNEL_ADDRESS_INDEX),
+        (constants.PNAME_POINT_CATEGORY, constants.PIRMX6_POINT_CATEGORY_INDEX),
+        (constants.PNAME_POINT_NUMBER, constants.PIRMX6_POINT_NUMBER_INDEX),
+        (constants.PNAME_LOGICAL_POINT_NUMBER, constants.PIRMX6_LOGICAL_POINT_NUMBER_INDEX),
+        (constants.PNAME_LOGICAL_POINT_ZONE, constants.PIRMX6_LOGICAL_POINT_ZONE_INDEX),
+        (constants.PNAME_DEVICE_TYPE, constants.PIRMX6_DEVICE_TYPE_INDEX),
+        (constants.PNAME_AUXILIARY_POINT_ATTRIBUTES, constants.PIRMX6_AUXILIARY_POINT_ATTRIBUTES_INDEX),
+        (constants.PNAME_GROUP1, constants.PIRMX6_GROUP1_INDEX),
+        (constants.PNAME_GROUP2, constants.PIRMX6_GROUP2_INDEX),
+        (constants.PNAME_AREA_TYPE, constants.PIRMX6_AREA_TYPE_INDEX),
+        (constants.PNAME_AREA_NUMBER, constants.PIRMX6_AREA_NUMBER_INDEX),
+        (constants.PNAME_SECTOR_ID, constants.PIRMX6_SECTOR_ID_INDEX),
+        (constants.PNAME_LOOP_TYPE, constants.PIRMX6_LOOP_TYPE_INDEX),
+        (constants.PNAME_RAW_IDENTITY, constants.PIRMX6_RAW_IDENTITY_INDEX),
+        (constants.PNAME_ACTUAL_DEVICE_TYPE, constants.PIRMX6_ACTUAL_DEVICE_TYPE_INDEX),
+        (constants.PNAME_MODE_AND_SENSITIVITY, constants.PIRMX6_MODE_AND_SENSITIVITY_INDEX),
+        (constants.PNAME_RAW_ANALOGUE_VALUES1, constants.PIRMX6_RAW_ANALOGUE_VALUES1_INDEX),
+        (constants.PNAME_RAW_ANALOGUE_VALUES2, constants.PIRMX6_RAW_ANALOGUE_VALUES2_INDEX),
+        (constants.PNAME_RAW_ANALOGUE_VALUES3, constants.PIRMX6_RAW_ANALOGUE_VALUES3_INDEX),
+        (constants.PNAME_LTA_FLAGS, constants.PIRMX6_LTA_FLAGS_INDEX),
+        (constants.PNAME_RAW_LTA, constants.PIRMX6_RAW_LTA_INDEX),
+        (constants.PNAME_DIRTINESS, constants.PIRMX6_DIRTINESS_INDEX),
+        (constants.PNAME_UNITS_OF_MEASURE1, constants.PIRMX6_UNITS_OF_MEASURE1_INDEX),
+        (constants.PNAME_UNITS_OF_MEASURE2, constants.PIRMX6_UNITS_OF_MEASURE2_INDEX),
+        (constants.PNAME_UNITS_OF_MEASURE3, constants.PIRMX6_UNITS_OF_MEASURE3_INDEX),
+        (constants.PNAME_CONVERTED_VALUES1, constants.PIRMX6_CONVERTED_VALUE1_INDEX),
+        (constants.PNAME_CONVERTED_VALUES2, constants.PIRMX6_CONVERTED_VALUE2_INDEX),
+        (constants.PNAME_CONVERTED_VALUES3, constants.PIRMX6_CONVERTED_VALUE3_INDEX),
+        (constants.PNAME_INSTANTANEOUS_ACTIVE_STATE, constants.PIRMX6_INSTANTANEOUS_ACTIVE_STATE_INDEX),
+        (constants.PNAME_INSTANTANEOUS_FAULT_STATE, constants.PIRMX6_INSTANTANEOUS_FAULT_STATE_INDEX),
+        (constants.PNAME_CONFIRMED_ACTIVE_STATE, constants.PIRMX6_CONFIRMED_ACTIVE_STATE_INDEX),
+        (constants.PNAME_CONFIRMED_FAULT_STATE, constants.PIRMX6_CONFIRMED_FAULT_STATE_INDEX),
+        (constants.PNAME_ACKNOWLEDGED_ACTIVE_STATE, constants.PIRMX6_ACKNOWLEDGED_ACTIVE_STATE_INDEX),
+        (constants.PNAME_ACKNOWLEDGED_FAULT_STATE, constants.PIRMX6_ACKNOWLEDGED_FAULT_STATE_INDEX),
+        (constants.PNAME_OUTPUT_FORCED_MODE, constants.PIRMX6_OUTPUT_FORCED_MODE_INDEX),
+        (constants.PNAME_OUTPUT_UNFORCED_STATE, constants.PIRMX6_OUTPUT_UNFORCED_STATE_INDEX),
+        (constants.PNAME_OUTPUT_FORCED_STATE, constants.PIRMX6_OUTPUT_FORCED_STATE_INDEX),
+        (constants.PNAME_CLIENTID1, constants.PIRMX6_CLIENT_ID1_INDEX),
+        (constants.PNAME_CLIENTID2, constants.PIRMX6_CLIENT_ID2_INDEX)
+    )
+
+    # The reply status and flags, and everything from the mode and sensitivity to the output states.
+    DYNAMIC_RANGES = (
+        slice(constants.PIRMX6_REPLY_STATUS_INDEX, constants.PIRMX6_FLAGS_INDEX + 1),
+        slice(constants.PIRMX6_MODE_AND_SENSITIVITY_INDEX, constants.PIRMX6_OUTPUT_FORCED_STATE_INDEX + 1)
+    )
+
     def __init__(self, point_number: int, data: list, **kwargs):
+        super().__init__(data)
         self.point_number = point_number
-        self._data = data
-
-        params = {
-            constants.PNAME_SOH: self._data[constants.PIRMX6_SOH_INDEX],
-            constants.PNAME_SEQ: self._data[constants.PIRMX6_SEQ_INDEX],
-            constants.PNAME_PACKET_LENGTH: self._data[constants.PIRMX6_PACKET_LENGTH_INDEX],
-            constants.PNAME_MX6_SPEAKSIGNATURE: self._data[constants.PIRMX6_MX6_SPEAKSIGNATURE_INDEX],
-            constants.PNAME_NETWORK_NODE: self._data[constants.PIRMX6_NETWORK_NODE_INDEX],
-            constants.PNAME_CHANNEL: self._data[constants.PIRMX6_POINT_ADDRESS_CHANNEL_INDEX],
-            constants.PNAME_DESTINATION_CHANNEL_ADDRESS: self._data[constants.PIRMX6_DESTINATION_CHANNEL_ADDRESS_INDEX],
-            constants.PNAME_DESTINATION_TASK: self._data[constants.PIRMX6_DESTINATION_TASK_INDEX],
-            constants.PNAME_SOURCE_CHANNEL_ADDRESS: self._data[constants.PIRMX6_SOURCE_CHANNEL_ADDRESS_INDEX],
-            constants.PNAME_SOURCE_TASK: self._data[constants.PIRMX6_SOURCE_TASK_INDEX],
-            constants.PNAME_MARKER: self._data[constants.PIRMX6_MARKER_INDEX],
-            constants.PNAME_PACKET_ID: self._data[constants.PIRMX6_PACKET_ID_INDEX],
-            constants.PNAME_REPLY_STATUS: self._data[constants.PIRMX6_REPLY_STATUS_INDEX],
-            constants.PNAME_FLAGS: self._data[constants.PIRMX6_FLAGS_INDEX],
-            constants.PNAME_NODE: self._data[constants.PIRMX6_NODE_INDEX],
-            constants.PNAME_PCHANNEL: self._data[constants.PIRMX6_POINT_ADDRESS_CHANNEL_INDEX],
-            constants.PNAME_CHANNEL_ADDRESS: self._data[constants.PIRMX6_CHANNEL_ADDRESS_INDEX],
-            constants.PNAME_POINT_CATEGORY: self._data[constants.PIRMX6_POINT_CATEGORY_INDEX],
-            constants.PNAME_POINT_NUMBER: self._data[constants.PIRMX6_POINT_NUMBER_INDEX],
-            constants.PNAME_LOGICAL_POINT_NUMBER: self._data[constants.PIRMX6_LOGICAL_POINT_NUMBER_INDEX],
-            constants.PNAME_LOGICAL_POINT_ZONE: self._data[constants.PIRMX6_LOGICAL_POINT_ZONE_INDEX],
-            constants.PNAME_DEVICE_TYPE: self._data[constants.PIRMX6_DEVICE_TYPE_INDEX],
-            constants.PNAME_AUXILIARY_POINT_ATTRIBUTES: self._data[constants.PIRMX6_AUXILIARY_POINT_ATTRIBUTES_INDEX],
-            constants.PNAME_GROUP1: self._data[constants.PIRMX6_GROUP1_INDEX],
-            constants.PNAME_GROUP2: self._data[constants.PIRMX6_GROUP2_INDEX],
-            constants.PNAME_AREA_TYPE: self._data[constants.PIRMX6_AREA_TYPE_INDEX],
-            constants.PNAME_AREA_NUMBER: self._data[constants.PIRMX6_AREA_NUMBER_INDEX],
-            constants.PNAME_SECTOR_ID: self._data[constants.PIRMX6_SECTOR_ID_INDEX],
-            constants.PNAME_LOOP_TYPE: self._data[constants.PIRMX6_LOOP_TYPE_INDEX],
-            constants.PNAME_RAW_IDENTITY: self._data[constants.PIRMX6_RAW_IDENTITY_INDEX],
-            constants.PNAME_ACTUAL_DEVICE_TYPE: self._data[constants.PIRMX6_ACTUAL_DEVICE_TYPE_INDEX],
-            constants.PNAME_MODE_AND_SENSITIVITY: self._data[constants.PIRMX6_MODE_AND_SENSITIVITY_INDEX],
-            constants.PNAME_RAW_ANALOGUE_VALUES1: self._data[constants.PIRMX6_RAW_ANALOGUE_VALUES1_INDEX],
-            constants.PNAME_RAW_ANALOGUE_VALUES2: self._data[constants.PIRMX6_RAW_ANALOGUE_VALUES2_INDEX],
-            constants.PNAME_RAW_ANALOGUE_VALUES3: self._data[constants.PIRMX6_RAW_ANALOGUE_VALUES3_INDEX],
-            constants.PNAME_LTA_FLAGS: self._data[constants.PIRMX6_LTA_FLAGS_INDEX],
-            constants.PNAME_RAW_LTA: self._data[constants.PIRMX6_RAW_LTA_INDEX],
-            constants.PNAME_DIRTINESS: self._data[constants.PIRMX6_DIRTINESS_INDEX],
-            constants.PNAME_UNITS_OF_MEASURE1: self._data[constants.PIRMX6_UNITS_OF_MEASURE1_INDEX],
-            constants.PNAME_UNITS_OF_MEASURE2: self._data[constants.PIRMX6_UNITS_OF_MEASURE2_INDEX],
-            constants.PNAME_UNITS_OF_MEASURE3: self._data[constants.PIRMX6_UNITS_OF_MEASURE3_INDEX],
-            constants.PNAME_CONVERTED_VALUES1: self._data[constants.PIRMX6_CONVERTED_VALUE1_INDEX],
-            constants.PNAME_CONVERTED_VALUES2: self._data[constants.PIRMX6_CONVERTED_VALUE2_INDEX],
-            constants.PNAME_CONVERTED_VALUES3: self._data[constants.PIRMX6_CONVERTED_VALUE3_INDEX],
-            constants.PNAME_INSTANTANEOUS_ACTIVE_STATE: self._data[constants.PIRMX6_INSTANTANEOUS_ACTIVE_STATE_INDEX],
-            constants.PNAME_INSTANTANEOUS_FAULT_STATE: self._data[constants.PIRMX6_INSTANTANEOUS_FAULT_STATE_INDEX],
-            constants.PNAME_CONFIRMED_ACTIVE_STATE: self._data[constants.PIRMX6_CONFIRMED_ACTIVE_STATE_INDEX],
-            constants.PNAME_CONFIRMED_FAULT_STATE: self._data[constants.PIRMX6_CONFIRMED_FAULT_STATE_INDEX],
-            constants.PNAME_ACKNOWLEDGED_ACTIVE_STATE: self._data[constants.PIRMX6_ACKNOWLEDGED_ACTIVE_STATE_INDEX],
-            constants.PNAME_ACKNOWLEDGED_FAULT_STATE: self._data[constants.PIRMX6_ACKNOWLEDGED_FAULT_STATE_INDEX],
-            constants.PNAME_OUTPUT_FORCED_MODE: self._data[constants.PIRMX6_OUTPUT_FORCED_MODE_INDEX],
-            constants.PNAME_OUTPUT_UNFORCED_STATE: self._data[constants.PIRMX6_OUTPUT_UNFORCED_STATE_INDEX],
-            constants.PNAME_OUTPUT_FORCED_STATE: self._data[constants.PIRMX6_OUTPUT_FORCED_STATE_INDEX],
-            constants.PNAME_CLIENTID1: self._data[constants.PIRMX6_CLIENT_ID1_INDEX],
-            constants.PNAME_CLIENTID2: self._data[constants.PIRMX6_CLIENT_ID2_INDEX]
-        }
-
-        super().__init__(**params)
 
     def reply_successful(self) -> bool:
-        return self.get_parameter("preply_status") == 0
+        return self.preply_status == 0
 
     def __str__(self):
         if self.reply_successful():
@@ -238,11 +324,15 @@ class PointInformationReplyMX6(Content):
 
 ## A class representing a point information request (MX5).
 class PointInformationRequestMX5(PacketImplementation):
-    def __init__(self, point_number: int):
-        super().__init__()
+    def __init__(self, point_number: int, link: SerialDataTransfer = None):
+        super().__init__(link)
 
         self.point_number = point_number
 
+    ## Builds the underlying packet.
+    #
+    # @return The packet.
+    def create_packet(self) -> Packet:
         header = LocalHeaderMX5(PacketID.POINT_INFO_REQUEST)
         params = {
             "pnode": 0,  # D+0
@@ -295,27 +385,37 @@ class PointInformationRequestMX5(PacketImplementation):
             "psearch_type": 10  # D+47
         }
 
-        self.packet = Packet(header=header, **params)
-        print(f"Point Information Request Packet: {self.packet.get_byte_array()}")
+        return Packet(header=header, link=self.link, **params)
 
-    # Reads data from a communications port by calling the underlying
-    # packet read method.
+    ## Encodes the request as the bytes of a frame, ready to be written.
     #
-    # @return The data in the form of a PointInformationReplyMX6.
-    def read(self) -> PointInformationReplyMX5:
-        data = self.packet.read(response_sizes.get(type(self)))
-        print(f"Read data: {data}")
+    # Only the point number, SEQ and checksum differ between requests, so they are patched into a frame
+    # shared by every request of this type.
+    #
+    # @param seq The sequence number to stamp the frame with.
+    # @return The bytes of the frame.
+    def encode(self, seq: int) -> bytes:
+        return get_template(type(self), "ppoint_number").fill(self.point_number, seq)
 
+    ## Creates the reply object for data received in response to this packet.
+    #
+    # @param data The reply data received.
+    # @return The data in the form of a PointInformationReplyMX5.
+    def create_reply(self, data: list) -> PointInformationReplyMX5:
         return PointInformationReplyMX5(self.point_number, data)
 
 
 ## A class representing a point information request (MX6).
 class PointInformationRequestMX6(PacketImplementation):
-    def __init__(self, point_number: int):
-        super().__init__()
+    def __init__(self, point_number: int, link: SerialDataTransfer = None):
+        super().__init__(link)
 
         self.point_number = point_number
 
+    ## Builds the underlying packet.
+    #
+    # @return The packet.
+    def create_packet(self) -> Packet:
         header = LocalHeaderMX6(PacketID.POINT_INFO_REQUEST)
         params = {
             "pnode": 0,  # D+0
@@ -368,27 +468,22 @@ class PointInformationRequestMX6(PacketImplementation):
             "psearch_type": 10,  # D+47
         }
 
-        self.packet = Packet(header=header, **params)
-        print(f"Point Information Request Packet: {self.packet.get_byte_array()}")
+        return Packet(header=header, link=self.link, **params)
 
-    # Reads data from a communications port by calling the underlying
-    # packet read method.
+    ## Encodes the request as the bytes of a frame, ready to be written.
     #
-    # @return The data in the form of a PointInformationReplyMX6.
-    def read(self) -> PointInformationReplyMX6:
-        data = self.packet.read(response_sizes.get(type(self)))
-        print(f"Read data: {data}")
+    # Only the point number, SEQ and checksum differ between requests, so they are patched into a frame
+    # shared by every request of this type.
+    #
+    # @param seq The sequence number to stamp the frame with.
+    # @return The bytes of the frame.
+    def encode(self, seq: int) -> bytes:
+        return get_template(type(self), "ppoint_number").fill(self.point_number, seq)
 
+    ## Creates the reply object for data received in response to this packet.
+    #
+    # @param data The reply data received.
+    # @return The data in the form of a PointInformationReplyMX6.
+    def create_reply(self, data: list) -> PointInformationReplyMX6:
         return PointInformationReplyMX6(self.point_number, data)
 
-
-# A dictionary containing concrete packets respective to their expected response packet's size (i.e. you send
-# a MX5 Panel Details request, you expected a response of size 29).
-response_sizes = {
-    RestartPanelMX5: 0,
-    RestartPanelMX6: 0,
-    PanelDetailsRequestMX5: 30,
-    PanelDetailsRequestMX6: 31,
-    PointInformationRequestMX5: 55,
-    PointInformationRequestMX6: 55
-}
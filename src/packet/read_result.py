@@ -0,0 +1,51 @@
+## @file read_result.py
+# @brief Contains ReadResult, which is returned when reading a frame from a link.
+# @author Guy Chamberlain-Webber
+
+import enum
+
+
+## An enum used to represent the outcome of reading a frame from a link.
+class ReadStatus(enum.Enum):
+    OK = 0
+    TIMEOUT = 1
+
+
+## The result of reading a frame from a link.
+class ReadResult:
+    def __init__(self, status: ReadStatus, frame: bytes = None):
+        self.status = status
+        self.frame = frame
+
+    ## Returns whether a frame was read.
+    #
+    # @return True if a frame was read, False if not.
+    def is_ok(self) -> bool:
+        return self.status is ReadStatus.OK
+
+    ## Returns whether the deadline passed before a frame was read.
+    #
+    # @return True if the read timed out, False if not.
+    def is_timeout(self) -> bool:
+        return self.status is ReadStatus.TIMEOUT
+
+    def __str__(self):
+        if self.is_ok():
+            return f"Read frame: {list(self.frame)}"
+
+        return f"Read {self.status.name.lower()}."
+
+
+## Creates the result of a successful read.
+#
+# @param frame The frame read.
+# @return The result of the read.
+def frame_result(frame: bytes) -> ReadResult:
+    return ReadResult(ReadStatus.OK, frame)
+
+
+## Creates the result of a read which timed out.
+#
+# @return The result of the read.
+def timeout_result() -> ReadResult:
+    return ReadResult(ReadStatus.TIMEOUT)
@@ -0,0 +1,65 @@
+## @file request_template.py
+# @brief Contains the RequestTemplate, a reusable request frame in which only one field, the SEQ and the
+# checksum change between requests.
+# @author Guy Chamberlain-Webber
+
+import threading
+
+from src.packet.packet import Packet
+
+# The template for each type of request, so each is only built once.
+templates = dict()
+
+# The index of the SEQ within a frame.
+SEQ_INDEX = 1
+
+
+## A request frame which is encoded once, then has a single field and the SEQ patched into it for each
+# request sent.
+#
+# The checksum is updated from the checksum of the template by adding the patched values, rather than by
+# summing the whole frame again.
+class RequestTemplate:
+    ## @param packet The packet to build the template from. The field to patch, and the SEQ, are zeroed.
+    # @param field The name of the parameter patched for each request.
+    def __init__(self, packet: Packet, field: str):
+        self.field = field
+        self.field_index = list(packet.get_parameters()).index(field) + SEQ_INDEX + 1
+
+        self._frame = bytearray(packet.encode(0))
+        self._frame[self.field_index] = 0
+        self._base_checksum = sum(self._frame[SEQ_INDEX + 1:-1])
+
+        # The frame is shared by every panel's thread.
+        self._lock = threading.Lock()
+
+    ## Fills in the template.
+    #
+    # @param value The value of the patched field.
+    # @param seq The sequence number to stamp the frame with.
+    # @return The bytes of the frame.
+    def fill(self, value: int, seq: int) -> bytes:
+        frame = self._frame
+
+        with self._lock:
+            frame[SEQ_INDEX] = seq
+            frame[self.field_index] = value
+            frame[-1] = (self._base_checksum + seq + value) % 256
+
+            return bytes(frame)
+
+
+## Returns the template for a type of request, building it the first time.
+#
+# The template is built from the packet of a request created with 'field' set to zero.
+#
+# @param request_type The type of request, whose only argument is the value of 'field'.
+# @param field The name of the parameter patched for each request.
+# @return The template.
+def get_template(request_type, field: str) -> RequestTemplate:
+    template = templates.get(request_type)
+
+    if template is None:
+        template = templates[request_type] = RequestTemplate(request_type(0).packet, field)
+
+    return template
@@ -0,0 +1,48 @@
+## @file retry_policy.py
+# @brief Contains RetryPolicy, which decides whether, and after how long, an unanswered request is sent again.
+# @author Guy Chamberlain-Webber
+
+import random
+
+import src.config as config
+
+
+## A policy limiting how many times a request is sent, with an exponential backoff between attempts.
+#
+# Each backoff delay is reduced by a random amount of up to 'jitter' of itself, so requests which failed
+# together do not all retry at the same moment.
+class RetryPolicy:
+    def __init__(self, max_attempts: int = None, base_delay: float = None, max_delay: float = None,
+                 jitter: float = None):
+        if max_attempts is None:
+            max_attempts = config.get_retry_max_attempts()
+
+        if base_delay is None:
+            base_delay = config.get_retry_base_delay()
+
+        if max_delay is None:
+            max_delay = config.get_retry_max_delay()
+
+        if jitter is None:
+            jitter = config.get_retry_jitter()
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    ## Returns whether a request should be sent again.
+    #
+    # @param attempts The number of times the request has been sent.
+    # @return True if the request should be sent again, False if it should be given up on.
+    def should_retry(self, attempts: int) -> bool:
+        return attempts < self.max_attempts
+
+    ## Returns how long to wait before sending a request again.
+    #
+    # @param attempts The number of times the request has been sent.
+    # @return The delay, in seconds.
+    def get_delay(self, attempts: int) -> float:
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempts - 1))
+
+        return delay * (1 - self.jitter * random.random())
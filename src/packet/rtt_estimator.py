@@ -0,0 +1,165 @@
+## @file rtt_estimator.py
+# @brief Contains classes which estimate the round trip time (RTT) of requests, in order to decide how long
+# to wait for a reply before a request is sent again.
+# @author Guy Chamberlain-Webber
+
+import src.config as config
+
+# The gain applied to each new sample of the smoothed RTT.
+RTT_ALPHA = 1 / 8
+
+# The gain applied to each new sample of the RTT variance.
+RTT_BETA = 1 / 4
+
+# The number of RTT variances added to the smoothed RTT to give the retransmission timeout.
+RTT_K = 4
+
+
+## Estimates the round trip time of requests, and the retransmission timeout (RTO) derived from it.
+#
+# The smoothed RTT and RTT variance are estimated in the same way as TCP does (RFC 6298). The RTO is
+# kept between a floor and a ceiling.
+class RttEstimator:
+    def __init__(self, initial_rto: float, rto_floor: float, rto_ceiling: float):
+        self.rto_floor = rto_floor
+        self.rto_ceiling = rto_ceiling
+
+        self.srtt = None
+        self.rttvar = None
+        self.rto = self._clamp(initial_rto)
+        self.sample_count = 0
+
+    ## Adds a measured round trip time to the estimate.
+    #
+    # Only replies to requests which were sent once should be measured, as it is not known which attempt
+    # the reply to a resent request belongs to.
+    #
+    # @param rtt The measured round trip time, in seconds.
+    def add_sample(self, rtt: float):
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = (1 - RTT_BETA) * self.rttvar + RTT_BETA * abs(self.srtt - rtt)
+            self.srtt = (1 - RTT_ALPHA) * self.srtt + RTT_ALPHA * rtt
+
+        self.rto = self._clamp(self.srtt + RTT_K * self.rttvar)
+        self.sample_count += 1
+
+    ## Doubles the RTO after a request has gone unanswered.
+    def backoff(self):
+        self.rto = self._clamp(self.rto * 2)
+
+    ## Returns whether any round trip times have been measured.
+    #
+    # @return True if there is at least one sample, False if not.
+    def has_samples(self) -> bool:
+        return self.sample_count > 0
+
+    ## Returns the current estimates.
+    #
+    # @return A dictionary of the smoothed RTT, RTT variance, RTO and number of samples.
+    def get_estimates(self) -> dict:
+        return {
+            "srtt": self.srtt,
+            "rttvar": self.rttvar,
+            "rto": self.rto,
+            "samples": self.sample_count
+        }
+
+    ## Keeps an RTO between the floor and the ceiling.
+    #
+    # @param rto The RTO.
+    # @return The RTO, limited to the floor and ceiling.
+    def _clamp(self, rto: float) -> float:
+        return min(self.rto_ceiling, max(self.rto_floor, rto))
+
+
+## Keeps an RTT estimator for a panel, and for each point on it.
+#
+# The panel's estimate is only ever updated from measured round trip times, and is used for each point until
+# that point has an estimator of its own. A point is given one when a reply from it is measured, or when a
+# request to it goes unanswered, so a silent or missing point only backs off its own timeout, never the one
+# used for the rest of the panel.
+class RetransmitTimers:
+    def __init__(self, initial_rto: float = None, rto_floor: float = None, rto_ceiling: float = None):
+        if initial_rto is None:
+            initial_rto = config.get_initial_rto()
+
+        if rto_floor is None:
+            rto_floor = config.get_rto_floor()
+
+        if rto_ceiling is None:
+            rto_ceiling = config.get_rto_ceiling()
+
+        self.initial_rto = initial_rto
+        self.rto_floor = rto_floor
+        self.rto_ceiling = rto_ceiling
+
+        self.panel = self._create_estimator()
+        self._points = dict()
+
+    ## Returns the retransmission timeout to use for a point.
+    #
+    # @param point The point number, or None if the request is not for a point.
+    # @return The retransmission timeout, in seconds.
+    def get_rto(self, point: int = None) -> float:
+        estimator = self._points.get(point)
+
+        if estimator is not None:
+            return estimator.rto
+
+        return self.panel.rto
+
+    ## Adds a measured round trip time for a point.
+    #
+    # @param point The point number, or None if the request was not for a point.
+    # @param rtt The measured round trip time, in seconds.
+    def add_sample(self, point: int, rtt: float):
+        self.panel.add_sample(rtt)
+        self._get_estimator(point).add_sample(rtt)
+
+    ## Backs off the retransmission timeout for a point after a request to it has gone unanswered.
+    #
+    # If the point does not have its own estimator yet, it is given one starting from the panel's timeout, as
+    # that is the one which was used, and that is backed off. The panel's timeout is left as it is.
+    #
+    # @param point The point number, or None if the request was not for a point.
+    def backoff(self, point: int = None):
+        self._get_estimator(point).backoff()
+
+    ## Returns the current estimates for the panel and each point.
+    #
+    # @return A dictionary of estimates, keyed by point number, with the panel's estimates under "panel".
+    def get_estimates(self) -> dict:
+        estimates = {"panel": self.panel.get_estimates()}
+
+        for point, estimator in self._points.items():
+            estimates[point] = estimator.get_estimates()
+
+        return estimates
+
+    ## Returns the estimator for a point, creating it if it does not exist.
+    #
+    # A new estimator starts from the panel's current timeout.
+    #
+    # @param point The point number, or None for requests which are not for a point.
+    # @return The estimator for the point.
+    def _get_estimator(self, point: int) -> RttEstimator:
+        estimator = self._points.get(point)
+
+        if estimator is None:
+            estimator = self._create_estimator(self.panel.rto)
+            self._points[point] = estimator
+
+        return estimator
+
+    ## Creates a new estimator with the configured limits.
+    #
+    # @param initial_rto The RTO to start from. The configured initial RTO is used if not given.
+    # @return The new estimator.
+    def _create_estimator(self, initial_rto: float = None) -> RttEstimator:
+        if initial_rto is None:
+            initial_rto = self.initial_rto
+
+        return RttEstimator(initial_rto, self.rto_floor, self.rto_ceiling)
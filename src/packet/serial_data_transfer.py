@@ -1,72 +1,213 @@
 ## @file.py serial_data_transfer.py
-# @brief Responsible for writing and reading data across a serial data transfer and
-# setting up pyserial.
+# @brief Responsible for writing and reading data across the transport connected to the panel.
 # @author Guy Chamberlain-Webber
 
-import sys
+import collections
+import time
 
-import serial
-
-import src.config as config
 import src.constants as constants
-from src.clock import Clock
+from src.packet.capture import CaptureDirection, CaptureWriter
+from src.packet.frame_parser import FrameParser
+from src.packet.output_queue import OutputQueue
+from src.packet.read_result import ReadResult, frame_result, timeout_result
+from src.transport.transport import ITransport
+from src.transport.transport_factory import create_transport
+
+# The link session shared by the whole process.
+session = None
+
+# Each possible single byte, so queueing an ACK does not build a new bytes object each time.
+SINGLE_BYTES = tuple(bytes([value]) for value in range(256))
+
+
+## A long-lived link session which owns the transport connected to the panel.
+#
+# The transport is opened once and kept open until close() is called, rather than being
+# reopened for every packet. The number of times it has been opened and closed
+# is recorded, so it can be confirmed that no reopen happens per poll.
+#
+# Frames and ACKs may be queued rather than written straight away, so that, for example, the ACK for one
+# reply and the next request are passed to the transport in a single write. Anything queued is written
+# when flush() is called, when the queue is full, or before waiting for a reply.
+#
+# If a capture writer is given, every frame sent, and every byte received, is recorded to it.
+#
+# If the other end closes the connection, or it is lost, the transport is closed and ConnectionError is
+# raised, rather than the link waiting for replies which can never arrive.
+#
+# The transport chosen in the configuration file is used, unless one is given.
+class SerialDataTransfer:
+    def __init__(self, open_port: bool = True, transport: ITransport = None, capture: CaptureWriter = None):
+        self.transport = None
+        self.capture = capture
 
+        if transport is None:
+            transport = create_transport()
 
-class SerialDataTransfer:
-    def __init__(self):
-        self.serial = None
-
-        try:
-            self.serial = serial.Serial(port=config.get_com_port(),
-                                        baudrate=config.get_baudrate(),
-                                        timeout=config.get_timeout(),
-                                        bytesize=config.get_bytesize(),
-                                        parity=config.get_parity(),
-                                        stopbits=config.get_stopbits()
-                                        )
-        except serial.SerialException:
-            print(f"Unable to open port: '{config.get_com_port()}'.\nPlease make sure the correct port is specified "
-                  f"and that it is not in use by another process.")
-            sys.exit()
+        self.transport = transport
+        self.open_count = 0
+        self.close_count = 0
+
+        self.parser = FrameParser()
+        self.output = OutputQueue()
+        self._frames = collections.deque()
+
+        if open_port:
+            self.open()
 
     def __del__(self):
-        if self.serial:
-            self.serial.close()
+        self.close()
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    ## Opens the transport, if it is not already open.
+    def open(self):
+        if self.is_open():
+            return
+
+        self.transport.open()
+        self.open_count += 1
+
+    ## Closes the transport, if it is open.
+    def close(self):
+        if not self.is_open():
+            return
 
-    ## Writes data across a serial communication port.
+        self.flush()
+        self.transport.close()
+        self.close_count += 1
+
+        if self.capture is not None:
+            self.capture.flush()
+
+    ## Returns whether the transport is currently open.
+    #
+    # @return True if the transport is open, False if not.
+    def is_open(self) -> bool:
+        return self.transport is not None and self.transport.is_open()
+
+    ## Writes data across a serial communication port, along with anything already queued.
     def write(self, data: list):
-        self.serial.write(data)
+        self.queue(data)
+        self.flush()
+
+    ## Writes several frames across a serial communication port, with as few system calls as possible.
+    #
+    # @param frames The frames to write.
+    def writev(self, frames: list):
+        self.flush()
+        frames = [bytes(frame) for frame in frames]
+
+        if self.capture is not None:
+            self.capture.record_all(CaptureDirection.TX, frames)
+
+        self.transport.writev(frames)
 
-    ## Writes a single byte of data across a serial communication port.
+    ## Writes a single byte of data across a serial communication port, along with anything already queued.
     def write_byte(self, value):
-        data = [value]
+        self.queue_byte(value)
+        self.flush()
+
+    ## Queues data to be written across a serial communication port.
+    #
+    # If the queue becomes full, everything queued is written.
+    #
+    # @param data The data to write.
+    def queue(self, data):
+        if self.output.add(bytes(data)):
+            self.flush()
+
+    ## Queues a single byte of data to be written across a serial communication port.
+    #
+    # @param value The byte to write.
+    def queue_byte(self, value: int):
+        if self.output.add(SINGLE_BYTES[value]):
+            self.flush()
+
+    ## Writes everything queued across a serial communication port, in a single write.
+    def flush(self):
+        if self.capture is not None:
+            self.capture.record_all(CaptureDirection.TX, self.output.peek())
+
+        data = self.output.take()
 
-        self.serial.write(data)
+        if not data:
+            return
 
-    ## Reads data from a serial communication port.
+        if not self.is_open():
+            raise ConnectionError("The link is not open.")
+
+        self.transport.write(data)
+
+    ## Returns how well writes are being coalesced.
+    #
+    # @return A dictionary of the number of writes, frames and bytes, and the mean number of frames per write.
+    def get_coalescing_stats(self) -> dict:
+        return self.output.get_stats()
+
+    ## Reads the next frame from a serial communication port.
+    #
+    # The process sleeps in the kernel until bytes arrive or the deadline passes. Whatever bytes are
+    # waiting on the transport are then read in bulk and fed into the frame parser. Any frames beyond the
+    # first are kept for the next call, so several requests may be outstanding at once.
     #
-    # @return The data (if any) read from the serial communication port.
-    def read(self, size: int):
-        clock = Clock()
+    # @param deadline The time.monotonic() time by which a frame must arrive. If not given, the deadline
+    # is RESEND_TIME from now.
+    # @return The result of the read, holding the frame if one was received in time.
+    def read_frame(self, deadline: float = None) -> ReadResult:
+        # Anything queued may be what the reply is waiting for.
+        self.flush()
 
-        ack_acquired = False
+        if self._frames:
+            return frame_result(self._frames.popleft())
+
+        if deadline is None:
+            deadline = time.monotonic() + constants.RESEND_TIME
+
+        remaining = deadline - time.monotonic()
+
+        while remaining > 0:
+            self._frames.extend(self.parser.feed(self._capture_received(self.transport.read_available(remaining))))
+
+            if self._frames:
+                return frame_result(self._frames.popleft())
+
+            remaining = deadline - time.monotonic()
+
+        # No more bytes have arrived to complete a buffered frame, so it never will be.
+        self._frames.extend(self.parser.resync())
+
+        if self._frames:
+            return frame_result(self._frames.popleft())
+
+        return timeout_result()
+
+    ## Records bytes received to the capture file as they were read, before they are parsed, if capturing.
+    #
+    # @param chunk The bytes received.
+    # @return The same bytes.
+    def _capture_received(self, chunk: bytes) -> bytes:
+        if chunk and self.capture is not None:
+            self.capture.record(CaptureDirection.RX, chunk)
 
-        # Reads the ACK, so it does not appear in final data.
-        while not ack_acquired:
-            data = self.serial.read(size=1)
-            if int.from_bytes(data, "little") == constants.ACK:
-                ack_acquired = True
+        return chunk
 
-        while True:
-            # If we have not received any data after a set time, don't bother trying to read,
-            # we'll send another packet.
-            if clock.time_elapsed(constants.RESEND_TIME):
-                print("No response from sent packet, moving on to next...")
-                break
 
-            response = self.serial.read(size=size)
+## Returns the process-wide link session.
+#
+# The session is created, and the serial port opened, on first use. Every subsequent
+# call returns the same session.
+#
+# @return The process-wide link session.
+def get_session() -> SerialDataTransfer:
+    global session
 
-            if len(response) == size:
-                return response
+    if session is None:
+        session = SerialDataTransfer()
 
-        return None
+    return session
@@ -0,0 +1,180 @@
+## @file threaded_serial_data_transfer.py
+# @brief Contains the ThreadedSerialDataTransfer, a link session which reads and writes the transport on
+# its own threads.
+# @author Guy Chamberlain-Webber
+
+import queue
+import threading
+import time
+
+import src.config as config
+import src.constants as constants
+from src.packet.capture import CaptureDirection, CaptureWriter
+from src.packet.read_result import ReadResult, frame_result, timeout_result
+from src.packet.serial_data_transfer import SerialDataTransfer
+from src.transport.transport import ITransport
+
+# The longest time, in seconds, the reader thread waits for bytes before checking whether it has been
+# stopped. If no bytes arrive for this long, a partly received frame is given up on.
+READER_POLL_INTERVAL = 0.05
+
+# Put on the write queue to stop the writer thread.
+STOP_WRITER = None
+
+# Put on the received frame queue by the reader thread when the other end closes the connection.
+DISCONNECTED = None
+
+
+## A long-lived link session which owns a reader thread and a writer thread.
+#
+# The reader thread drains the transport into the frame parser as soon as bytes arrive, and hands each
+# frame to read_frame() through a bounded queue. The writer thread sends whatever is flushed, also taken
+# from a bounded queue. The thread using the link therefore never waits on the transport itself, and
+# nothing it does between calls delays bytes on the wire.
+#
+# If the received frame queue is full, further frames are dropped and counted, as their requests will
+# be sent again. If the write queue is full, flush() waits for room.
+#
+# If the other end closes the connection, the reader thread stops, and read_frame() raises ConnectionError
+# once every frame received before then has been read. Anything written afterwards is discarded.
+class ThreadedSerialDataTransfer(SerialDataTransfer):
+    def __init__(self, open_port: bool = True, transport: ITransport = None, queue_size: int = None,
+                 capture: CaptureWriter = None):
+        if queue_size is None:
+            queue_size = config.get_link_queue_size()
+
+        self.queue_size = queue_size
+        self.dropped_frame_count = 0
+
+        self._received = queue.Queue(maxsize=queue_size)
+        self._outgoing = queue.Queue(maxsize=queue_size)
+        self._stop_event = threading.Event()
+        self._disconnected = False
+        self._reader = None
+        self._writer = None
+
+        super().__init__(open_port, transport, capture)
+
+    ## Opens the transport and starts the reader and writer threads, if not already open.
+    def open(self):
+        if self.is_open():
+            return
+
+        super().open()
+
+        self._stop_event.clear()
+        self._disconnected = False
+        self._reader = threading.Thread(target=self._read_loop, name="LinkReader", daemon=True)
+        self._writer = threading.Thread(target=self._write_loop, name="LinkWriter", daemon=True)
+        self._reader.start()
+        self._writer.start()
+
+    ## Stops the reader and writer threads, once everything flushed has been written, and closes the transport.
+    #
+    # The threads are stopped even if the other end has already closed the connection.
+    def close(self):
+        if self._reader is None:
+            return
+
+        self.flush()
+        self._outgoing.put(STOP_WRITER)
+        self._writer.join()
+
+        self._stop_event.set()
+        self._reader.join()
+        self._reader = None
+        self._writer = None
+
+        super().close()
+
+    ## Hands everything queued to the writer thread, to be sent in a single write.
+    def flush(self):
+        if self.capture is not None:
+            self.capture.record_all(CaptureDirection.TX, self.output.peek())
+
+        data = self.output.take()
+
+        if data:
+            self._outgoing.put(data)
+
+    ## Writes several frames across a serial communication port, in a single write.
+    #
+    # @param frames The frames to write.
+    def writev(self, frames: list):
+        for frame in frames:
+            self.queue(frame)
+
+        self.flush()
+
+    ## Reads the next frame received by the reader thread.
+    #
+    # @param deadline The time.monotonic() time by which a frame must arrive. If not given, the deadline
+    # is RESEND_TIME from now.
+    # @return The result of the read, holding the frame if one was received in time.
+    def read_frame(self, deadline: float = None) -> ReadResult:
+        # Anything queued may be what the reply is waiting for.
+        self.flush()
+
+        if deadline is None:
+            deadline = time.monotonic() + constants.RESEND_TIME
+
+        if self._disconnected and self._received.empty():
+            raise ConnectionError("The connection was closed by the other end.")
+
+        try:
+            frame = self._received.get(timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            return timeout_result()
+
+        if frame is DISCONNECTED:
+            raise ConnectionError("The connection was closed by the other end.")
+
+        return frame_result(frame)
+
+    ## Drains the transport into the frame parser until the link is closed, or the other end closes the
+    # connection.
+    def _read_loop(self):
+        while not self._stop_event.is_set():
+            try:
+                chunk = self.transport.read_available(READER_POLL_INTERVAL)
+            except ConnectionError:
+                self._disconnected = True
+                self._put_disconnected()
+                return
+
+            if chunk:
+                frames = self.parser.feed(self._capture_received(chunk))
+            else:
+                # No more bytes have arrived to complete a buffered frame, so it never will be.
+                frames = self.parser.resync()
+
+            for frame in frames:
+                try:
+                    self._received.put_nowait(frame)
+                except queue.Full:
+                    self.dropped_frame_count += 1
+
+    ## Wakes read_frame() once every frame received before the connection was closed has been read.
+    #
+    # The received frame queue may be full, so room is waited for until the link is closed.
+    def _put_disconnected(self):
+        while not self._stop_event.is_set():
+            try:
+                self._received.put(DISCONNECTED, timeout=READER_POLL_INTERVAL)
+                return
+            except queue.Full:
+                pass
+
+    ## Sends everything flushed until the link is closed.
+    def _write_loop(self):
+        while True:
+            data = self._outgoing.get()
+
+            if data is STOP_WRITER:
+                return
+
+            # Nothing more can be sent once the other end has closed the connection.
+            if self._disconnected or not self.transport.is_open():
+                continue
+
+            self.transport.write(data)
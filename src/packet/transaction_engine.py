@@ -0,0 +1,311 @@
+## @file transaction_engine.py
+# @brief Contains the TransactionEngine, which keeps several requests in flight at once and matches
+# replies back to their requests by sequence number.
+# @author Guy Chamberlain-Webber
+
+import asyncio
+import collections
+import enum
+import time
+
+import src.config as config
+import src.constants as constants
+
+from src.exceptions.invalid_value import InvalidValueException
+from src.packet.packet import Packet, increment_seq, seq_lock
+from src.packet.packet_types import PacketImplementation
+from src.packet.circuit_breaker import PointBreakers
+from src.packet.read_result import ReadResult
+from src.packet.retry_policy import RetryPolicy
+from src.packet.rtt_estimator import RetransmitTimers
+from src.packet.serial_data_transfer import SerialDataTransfer
+
+
+## An enum used to represent the state of a transaction.
+class TransactionStatus(enum.Enum):
+    PENDING = 0     # Waiting to be sent, or for a reply.
+    COMPLETE = 1    # A reply has been received.
+    FAILED = 2      # No reply was received after the maximum number of attempts.
+    SKIPPED = 3     # Not sent, as the point's circuit breaker is open.
+
+
+## A single request and, once it has been received, its reply.
+class Transaction:
+    def __init__(self, request: PacketImplementation):
+        self.request = request
+        self.status = TransactionStatus.PENDING
+        self.seq = None
+        self.sent_time = None
+        self.deadline = None
+        self.resend_time = None
+        self.attempts = 0
+        self.reply = None
+
+    ## Returns the point number the request is for.
+    #
+    # @return The point number, or None if the request is not for a point.
+    def get_point(self):
+        return getattr(self.request, "point_number", None)
+
+    ## Returns whether a reply has been received for the request.
+    #
+    # @return True if a reply has been received, False if not.
+    def is_complete(self) -> bool:
+        return self.status is TransactionStatus.COMPLETE
+
+
+## Sends requests across a link, keeping up to 'window' of them in flight at once.
+#
+# Each request is tagged with its own sequence number (SEQ) as it is sent. Replies may then arrive in any
+# order, and are matched back to their request by the SEQ they carry. A reply is only accepted if it is from
+# the point its request was for. The SEQ of a request which went unanswered is quarantined for the timeout
+# the request was sent with, so a late reply to it is not taken for the reply to a newer request. Other SEQs
+# are used first, but if every SEQ not in flight is quarantined, the one released soonest is reused rather
+# than leaving the window part empty. A late reply then still can not complete a request to another point.
+#
+# How long to wait for each reply is decided by estimating the round trip time to each point. Unanswered
+# requests are sent again according to the retry policy, and points which keep failing are taken out of the
+# rotation by their circuit breaker, so they do not hold up the others.
+#
+# Requests and ACKs are queued on the link, so the ACKs for the replies just received and the requests
+# which replace them in the window are sent in a single write.
+class TransactionEngine:
+    def __init__(self, link: SerialDataTransfer, window: int = None, timers: RetransmitTimers = None,
+                 retry_policy: RetryPolicy = None, breakers: PointBreakers = None):
+        if window is None:
+            window = config.get_transaction_window()
+
+        if window < 1 or window > constants.SEQ_WRAP:
+            raise InvalidValueException(
+                f"Invalid window value '{window}': Window must be between 1 and {constants.SEQ_WRAP}.")
+
+        if timers is None:
+            timers = RetransmitTimers()
+
+        if retry_policy is None:
+            retry_policy = RetryPolicy()
+
+        if breakers is None:
+            breakers = PointBreakers()
+
+        self.link = link
+        self.window = window
+        self.timers = timers
+        self.retry_policy = retry_policy
+        self.breakers = breakers
+
+        self._pending = collections.deque()
+        self._waiting = []
+        self._in_flight = dict()
+
+        # The time.monotonic() time each SEQ of an unanswered request may be used again, keyed by SEQ.
+        self._quarantined = dict()
+
+    ## Returns the number of requests currently in flight.
+    #
+    # @return The number of requests awaiting a reply.
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    ## Sends each request and waits until each has either been answered or given up on.
+    #
+    # @param requests The requests to send.
+    # @return A transaction for each request, in the order the requests were given.
+    def run(self, requests: list) -> list:
+        transactions = self._start(requests)
+
+        while self._is_busy():
+            deadline = self._fill_window()
+            self.link.flush()
+
+            if self._in_flight:
+                self._receive(self.link.read_frame(deadline))
+            else:
+                # Only requests waiting to be sent again remain.
+                time.sleep(max(0.0, deadline - time.monotonic()))
+
+        # Send the ACK for the final reply.
+        self.link.flush()
+
+        return transactions
+
+    ## Sends each request and waits until each has either been answered or given up on, from an asyncio
+    # event loop.
+    #
+    # The engine must have been created with an asynchronous link.
+    #
+    # @param requests The requests to send.
+    # @return A transaction for each request, in the order the requests were given.
+    async def run_async(self, requests: list) -> list:
+        transactions = self._start(requests)
+
+        while self._is_busy():
+            deadline = self._fill_window()
+            await self.link.drain()
+
+            if self._in_flight:
+                self._receive(await self.link.read_frame(deadline))
+            else:
+                # Only requests waiting to be sent again remain.
+                await asyncio.sleep(max(0.0, deadline - time.monotonic()))
+
+        # Send the ACK for the final reply.
+        await self.link.drain()
+
+        return transactions
+
+    ## Creates a transaction for each request, and queues those whose point's breaker allows it.
+    #
+    # @param requests The requests to send.
+    # @return A transaction for each request, in the order the requests were given.
+    def _start(self, requests: list) -> list:
+        transactions = [Transaction(request) for request in requests]
+        now = time.monotonic()
+
+        for transaction in transactions:
+            if self.breakers.allow_request(transaction.get_point(), now):
+                self._pending.append(transaction)
+            else:
+                transaction.status = TransactionStatus.SKIPPED
+
+        return transactions
+
+    ## Returns whether any requests are still to be sent or answered.
+    #
+    # @return True if there are requests pending, waiting to be sent again or in flight, False if not.
+    def _is_busy(self) -> bool:
+        return bool(self._pending or self._waiting or self._in_flight)
+
+    ## Sends as many requests as the window allows.
+    #
+    # Requests waiting to be sent again whose backoff has passed are sent before new ones.
+    #
+    # @return The time.monotonic() time by which something next needs to happen, either a reply being due or
+    # a request being ready to send again.
+    def _fill_window(self) -> float:
+        now = time.monotonic()
+
+        for transaction in sorted(self._waiting, key=lambda waiting: waiting.resend_time, reverse=True):
+            if transaction.resend_time <= now:
+                self._waiting.remove(transaction)
+                self._pending.appendleft(transaction)
+
+        self._release_seqs(now)
+
+        while self._pending and len(self._in_flight) < self.window:
+            self._send(self._pending.popleft())
+
+        deadlines = [transaction.deadline for transaction in self._in_flight.values()]
+        deadlines += [transaction.resend_time for transaction in self._waiting]
+
+        return min(deadlines)
+
+    ## Sends a transaction's request, tagged with the next free sequence number.
+    #
+    # @param transaction The transaction to send.
+    def _send(self, transaction: Transaction):
+        transaction.seq = self._next_seq()
+        transaction.sent_time = time.monotonic()
+        transaction.deadline = transaction.sent_time + self.timers.get_rto(transaction.get_point())
+        transaction.attempts += 1
+
+        self._in_flight[transaction.seq] = transaction
+        self.link.queue(transaction.request.encode(transaction.seq))
+
+    ## Makes each quarantined SEQ whose quarantine has passed free to use again.
+    #
+    # @param now The current time.monotonic() time.
+    def _release_seqs(self, now: float):
+        for seq, release_time in list(self._quarantined.items()):
+            if release_time <= now:
+                del self._quarantined[seq]
+
+    ## Returns the next sequence number which is not in use by a request in flight, or quarantined.
+    #
+    # If every SEQ not in flight is quarantined, the one whose quarantine ends soonest is released early.
+    #
+    # @return A free sequence number.
+    def _next_seq(self) -> int:
+        with seq_lock:
+            for _ in range(constants.SEQ_WRAP):
+                if Packet.seq not in self._in_flight and Packet.seq not in self._quarantined:
+                    break
+
+                increment_seq()
+            else:
+                Packet.seq = min(self._quarantined, key=self._quarantined.get)
+                del self._quarantined[Packet.seq]
+
+            seq = Packet.seq
+            increment_seq()
+
+        return seq
+
+    ## Completes the transaction a reply belongs to.
+    #
+    # If no reply arrived in time, each request in flight whose deadline has passed is either queued to be
+    # sent again after a backoff, or given up on.
+    #
+    # @param result The result of reading the reply.
+    def _receive(self, result: ReadResult):
+        if result.is_timeout():
+            self._expire(time.monotonic())
+            return
+
+        data = result.frame
+
+        # Acknowledge the reply whether it is known or not, so it is not sent to us again. The ACK is sent
+        # along with the next requests.
+        self.link.queue_byte(constants.ACK)
+
+        seq = data[constants.PIRMX5_SEQ_INDEX]
+        transaction = self._in_flight.get(seq)
+
+        if transaction is None:
+            # Once the late reply to an unanswered request has arrived, its SEQ is safe to use again.
+            self._quarantined.pop(seq, None)
+            print(f"Discarding reply with unknown SEQ {seq}.")
+            return
+
+        reply = transaction.request.create_reply(data)
+        point = transaction.get_point()
+
+        # The request stays in flight, as its own reply may still arrive.
+        if point is not None and getattr(reply, "ppoint_number", point) != point:
+            print(f"Discarding reply with SEQ {seq} from point {reply.ppoint_number}, expected point {point}.")
+            return
+
+        del self._in_flight[seq]
+
+        # Only a reply to a request sent once is measured, as it is not known which attempt a reply to a
+        # resent request belongs to.
+        if transaction.attempts == 1:
+            self.timers.add_sample(transaction.get_point(), time.monotonic() - transaction.sent_time)
+
+        self.breakers.record_success(transaction.get_point())
+
+        transaction.reply = reply
+        transaction.status = TransactionStatus.COMPLETE
+
+    ## Handles each request in flight whose deadline has passed.
+    #
+    # @param now The current time.monotonic() time.
+    def _expire(self, now: float):
+        for transaction in list(self._in_flight.values()):
+            if transaction.deadline > now:
+                continue
+
+            del self._in_flight[transaction.seq]
+            self._quarantined[transaction.seq] = now + (transaction.deadline - transaction.sent_time)
+            point = transaction.get_point()
+            self.timers.backoff(point)
+
+            if self.retry_policy.should_retry(transaction.attempts):
+                print(f"No response from sent packet with SEQ {transaction.seq}, resending...")
+                transaction.resend_time = now + self.retry_policy.get_delay(transaction.attempts)
+                self._waiting.append(transaction)
+            else:
+                print(f"No response from sent packet with SEQ {transaction.seq} after {transaction.attempts} "
+                      f"attempts, giving up.")
+                transaction.status = TransactionStatus.FAILED
+                self.breakers.record_failure(point, now)
@@ -0,0 +1,125 @@
+## @file unit_conversion.py
+# @brief Contains functions to convert the analogue values of many point information replies at once into
+# engineering units.
+# @author Guy Chamberlain-Webber
+
+import numpy as np
+
+import src.constants as constants
+from src.config import MXSpeakVersion
+from src.packet.batch_decode import decode_replies, get_reply_size
+from src.packet.device_codes import devices_codes
+from src.packet.packet_decode import unit_of_measurement
+
+# The quantities analogue values are converted to. Each quantity has one standard unit.
+QUANTITIES = ("temperature", "concentration", "obscuration", "y_value", "current", "voltage")
+
+# The quantity measured in each unit of measurement, and the scale and offset converting a value in that
+# unit to the standard unit of the quantity: degrees C, ppm, %/m obscuration, Y value, amps and volts.
+# Units which are not listed, such as 'Invalid' and 'Not Installed', have no value.
+UNIT_COEFFICIENTS = {
+    1: ("temperature", 1.0, 0.0),
+    2: ("temperature", 5 / 9, -160 / 9),
+    3: ("concentration", 1.0, 0.0),
+    # Linear for the small obscurations detectors report.
+    4: ("obscuration", 1 / 0.3048, 0.0),
+    5: ("obscuration", 1.0, 0.0),
+    6: ("y_value", 1.0, 0.0),
+    7: ("current", 1.0, 0.0),
+    8: ("voltage", 1.0, 0.0),
+    10: ("current", 0.001, 0.0)
+}
+
+# The scale and offset of each unit of measurement for device types whose values are scaled differently
+# from the default for the unit, keyed by device type, then unit. A device type should only be added here
+# from its data sheet, so none are yet.
+DEVICE_COEFFICIENTS = dict()
+
+# The fields holding the unit and the converted value of each analogue channel.
+CHANNEL_FIELDS = (
+    (constants.PNAME_UNITS_OF_MEASURE1, constants.PNAME_CONVERTED_VALUES1),
+    (constants.PNAME_UNITS_OF_MEASURE2, constants.PNAME_CONVERTED_VALUES2),
+    (constants.PNAME_UNITS_OF_MEASURE3, constants.PNAME_CONVERTED_VALUES3)
+)
+
+# The conversion table shared by the whole process.
+conversion_table = None
+
+
+## The coefficients converting an analogue value, indexed by device type and unit of measurement.
+#
+# Each array is built once, so converting a batch of values is a few indexing operations rather than a
+# lookup per value.
+class ConversionTable:
+    def __init__(self):
+        # The scale and offset of each device type and unit. Unknown device types and units are NaN, so
+        # their values convert to NaN.
+        self.scale = np.full((256, 256), np.nan)
+        self.offset = np.full((256, 256), np.nan)
+
+        # The index in QUANTITIES of each unit, or -1 for units which have no value.
+        self.quantity = np.full(256, -1, dtype=np.int8)
+
+        for unit, (quantity, scale, offset) in UNIT_COEFFICIENTS.items():
+            if unit not in unit_of_measurement:
+                raise KeyError(f"Unknown unit of measurement '{unit}'.")
+
+            self.quantity[unit] = QUANTITIES.index(quantity)
+
+            for device_type in devices_codes:
+                self.scale[device_type, unit], self.offset[device_type, unit] = \
+                    DEVICE_COEFFICIENTS.get(device_type, dict()).get(unit, (scale, offset))
+
+    ## Converts analogue values.
+    #
+    # @param device_types The device type of each value.
+    # @param units The unit of measurement of each value.
+    # @param values The values.
+    # @return A dictionary of a float array for each quantity, the same shape as 'values', holding the
+    # converted values measured in that quantity and NaN elsewhere.
+    def convert(self, device_types, units, values) -> dict:
+        converted = self.scale[device_types, units] * values + self.offset[device_types, units]
+        quantities = self.quantity[units]
+
+        return {quantity: np.where(quantities == index, converted, np.nan)
+                for index, quantity in enumerate(QUANTITIES)}
+
+
+## Returns the conversion table shared by the whole process, building it the first time.
+#
+# @return The conversion table.
+def get_conversion_table() -> ConversionTable:
+    global conversion_table
+
+    if conversion_table is None:
+        conversion_table = ConversionTable()
+
+    return conversion_table
+
+
+## Converts the analogue values of a batch of point information replies.
+#
+# @param replies A structured array of replies, as returned by batch_decode.decode_replies().
+# @return A dictionary of a float array for each quantity, with a row for each reply and a column for each
+# of its three analogue channels, holding the values measured in that quantity and NaN elsewhere.
+def convert_replies(replies: np.ndarray) -> dict:
+    units = np.column_stack([replies[units_field] for units_field, _ in CHANNEL_FIELDS])
+    values = np.column_stack([replies[value_field] for _, value_field in CHANNEL_FIELDS])
+    device_types = replies[constants.PNAME_DEVICE_TYPE][:, np.newaxis]
+
+    return get_conversion_table().convert(device_types, units, values)
+
+
+## Decodes and converts the point information replies received in one polling cycle, all at once.
+#
+# Frames which are not the size of a reply of the given version are left out.
+#
+# @param frames The reply frames received in the cycle.
+# @param version The MX Speak version of the replies.
+# @return The replies, as returned by batch_decode.decode_replies(), and their converted values, as returned
+# by convert_replies().
+def convert_cycle(frames: list, version: MXSpeakVersion = MXSpeakVersion.MX_SPEAK5) -> tuple:
+    size = get_reply_size(version)
+    replies = decode_replies(b"".join(frame for frame in frames if len(frame) == size), version)
+
+    return replies, convert_replies(replies)
@@ -0,0 +1,81 @@
+## @file record_sink.py
+# @brief Contains the RecordSink, which handles records, such as decoding, printing and logging replies, on
+# its own thread.
+# @author Guy Chamberlain-Webber
+
+import queue
+import threading
+
+import src.config as config
+
+# Put on the queue to stop the sink's thread.
+STOP_RECORD = object()
+
+
+## Hands records to a handler on a separate thread, through a bounded queue.
+#
+# This keeps slow work, such as decoding and writing to disk, off the thread talking to the panel. If the
+# queue is full, records are dropped and counted, rather than holding up acquisition.
+class RecordSink:
+    def __init__(self, handler, queue_size: int = None):
+        if queue_size is None:
+            queue_size = config.get_record_queue_size()
+
+        self.handler = handler
+        self.handled_count = 0
+        self.dropped_count = 0
+
+        self._records = queue.Queue(maxsize=queue_size)
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    ## Starts handling records.
+    def start(self):
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(target=self._run, name="RecordSink", daemon=True)
+        self._thread.start()
+
+    ## Stops handling records, once every record already put has been handled.
+    def stop(self):
+        if self._thread is None:
+            return
+
+        self._records.put(STOP_RECORD)
+        self._thread.join()
+        self._thread = None
+
+    ## Puts a record on the queue to be handled.
+    #
+    # @param record The record.
+    # @return True if the record was queued, False if it was dropped as the queue is full.
+    def put(self, record) -> bool:
+        try:
+            self._records.put_nowait(record)
+        except queue.Full:
+            self.dropped_count += 1
+            return False
+
+        return True
+
+    ## Handles records until stopped.
+    def _run(self):
+        while True:
+            record = self._records.get()
+
+            if record is STOP_RECORD:
+                return
+
+            try:
+                self.handler(record)
+            except Exception as exception:
+                print(f"Unable to handle record: {exception}")
+
+            self.handled_count += 1
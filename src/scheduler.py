@@ -0,0 +1,139 @@
+## @file scheduler.py
+# @brief Contains the Scheduler, which runs one-shot and periodic jobs, sleeping until the next is due.
+# @author Guy Chamberlain-Webber
+
+import heapq
+import itertools
+import threading
+import time
+
+from src.exceptions.invalid_value import InvalidValueException
+
+
+## A job run by a scheduler.
+class Job:
+    def __init__(self, callback, due: float, period: float = None, name: str = None):
+        self.callback = callback
+        self.due = due
+        self.period = period
+        self.name = name
+        self.cancelled = False
+        self.run_count = 0
+
+        # The number of times a run finished after the next was due, and the number of runs missed as a result.
+        self.overrun_count = 0
+        self.skipped_count = 0
+
+    ## Returns whether the job runs repeatedly.
+    #
+    # @return True if the job has a period, False if it only runs once.
+    def is_periodic(self) -> bool:
+        return self.period is not None
+
+    ## Stops the job from running again.
+    def cancel(self):
+        self.cancelled = True
+
+
+## Runs jobs at their due times, measured on the monotonic clock.
+#
+# Jobs are kept in a heap ordered by due time. Between jobs, the scheduler sleeps until the next is due,
+# rather than checking the time in a loop.
+#
+# A periodic job is due a whole number of periods after it was first due, however long each run takes, so
+# it does not drift. A run which finishes after the next is due is an overrun: the runs missed are skipped,
+# rather than run back to back to catch up, and 'on_overrun' is called with the job and how late it is.
+#
+# Jobs are run, and should be scheduled, on the thread which calls run().
+class Scheduler:
+    ## @param on_overrun Called with a job and the number of seconds it is late, whenever it overruns.
+    def __init__(self, on_overrun=None):
+        self.on_overrun = on_overrun
+        self.overrun_count = 0
+
+        self._jobs = []
+        self._counter = itertools.count()
+        self._stopped = False
+
+    ## Schedules a job.
+    #
+    # @param callback The function to run, with no arguments.
+    # @param delay The number of seconds until the job is first run.
+    # @param period The number of seconds between runs, or None to run the job once.
+    # @param name The name of the job.
+    # @return The job.
+    def schedule(self, callback, delay: float = 0.0, period: float = None, name: str = None) -> Job:
+        if period is not None and period <= 0:
+            raise InvalidValueException(f"Invalid period '{period}': Period must be greater than 0.")
+
+        job = Job(callback, time.monotonic() + delay, period, name)
+        self._push(job)
+
+        return job
+
+    ## Returns the number of jobs waiting to run, including any which have been cancelled.
+    #
+    # @return The number of jobs.
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    ## Stops the scheduler once the job currently running returns.
+    def stop(self):
+        self._stopped = True
+
+    ## Runs jobs as they fall due, until there are none left, stop() is called or 'stop_event' is set.
+    #
+    # @param stop_event An event which is set when the scheduler should stop. It also wakes the scheduler
+    # while it is sleeping.
+    def run(self, stop_event: threading.Event = None):
+        if stop_event is None:
+            stop_event = threading.Event()
+
+        self._stopped = False
+
+        while self._jobs and not self._stopped and not stop_event.is_set():
+            due, _, job = self._jobs[0]
+
+            if job.cancelled:
+                heapq.heappop(self._jobs)
+                continue
+
+            delay = due - time.monotonic()
+
+            if delay > 0:
+                # Jobs are only scheduled on this thread, so none can fall due sooner while sleeping.
+                stop_event.wait(delay)
+                continue
+
+            heapq.heappop(self._jobs)
+            job.run_count += 1
+            job.callback()
+
+            if job.is_periodic() and not job.cancelled:
+                self._reschedule(job)
+
+    ## Moves a periodic job to its next due time, skipping any runs missed while it was running.
+    #
+    # @param job The job which has just run.
+    def _reschedule(self, job: Job):
+        job.due += job.period
+        late = time.monotonic() - job.due
+
+        if late > 0:
+            skipped = int(late // job.period) + 1
+            job.due += skipped * job.period
+            job.overrun_count += 1
+            job.skipped_count += skipped
+            self.overrun_count += 1
+
+            if self.on_overrun is not None:
+                self.on_overrun(job, late)
+
+        self._push(job)
+
+    ## Adds a job to the heap.
+    #
+    # @param job The job.
+    def _push(self, job: Job):
+        # The counter orders jobs due at the same time by when they were scheduled.
+        heapq.heappush(self._jobs, (job.due, next(self._counter), job))
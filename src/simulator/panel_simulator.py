@@ -0,0 +1,350 @@
+## @file panel_simulator.py
+# @brief Contains the PanelSimulator, which plays an MX Speak 5 or 6 panel on a pseudo-terminal, so that the
+# program can be run and tested without a real panel.
+# @author Guy Chamberlain-Webber
+
+import argparse
+import heapq
+import os
+import pty
+import random
+import select
+import threading
+import time
+import tty
+
+import src.config as config
+import src.constants as constants
+
+from src.config import MXSpeakVersion
+from src.exceptions.invalid_value import InvalidValueException
+from src.packet.device_codes import devices_codes
+from src.packet.frame_parser import FrameParser, FRAME_OVERHEAD
+from src.packet.packet_ids import PacketID
+
+# The maximum number of bytes read from the pseudo-terminal at once.
+READ_CHUNK_SIZE = 4096
+
+# The longest time, in seconds, the simulator waits for a request before checking whether it has been stopped.
+STOP_CHECK_INTERVAL = 0.05
+
+# The index of the point number within a point information request (MX5).
+REQUEST_POINT_NUMBER_INDEX = 15
+
+# The size of each reply, in bytes, including the SOH, SEQ and checksum.
+POINT_INFO_REPLY_SIZE = {
+    MXSpeakVersion.MX_SPEAK5: 55,
+    MXSpeakVersion.MX_SPEAK6: 56
+}
+PANEL_DETAILS_REPLY_SIZE = {
+    MXSpeakVersion.MX_SPEAK5: 30,
+    MXSpeakVersion.MX_SPEAK6: 31
+}
+
+# How far each reply field is moved along by the MX Speak signature in an MX Speak 6 header.
+REPLY_INDEX_OFFSET = {
+    MXSpeakVersion.MX_SPEAK5: 0,
+    MXSpeakVersion.MX_SPEAK6: 1
+}
+
+# How far each request field is moved along by the MX Speak signature and reserved byte in an MX Speak 6 header.
+REQUEST_INDEX_OFFSET = {
+    MXSpeakVersion.MX_SPEAK5: 0,
+    MXSpeakVersion.MX_SPEAK6: 2
+}
+
+# The loop channel devices are reported on.
+MP_LOOP_CHANNEL = 12
+
+
+## Creates a population of devices at the first 'count' points, each with a random device type.
+#
+# @param count The number of devices.
+# @param seed The seed used to choose the device types.
+# @return A dictionary of device type codes, keyed by point number.
+def create_devices(count: int, seed: int = None) -> dict:
+    rng = random.Random(seed)
+    codes = list(devices_codes.keys())
+
+    return {point: rng.choice(codes) for point in range(count)}
+
+
+## A simulated MX Speak panel on a pseudo-terminal.
+#
+# The program connects to the slave end of the pseudo-terminal, given by 'port_name', as if it were the
+# panel's serial port. The simulator acknowledges each request and answers point information and panel
+# details requests with correctly sized and checksummed replies.
+#
+# Each reply can be delayed by 'latency' seconds, plus a random amount of up to 'latency_jitter' seconds.
+# A 'drop_rate' fraction of requests are ignored entirely, and a 'corruption_rate' fraction of replies are
+# sent with a bad checksum.
+#
+# If 'wildcard' is set, a point information request for ALL_POINTS is answered with a reply from each
+# device. Otherwise, it is answered as a point with no device.
+#
+# If 'silent' is set, a point information request for a point with no device is acknowledged but never
+# answered, as some panels do.
+class PanelSimulator:
+    def __init__(self, version: MXSpeakVersion = MXSpeakVersion.MX_SPEAK5, devices: dict = None,
+                 latency: float = 0.0, latency_jitter: float = 0.0, drop_rate: float = 0.0,
+                 corruption_rate: float = 0.0, seed: int = None, wildcard: bool = False, silent: bool = False):
+        if devices is None:
+            devices = dict()
+
+        for point, device_type in devices.items():
+            if device_type not in devices_codes:
+                raise InvalidValueException(
+                    f"Invalid device type '{device_type}' at point {point}: Device type must be in devices_codes.")
+
+        for name, rate in (("drop rate", drop_rate), ("corruption rate", corruption_rate)):
+            if rate < 0 or rate > 1:
+                raise InvalidValueException(f"Invalid {name} '{rate}': Rate must be between 0 and 1.")
+
+        self.version = version
+        self.devices = devices
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.drop_rate = drop_rate
+        self.corruption_rate = corruption_rate
+        self.wildcard = wildcard
+        self.silent = silent
+
+        self.master = None
+        self.slave = None
+        self.port_name = None
+        self.parser = FrameParser()
+
+        self.request_count = 0
+        self.reply_count = 0
+        self.dropped_count = 0
+        self.corrupted_count = 0
+        self.unsupported_count = 0
+
+        self._rng = random.Random(seed)
+        self._scheduled = []
+        self._thread = None
+        self._stop_event = threading.Event()
+
+    ## Opens the pseudo-terminal and starts answering requests on a background thread.
+    def start(self):
+        self.master, self.slave = pty.openpty()
+        tty.setraw(self.master)
+        tty.setraw(self.slave)
+
+        # The slave end is kept open, so the master end does not fail while the program reconnects.
+        self.port_name = os.ttyname(self.slave)
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._serve, name="PanelSimulator", daemon=True)
+        self._thread.start()
+
+    ## Stops answering requests and closes the pseudo-terminal.
+    def stop(self):
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+        os.close(self.master)
+        os.close(self.slave)
+        self.master = None
+        self.slave = None
+
+    ## Returns the number of acknowledgements received from the program.
+    #
+    # @return The number of ACKs received.
+    def get_ack_count(self) -> int:
+        return self.parser.ack_count
+
+    ## Creates the reply to a request.
+    #
+    # @param request The request frame received.
+    # @return The reply frame, or None if the request is not one the simulator answers.
+    def create_reply(self, request: bytes):
+        # The packet ID is in the same place in requests and replies.
+        packet_id = request[constants.PIRMX5_PACKET_ID_INDEX + REPLY_INDEX_OFFSET[self.version]]
+        seq = request[constants.PIRMX5_SEQ_INDEX]
+
+        if packet_id == PacketID.POINT_INFO_REQUEST.value:
+            point = request[REQUEST_POINT_NUMBER_INDEX + REQUEST_INDEX_OFFSET[self.version]]
+
+            if self.silent and point not in self.devices:
+                return None
+
+            return self._create_point_info_reply(seq, point)
+
+        if packet_id == PacketID.PANEL_DETAILS_REQUEST.value:
+            return self._create_panel_details_reply(seq)
+
+        return None
+
+    ## Creates every reply to a request.
+    #
+    # @param request The request frame received.
+    # @return A list of the reply frames, empty if the request is not one the simulator answers.
+    def create_replies(self, request: bytes) -> list:
+        packet_id = request[constants.PIRMX5_PACKET_ID_INDEX + REPLY_INDEX_OFFSET[self.version]]
+
+        if self.wildcard and packet_id == PacketID.POINT_INFO_REQUEST.value and \
+                request[REQUEST_POINT_NUMBER_INDEX + REQUEST_INDEX_OFFSET[self.version]] == constants.ALL_POINTS:
+            seq = request[constants.PIRMX5_SEQ_INDEX]
+            return [self._create_point_info_reply(seq, device_point) for device_point in sorted(self.devices)]
+
+        reply = self.create_reply(request)
+
+        return [] if reply is None else [reply]
+
+    ## Creates a point information reply.
+    #
+    # @param seq The sequence number of the request being answered.
+    # @param point The point number requested.
+    # @return The reply frame.
+    def _create_point_info_reply(self, seq: int, point: int) -> bytearray:
+        reply = self._create_reply_frame(POINT_INFO_REPLY_SIZE[self.version], seq, PacketID.POINT_INFO_REPLY)
+        offset = REPLY_INDEX_OFFSET[self.version]
+        device_type = self.devices.get(point)
+
+        reply[constants.PIRMX5_POINT_NUMBER_INDEX + offset] = point
+
+        if device_type is None:
+            reply[constants.PIRMX5_REPLY_STATUS_INDEX + offset] = 1
+        else:
+            reply[constants.PIRMX5_POINT_ADDRESS_CHANNEL_INDEX + offset] = MP_LOOP_CHANNEL
+            reply[constants.PIRMX5_CHANNEL_ADDRESS_INDEX + offset] = 1
+            reply[constants.PIRMX5_LOGICAL_POINT_NUMBER_INDEX + offset] = point
+            reply[constants.PIRMX5_LOGICAL_POINT_ZONE_INDEX + offset] = 1
+            reply[constants.PIRMX5_DEVICE_TYPE_INDEX + offset] = device_type
+            reply[constants.PIRMX5_ACTUAL_DEVICE_TYPE_INDEX + offset] = device_type
+            reply[constants.PIRMX5_RAW_IDENTITY_INDEX + offset] = device_type
+
+            for index in (constants.PIRMX5_RAW_ANALOGUE_VALUES1_INDEX, constants.PIRMX5_RAW_ANALOGUE_VALUES2_INDEX,
+                          constants.PIRMX5_RAW_ANALOGUE_VALUES3_INDEX, constants.PIRMX5_RAW_LTA_INDEX):
+                reply[index + offset] = self._rng.randrange(16, 32)
+
+        reply[-1] = sum(reply[1:-1]) % 256
+
+        return reply
+
+    ## Creates a panel details reply.
+    #
+    # @param seq The sequence number of the request being answered.
+    # @return The reply frame.
+    def _create_panel_details_reply(self, seq: int) -> bytearray:
+        reply = self._create_reply_frame(PANEL_DETAILS_REPLY_SIZE[self.version], seq,
+                                         PacketID.PANEL_DETAILS_RESPONSE)
+        reply[-1] = sum(reply[1:-1]) % 256
+
+        return reply
+
+    ## Creates a reply frame with its header filled in, and every other byte zero.
+    #
+    # @param size The size of the frame, in bytes.
+    # @param seq The sequence number of the request being answered.
+    # @param packet_id The ID of the reply.
+    # @return The reply frame, without its checksum.
+    def _create_reply_frame(self, size: int, seq: int, packet_id: PacketID) -> bytearray:
+        reply = bytearray(size)
+        offset = REPLY_INDEX_OFFSET[self.version]
+
+        reply[constants.PIRMX5_SOH_INDEX] = constants.SOH
+        reply[constants.PIRMX5_SEQ_INDEX] = seq
+        reply[constants.PIRMX5_PACKET_LENGTH_INDEX] = size - FRAME_OVERHEAD
+        reply[constants.PIRMX5_PACKET_ID_INDEX + offset] = packet_id.value
+
+        if self.version is MXSpeakVersion.MX_SPEAK6:
+            reply[constants.PIRMX6_MX6_SPEAKSIGNATURE_INDEX] = config.get_mx_signature()
+
+        return reply
+
+    ## Answers requests until the simulator is stopped.
+    def _serve(self):
+        while not self._stop_event.is_set():
+            timeout = STOP_CHECK_INTERVAL
+            if self._scheduled:
+                timeout = min(timeout, max(0.0, self._scheduled[0][0] - time.monotonic()))
+
+            readable, _, _ = select.select([self.master], [], [], timeout)
+
+            if readable:
+                for request in self.parser.feed(os.read(self.master, READ_CHUNK_SIZE)):
+                    self._handle_request(request)
+
+            self._send_due_replies(time.monotonic())
+
+    ## Acknowledges a request and schedules its reply.
+    #
+    # @param request The request frame received.
+    def _handle_request(self, request: bytes):
+        self.request_count += 1
+
+        if self._rng.random() < self.drop_rate:
+            self.dropped_count += 1
+            return
+
+        os.write(self.master, bytes([constants.ACK]))
+
+        replies = self.create_replies(request)
+        if not replies:
+            self.unsupported_count += 1
+            return
+
+        due_time = time.monotonic() + self.latency + self._rng.uniform(0, self.latency_jitter)
+
+        for index, reply in enumerate(replies):
+            if self._rng.random() < self.corruption_rate:
+                reply[-1] ^= 0xff
+                self.corrupted_count += 1
+
+            # The request count breaks ties, so replies due at the same time are sent in the order requested.
+            heapq.heappush(self._scheduled, (due_time, self.request_count, index, bytes(reply)))
+
+    ## Sends each reply whose latency has passed.
+    #
+    # @param now The current time.monotonic() time.
+    def _send_due_replies(self, now: float):
+        while self._scheduled and self._scheduled[0][0] <= now:
+            *_, reply = heapq.heappop(self._scheduled)
+            os.write(self.master, reply)
+            self.reply_count += 1
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+if __name__ == "__main__":
+    argument_parser = argparse.ArgumentParser(description="Simulates an MX Speak panel on a pseudo-terminal.")
+    argument_parser.add_argument("--mx6", action="store_true", help="speak MX Speak 6 rather than MX Speak 5")
+    argument_parser.add_argument("--devices", type=int, default=32, help="the number of devices on the panel")
+    argument_parser.add_argument("--latency", type=float, default=0.0, help="the delay before each reply")
+    argument_parser.add_argument("--latency-jitter", type=float, default=0.0, help="a random extra reply delay")
+    argument_parser.add_argument("--drop-rate", type=float, default=0.0, help="the fraction of requests ignored")
+    argument_parser.add_argument("--corruption-rate", type=float, default=0.0,
+                                 help="the fraction of replies sent with a bad checksum")
+    argument_parser.add_argument("--seed", type=int, default=None, help="the seed for the random choices")
+    argument_parser.add_argument("--wildcard", action="store_true",
+                                 help="answer a request for every point with a reply from each device")
+    argument_parser.add_argument("--silent", action="store_true",
+                                 help="never answer a request for a point with no device")
+    arguments = argument_parser.parse_args()
+
+    simulator = PanelSimulator(MXSpeakVersion.MX_SPEAK6 if arguments.mx6 else MXSpeakVersion.MX_SPEAK5,
+                               create_devices(arguments.devices, arguments.seed), arguments.latency,
+                               arguments.latency_jitter, arguments.drop_rate, arguments.corruption_rate,
+                               arguments.seed, arguments.wildcard, arguments.silent)
+
+    with simulator:
+        print(f"Simulating a panel on {simulator.port_name}. Press Ctrl+C to stop.")
+
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+    print(f"Answered {simulator.reply_count} of {simulator.request_count} request(s).")
@@ -0,0 +1,127 @@
+## @file supervisor.py
+# @brief Contains the PanelSupervisor, which polls several panels at once from one process.
+# @author Guy Chamberlain-Webber
+
+import threading
+
+import src.config as config
+from src.packet.capture import open_capture
+from src.packet.serial_data_transfer import SerialDataTransfer
+from src.packet.threaded_serial_data_transfer import ThreadedSerialDataTransfer
+from src.record_sink import RecordSink
+from src.transport.transport_factory import create_transport
+
+# How often, in seconds, join() checks whether the panels have finished. Waiting in short steps lets the
+# main thread still be interrupted with Ctrl+C.
+JOIN_INTERVAL = 0.5
+
+
+## A reply received from one of several panels.
+class PanelReply:
+    def __init__(self, panel: str, reply):
+        self.panel = panel
+        self.reply = reply
+
+
+## The point information replies received from a panel in one polling cycle.
+class PanelCycle:
+    def __init__(self, panel: str, frames: list):
+        self.panel = panel
+        self.frames = frames
+
+
+## Creates the link session for a panel, with its own reader and writer threads if they are enabled.
+#
+# If capturing is enabled, the link records everything sent and received to a new capture file for the panel.
+#
+# @param panel The panel, as returned by config.get_panels().
+# @return The link session, which is opened.
+def create_panel_link(panel: dict) -> SerialDataTransfer:
+    transport = create_transport(settings=panel.get("transport"))
+    capture = open_capture(panel["name"]) if config.get_capture_enabled() else None
+
+    if config.get_link_threads_enabled():
+        return ThreadedSerialDataTransfer(transport=transport, capture=capture)
+
+    return SerialDataTransfer(transport=transport, capture=capture)
+
+
+## Polls several panels at once, each on its own I/O thread with its own link session.
+#
+# Each thread calls 'poll' with the panel's name, its link session, the shared record sink and an event
+# which is set when the supervisor is stopped. Replies from every panel are put on the one record sink,
+# so they are decoded and stored by a single pipeline.
+#
+# Each panel sets its own 'finished' event once its link session has been closed. join() waits on these,
+# rather than on the threads, as a thread whose join() was interrupted with Ctrl+C may be reported as no
+# longer alive while it is still running.
+class PanelSupervisor:
+    def __init__(self, panels: list, poll, sink: RecordSink):
+        self.panels = panels
+        self.poll = poll
+        self.sink = sink
+
+        self.links = dict()
+        self._threads = []
+        self._finished = []
+        self._stop_event = threading.Event()
+
+    ## Opens a link session to each panel and starts polling it.
+    def start(self):
+        self._stop_event.clear()
+
+        for panel in self.panels:
+            finished = threading.Event()
+            thread = threading.Thread(target=self._run_panel, args=(panel, finished), name=f"Panel-{panel['name']}",
+                                      daemon=True)
+            thread.start()
+            self._threads.append(thread)
+            self._finished.append(finished)
+
+    ## Waits until every panel has stopped being polled and its link session has been closed.
+    def join(self):
+        for finished in self._finished:
+            while not finished.wait(JOIN_INTERVAL):
+                pass
+
+    ## Asks every panel to stop being polled, and waits until they have.
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        self._threads.clear()
+        self._finished.clear()
+
+    ## Polls a single panel, then sets its 'finished' event, however polling ended.
+    #
+    # @param panel The panel, as returned by config.get_panels().
+    # @param finished An event which is set once the panel has finished.
+    def _run_panel(self, panel: dict, finished: threading.Event):
+        try:
+            self._poll_panel(panel)
+        finally:
+            finished.set()
+
+    ## Polls a single panel until the supervisor is stopped or the panel disconnects, then closes its link session.
+    #
+    # @param panel The panel, as returned by config.get_panels().
+    def _poll_panel(self, panel: dict):
+        name = panel["name"]
+        link = create_panel_link(panel)
+        self.links[name] = link
+
+        try:
+            self.poll(name, link, self.sink, self._stop_event)
+        except ConnectionError as error:
+            print(f"[{name}] Disconnected: {error}")
+        finally:
+            link.close()
+
+            if link.capture is not None:
+                link.capture.close()
+                print(f"[{name}] Captured {link.capture.record_count} record(s) to '{link.capture.path}'.")
+
+            print(f"[{name}] Serial port opened {link.open_count} time(s), closed {link.close_count} time(s).")
+            print(f"[{name}] Output coalescing: {link.get_coalescing_stats()}")
+
+            if isinstance(link, ThreadedSerialDataTransfer):
+                print(f"[{name}] Received frames dropped as the queue was full: {link.dropped_frame_count}")
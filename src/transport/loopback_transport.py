@@ -0,0 +1,32 @@
+## @file loopback_transport.py
+# @brief Contains LoopbackTransport, an in-memory transport whose other end is held by the caller.
+# @author Guy Chamberlain-Webber
+
+import socket
+
+from src.transport.socket_transport import SocketTransport
+
+
+## An in-memory transport, made from a connected pair of sockets.
+#
+# Whatever is written to the transport can be read from 'peer', and whatever is written to 'peer' can be
+# read from the transport. This lets a panel be played without a serial port or pseudo-terminal.
+class LoopbackTransport(SocketTransport):
+    def __init__(self):
+        super().__init__()
+        self.peer = None
+
+    ## Creates the pair of sockets, if not already created.
+    def open(self):
+        if self.is_open():
+            return
+
+        self.socket, self.peer = socket.socketpair()
+
+    ## Closes both ends of the transport, if they are open.
+    def close(self):
+        if self.peer is not None:
+            self.peer.close()
+            self.peer = None
+
+        super().close()
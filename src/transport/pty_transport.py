@@ -0,0 +1,81 @@
+## @file pty_transport.py
+# @brief Contains PtyTransport, which connects to the panel, or a simulated panel, through a pseudo-terminal.
+# @author Guy Chamberlain-Webber
+
+import os
+import sys
+import tty
+
+import src.config as config
+from src.exceptions.unsupported_platform import UnsupportedPlatformException
+from src.transport.transport import ITransport, READ_CHUNK_SIZE, read_connected, write_all_vectored
+
+
+## A transport connected to a pseudo-terminal.
+#
+# The terminal is put into raw mode, so bytes are passed through unchanged without any of the serial port
+# settings pyserial would otherwise apply.
+class PtyTransport(ITransport):
+    def __init__(self, path: str = None):
+        if sys.platform == "win32":
+            raise UnsupportedPlatformException("The pseudo-terminal transport is not supported on platforms of "
+                                               "type 'win32'.")
+
+        if path is None:
+            path = config.get_pty_path()
+
+        self.path = path
+        self.fd = None
+
+    ## Opens the pseudo-terminal, if it is not already open.
+    #
+    # If the pseudo-terminal can not be opened, the program exits.
+    def open(self):
+        if self.is_open():
+            return
+
+        try:
+            self.fd = os.open(self.path, os.O_RDWR | os.O_NOCTTY)
+        except OSError:
+            print(f"Unable to open pseudo-terminal: '{self.path}'.\nPlease make sure the correct path is specified.")
+            sys.exit()
+
+        tty.setraw(self.fd)
+
+    ## Closes the pseudo-terminal, if it is open.
+    def close(self):
+        if self.fd is None:
+            return
+
+        os.close(self.fd)
+        self.fd = None
+
+    ## Returns whether the pseudo-terminal is currently open.
+    #
+    # @return True if the pseudo-terminal is open, False if not.
+    def is_open(self) -> bool:
+        return self.fd is not None
+
+    ## Returns the file descriptor of the pseudo-terminal.
+    #
+    # @return The file descriptor.
+    def fileno(self):
+        return self.fd
+
+    ## Writes data to the pseudo-terminal.
+    #
+    # @param data The bytes to write.
+    def write(self, data: bytes):
+        self.writev([data])
+
+    ## Writes several buffers to the pseudo-terminal with a single writev() call, where possible.
+    #
+    # @param buffers The bytes to write.
+    def writev(self, buffers: list):
+        write_all_vectored(lambda remaining: os.writev(self.fd, remaining), buffers)
+
+    ## Reads every byte waiting on the pseudo-terminal.
+    #
+    # @return The bytes read.
+    def _read_waiting(self) -> bytes:
+        return read_connected(self, lambda: os.read(self.fd, READ_CHUNK_SIZE))
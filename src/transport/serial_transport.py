@@ -0,0 +1,130 @@
+## @file serial_transport.py
+# @brief Contains SerialTransport, which connects to the panel through a serial port using pyserial.
+# @author Guy Chamberlain-Webber
+
+import io
+import os
+import sys
+
+import serial
+
+import src.config as config
+from src.transport.transport import ITransport, read_connected, write_all_vectored
+
+
+## A transport connected to the panel's serial port.
+#
+# The configured COM port is used, unless a port is given.
+class SerialTransport(ITransport):
+    def __init__(self, timeout: float = None, port: str = None):
+        self.timeout = timeout
+        self.port = port
+        self.serial = None
+
+    ## Opens the configured serial port, if it is not already open.
+    def open(self):
+        if self.is_open():
+            return
+
+        self.serial = open_serial_port(self.timeout, self.port)
+
+    ## Closes the serial port, if it is open.
+    def close(self):
+        if self.serial is None:
+            return
+
+        self.serial.close()
+        self.serial = None
+
+    ## Returns whether the serial port is currently open.
+    #
+    # @return True if the serial port is open, False if not.
+    def is_open(self) -> bool:
+        return self.serial is not None
+
+    ## Returns the file descriptor of the serial port, if it has one which can be waited on.
+    #
+    # @return The file descriptor, or None on platforms where it is not available.
+    def fileno(self):
+        if sys.platform == "win32":
+            return None
+
+        try:
+            return self.serial.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            return None
+
+    ## Writes data to the serial port.
+    #
+    # @param data The bytes to write.
+    def write(self, data: bytes):
+        self.serial.write(data)
+
+    ## Writes several buffers to the serial port.
+    #
+    # @param buffers The bytes to write.
+    def writev(self, buffers: list):
+        fd = self.fileno()
+
+        if fd is None:
+            self.serial.write(b"".join(buffers))
+        else:
+            write_all_vectored(lambda remaining: os.writev(fd, remaining), buffers)
+
+    ## Waits up to 'timeout' seconds for bytes to arrive, then reads all of those waiting.
+    #
+    # @param timeout The maximum number of seconds to wait.
+    # @return The bytes read, which may be empty if none arrived in time.
+    def read_available(self, timeout: float) -> bytes:
+        if self.fileno() is None:
+            # The port can not be waited on with select(), so let the driver block instead. An empty read
+            # is then a timeout, so only a failed read is a disconnect.
+            self.serial.timeout = timeout
+
+            try:
+                return self._read_serial()
+            except OSError as error:
+                self.close()
+                raise ConnectionError(f"The connection was lost: {error}") from error
+
+        return super().read_available(timeout)
+
+    ## Reads every byte waiting on the serial port.
+    #
+    # @return The bytes read.
+    def _read_waiting(self) -> bytes:
+        return read_connected(self, self._read_serial)
+
+    ## Reads at least one byte from the serial port, and every other byte waiting.
+    #
+    # @return The bytes read, which are empty if the read timed out.
+    def _read_serial(self) -> bytes:
+        return self.serial.read(size=max(1, self.serial.in_waiting))
+
+
+## Opens the serial port configured in the configuration file.
+#
+# If the port can not be opened, the program exits.
+#
+# @param timeout The read timeout of the port. The configured timeout is used if not given.
+# @param port The name of the port. The configured COM port is used if not given.
+# @return The open serial port.
+def open_serial_port(timeout: float = None, port: str = None) -> serial.Serial:
+    if timeout is None:
+        timeout = config.get_timeout()
+
+    if port is None:
+        port = config.get_com_port()
+
+    try:
+        return serial.Serial(port=port,
+                             baudrate=config.get_baudrate(),
+                             timeout=timeout,
+                             bytesize=config.get_bytesize(),
+                             parity=config.get_parity(),
+                             stopbits=config.get_stopbits()
+                             )
+    except serial.SerialException:
+        print(f"Unable to open port: '{port}'.\nPlease make sure the correct port is specified "
+              f"and that it is not in use by another process.")
+        sys.exit()
@@ -0,0 +1,53 @@
+## @file socket_transport.py
+# @brief Contains SocketTransport, the base class of transports which connect to the panel through a socket.
+# @author Guy Chamberlain-Webber
+
+import abc
+
+from src.transport.transport import ITransport, READ_CHUNK_SIZE, read_connected, write_all_vectored
+
+
+## A transport connected to the panel through a stream socket.
+#
+# Subclasses create the socket in open().
+class SocketTransport(ITransport, abc.ABC):
+    def __init__(self):
+        self.socket = None
+
+    ## Closes the socket, if it is open.
+    def close(self):
+        if self.socket is None:
+            return
+
+        self.socket.close()
+        self.socket = None
+
+    ## Returns whether the socket is currently open.
+    #
+    # @return True if the socket is open, False if not.
+    def is_open(self) -> bool:
+        return self.socket is not None
+
+    ## Returns the file descriptor of the socket.
+    #
+    # @return The file descriptor.
+    def fileno(self):
+        return self.socket.fileno()
+
+    ## Writes data to the socket.
+    #
+    # @param data The bytes to write.
+    def write(self, data: bytes):
+        self.socket.sendall(data)
+
+    ## Writes several buffers to the socket with a single sendmsg() call, where possible.
+    #
+    # @param buffers The bytes to write.
+    def writev(self, buffers: list):
+        write_all_vectored(self.socket.sendmsg, buffers)
+
+    ## Reads every byte waiting on the socket.
+    #
+    # @return The bytes read.
+    def _read_waiting(self) -> bytes:
+        return read_connected(self, lambda: self.socket.recv(READ_CHUNK_SIZE))
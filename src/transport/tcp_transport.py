@@ -0,0 +1,48 @@
+## @file tcp_transport.py
+# @brief Contains TcpTransport, which connects to the panel through a serial-to-Ethernet converter.
+# @author Guy Chamberlain-Webber
+
+import socket
+import sys
+
+import src.config as config
+from src.transport.socket_transport import SocketTransport
+
+
+## A transport connected to the panel's serial port through a serial-to-Ethernet converter, over raw TCP.
+#
+# Nagle's algorithm is disabled, so each request is sent as soon as it is written rather than being held
+# back to be combined with later ones.
+class TcpTransport(SocketTransport):
+    def __init__(self, host: str = None, port: int = None, connect_timeout: float = None):
+        super().__init__()
+
+        if host is None:
+            host = config.get_tcp_host()
+
+        if port is None:
+            port = config.get_tcp_port()
+
+        if connect_timeout is None:
+            connect_timeout = config.get_tcp_connect_timeout()
+
+        self.host = host
+        self.port = port
+        self.connect_timeout = connect_timeout
+
+    ## Connects to the converter, if not already connected.
+    #
+    # If the connection can not be made, the program exits.
+    def open(self):
+        if self.is_open():
+            return
+
+        try:
+            self.socket = socket.create_connection((self.host, self.port), self.connect_timeout)
+        except OSError:
+            print(f"Unable to connect to: '{self.host}:{self.port}'.\nPlease make sure the correct host and port "
+                  f"are specified and that the converter is reachable.")
+            sys.exit()
+
+        self.socket.settimeout(None)
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
@@ -0,0 +1,119 @@
+## @file transport.py
+# @brief Contains interface ITransport, which is implemented by each of the ways of connecting to the panel.
+# @author Guy Chamberlain-Webber
+
+import abc
+import select
+
+# The maximum number of bytes read from a transport at once.
+READ_CHUNK_SIZE = 4096
+
+
+## An interface to a byte stream connected to the panel.
+#
+# Reads are done in bulk: once bytes arrive, everything waiting is read at once without blocking. Writes
+# may be vectored, so several frames can be passed to the operating system in a single call.
+class ITransport(abc.ABC):
+    ## Opens the transport, if it is not already open.
+    @abc.abstractmethod
+    def open(self):
+        pass
+
+    ## Closes the transport, if it is open.
+    @abc.abstractmethod
+    def close(self):
+        pass
+
+    ## Returns whether the transport is currently open.
+    #
+    # @return True if the transport is open, False if not.
+    @abc.abstractmethod
+    def is_open(self) -> bool:
+        pass
+
+    ## Returns the file descriptor of the transport, if it has one which can be waited on.
+    #
+    # @return The file descriptor, or None if it is not available.
+    @abc.abstractmethod
+    def fileno(self):
+        pass
+
+    ## Writes data to the transport.
+    #
+    # @param data The bytes to write.
+    @abc.abstractmethod
+    def write(self, data: bytes):
+        pass
+
+    ## Writes several buffers to the transport, in order, with as few system calls as possible.
+    #
+    # @param buffers The bytes to write.
+    @abc.abstractmethod
+    def writev(self, buffers: list):
+        pass
+
+    ## Reads every byte currently waiting, without blocking.
+    #
+    # This is only called once the transport is known to be readable, so a read which returns nothing, or
+    # fails, means the other end has gone away. The transport is then closed and ConnectionError raised,
+    # see read_connected().
+    #
+    # @return The bytes read.
+    @abc.abstractmethod
+    def _read_waiting(self) -> bytes:
+        pass
+
+    ## Waits up to 'timeout' seconds for bytes to arrive, then reads all of those waiting.
+    #
+    # @param timeout The maximum number of seconds to wait.
+    # @return The bytes read, which may be empty if none arrived in time.
+    def read_available(self, timeout: float) -> bytes:
+        readable, _, _ = select.select([self.fileno()], [], [], timeout)
+
+        if not readable:
+            return b""
+
+        return self._read_waiting()
+
+
+## Reads from a transport which is known to be readable, treating an empty or failed read as a disconnect.
+#
+# A readable transport with nothing to read has been closed by the other end, and a read which fails, such
+# as with EIO after a pseudo-terminal is hung up or a SerialException after a USB adapter is unplugged, can
+# not be retried. Either way, the transport is closed and ConnectionError raised.
+#
+# @param transport The transport being read.
+# @param read A function which reads the bytes waiting.
+# @return The bytes read, which are never empty.
+def read_connected(transport: ITransport, read) -> bytes:
+    try:
+        data = read()
+    except OSError as error:
+        transport.close()
+        raise ConnectionError(f"The connection was lost: {error}") from error
+
+    if not data:
+        transport.close()
+        raise ConnectionError("The connection was closed by the other end.")
+
+    return data
+
+
+## Writes every buffer using a vectored write function, continuing after any partial writes.
+#
+# @param write_vectored A function, such as os.writev() or socket.sendmsg(), which writes a list of buffers
+# and returns the number of bytes written.
+# @param buffers The bytes to write.
+def write_all_vectored(write_vectored, buffers: list):
+    buffers = [memoryview(buffer) for buffer in buffers if len(buffer) > 0]
+
+    while buffers:
+        written = write_vectored(buffers)
+
+        # Drop whatever was written from the front of the buffers.
+        while written > 0:
+            if written >= len(buffers[0]):
+                written -= len(buffers.pop(0))
+            else:
+                buffers[0] = buffers[0][written:]
+                written = 0
@@ -0,0 +1,38 @@
+## @file transport_factory.py
+# @brief Creates the transport chosen in the configuration file.
+# @author Guy Chamberlain-Webber
+
+import src.config as config
+from src.config import TransportType
+from src.transport.loopback_transport import LoopbackTransport
+from src.transport.pty_transport import PtyTransport
+from src.transport.serial_transport import SerialTransport
+from src.transport.tcp_transport import TcpTransport
+from src.transport.transport import ITransport
+
+
+## Creates the transport chosen in the configuration file. The transport is not opened.
+#
+# A panel's own transport settings may be given, see config.get_panels(). Any setting not given is taken
+# from the configuration file.
+#
+# @param timeout The read timeout of a serial port. The configured timeout is used if not given.
+# @param settings A panel's transport settings.
+# @return The transport.
+def create_transport(timeout: float = None, settings: dict = None) -> ITransport:
+    if settings is None:
+        settings = dict()
+
+    if "type" in settings:
+        transport_type = TransportType(settings["type"])
+    else:
+        transport_type = config.get_transport_type()
+
+    if transport_type is TransportType.TCP:
+        return TcpTransport(settings.get("host"), settings.get("port"), settings.get("connect-timeout"))
+    elif transport_type is TransportType.PTY:
+        return PtyTransport(settings.get("path"))
+    elif transport_type is TransportType.LOOPBACK:
+        return LoopbackTransport()
+
+    return SerialTransport(timeout, settings.get("port"))
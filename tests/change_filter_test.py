@@ -0,0 +1,80 @@
+## @file change_filter_test.py
+# @brief Contains tests to test the 'change_filter' file and class.
+# @author Guy Chamberlain-Webber
+
+import unittest
+
+import src.constants as constants
+from src.change_filter import ChangeFilter
+from src.exceptions.invalid_value import InvalidValueException
+from src.packet.packet_types import PointInformationReplyMX5
+
+
+## Returns a point information reply with the given values.
+#
+# @param values The value of each byte to set, keyed by the name of its index constant.
+# @return The reply.
+def create_reply(**values) -> PointInformationReplyMX5:
+    frame = bytearray(55)
+
+    for name, value in values.items():
+        frame[getattr(constants, name)] = value
+
+    return PointInformationReplyMX5(1, bytes(frame))
+
+
+## This test case tests the 'change_filter' file and class.
+class TestChangeFilter(unittest.TestCase):
+    # Test 1
+    def test_first_reply_recorded(self):
+        # This test ensures that the first reply from each point is recorded.
+
+        changes = ChangeFilter(10)
+
+        self.assertTrue(changes.should_record(1, create_reply()))
+        self.assertTrue(changes.should_record(2, create_reply()))
+        self.assertEqual(changes.get_stats(), {"changed": 2, "heartbeats": 0, "skipped": 0})
+
+    # Test 2
+    def test_unchanged_skipped(self):
+        # This test ensures that a reply whose dynamic bytes have not changed is skipped, even when its
+        # static bytes, SEQ or checksum differ.
+
+        changes = ChangeFilter(10)
+        changes.should_record(1, create_reply())
+
+        self.assertFalse(changes.should_record(1, create_reply()))
+        self.assertFalse(changes.should_record(1, create_reply(PIRMX5_DEVICE_TYPE_INDEX=0x02)))
+        self.assertEqual(changes.skipped_count, 2)
+
+    # Test 3
+    def test_changed_recorded(self):
+        # This test ensures that a change to any of the dynamic bytes is recorded.
+
+        changes = ChangeFilter(10)
+        changes.should_record(1, create_reply())
+
+        for name in ["PIRMX5_FLAGS_INDEX", "PIRMX5_RAW_ANALOGUE_VALUES1_INDEX", "PIRMX5_DIRTINESS_INDEX",
+                     "PIRMX5_OUTPUT_FORCED_STATE_INDEX"]:
+            self.assertTrue(changes.should_record(1, create_reply(**{name: 0x01})))
+            self.assertTrue(changes.should_record(1, create_reply()))
+
+    # Test 4
+    def test_heartbeat(self):
+        # This test ensures that an unchanged reply is still recorded once every 'heartbeat' polls.
+
+        changes = ChangeFilter(3)
+        changes.should_record(1, create_reply())
+
+        recorded = [changes.should_record(1, create_reply()) for _ in range(6)]
+
+        self.assertEqual(recorded, [False, False, True, False, False, True])
+        self.assertEqual(changes.heartbeat_count, 2)
+
+    # Test 5
+    def test_heartbeat_invalid(self):
+        # This test ensures that when the heartbeat is less than one poll, an InvalidValueException will be
+        # raised.
+
+        with self.assertRaises(InvalidValueException):
+            ChangeFilter(0)
@@ -250,12 +250,280 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(config.get_time_period(), this_config["time-period"])
 
     # Test 21
-    def test_get_polling_time_period(self):
-        # This test ensures that when the get_polling_time_period() function is called,
+    def test_get_transaction_window(self):
+        # This test ensures that when the get_transaction_window() function is called,
         # it will return the correct value.
         global this_config
 
-        self.assertEqual(config.get_polling_time_period(), this_config["polling-time-period"])
+        self.assertEqual(config.get_transaction_window(), this_config["transactions"]["window"])
+
+    # Test 22
+    def test_get_transaction_window_invalid(self):
+        # This test ensures that when the get_transaction_window() function is called with
+        # a window larger than the number of sequence numbers, an InvalidValueException will be raised.
+
+        # Hard-coded for test purposes.
+        config.config["transactions"]["window"] = 100
+
+        with self.assertRaises(InvalidValueException) as cm:
+            config.get_transaction_window()
+
+        exception = cm.exception
+        self.assertIsNotNone(exception)
+
+    # Test 23
+    def test_get_asyncio_enabled(self):
+        # This test ensures that when the get_asyncio_enabled() function is called,
+        # it will return the correct value.
+        global this_config
+
+        self.assertEqual(config.get_asyncio_enabled(), this_config["asyncio"])
+
+    # Test 24
+    def test_get_retransmission_timeouts(self):
+        # This test ensures that the get_initial_rto(), get_rto_floor() and get_rto_ceiling() functions
+        # will return the correct values.
+        global this_config
+
+        self.assertEqual(config.get_initial_rto(), this_config["retransmission"]["initial-timeout"])
+        self.assertEqual(config.get_rto_floor(), this_config["retransmission"]["minimum-timeout"])
+        self.assertEqual(config.get_rto_ceiling(), this_config["retransmission"]["maximum-timeout"])
+
+    # Test 25
+    def test_get_rto_ceiling_below_floor(self):
+        # This test ensures that when the maximum retransmission timeout is less than the minimum, an
+        # InvalidValueException will be raised.
+
+        # Hard-coded for test purposes.
+        config.config["retransmission"]["minimum-timeout"] = 10
+        config.config["retransmission"]["maximum-timeout"] = 1
+
+        with self.assertRaises(InvalidValueException) as cm:
+            config.get_rto_ceiling()
+
+        exception = cm.exception
+        self.assertIsNotNone(exception)
+
+    # Test 26
+    def test_get_retry(self):
+        # This test ensures that the retry configuration functions will return the correct values.
+        global this_config
+
+        self.assertEqual(config.get_retry_max_attempts(), this_config["retry"]["maximum-attempts"])
+        self.assertEqual(config.get_retry_base_delay(), this_config["retry"]["base-delay"])
+        self.assertEqual(config.get_retry_max_delay(), this_config["retry"]["maximum-delay"])
+        self.assertEqual(config.get_retry_jitter(), this_config["retry"]["jitter"])
+
+    # Test 27
+    def test_get_retry_jitter_invalid(self):
+        # This test ensures that when the retry jitter is not between 0 and 1, an InvalidValueException
+        # will be raised.
+
+        # Hard-coded for test purposes.
+        config.config["retry"]["jitter"] = 2
+
+        with self.assertRaises(InvalidValueException) as cm:
+            config.get_retry_jitter()
+
+        exception = cm.exception
+        self.assertIsNotNone(exception)
+
+    # Test 28
+    def test_get_circuit_breaker(self):
+        # This test ensures that the circuit breaker configuration functions will return the correct values.
+        global this_config
+
+        self.assertEqual(config.get_breaker_failure_threshold(),
+                         this_config["circuit-breaker"]["failure-threshold"])
+        self.assertEqual(config.get_breaker_probe_interval(), this_config["circuit-breaker"]["probe-interval"])
+
+    # Test 29
+    def test_get_transport(self):
+        # This test ensures that the transport configuration functions will return the correct values.
+        global this_config
+
+        self.assertEqual(config.get_transport_type().value, this_config["transport"]["type"])
+        self.assertEqual(config.get_tcp_host(), this_config["transport"]["tcp"]["host"])
+        self.assertEqual(config.get_tcp_port(), this_config["transport"]["tcp"]["port"])
+        self.assertEqual(config.get_tcp_connect_timeout(), this_config["transport"]["tcp"]["connect-timeout"])
+        self.assertEqual(config.get_pty_path(), this_config["transport"]["pty"]["path"])
+
+    # Test 30
+    def test_get_transport_type_invalid(self):
+        # This test ensures that when the get_transport_type() function is called with an unknown
+        # transport type, an InvalidValueException will be raised.
+
+        # Hard-coded for test purposes.
+        config.config["transport"]["type"] = "carrier-pigeon"
+
+        with self.assertRaises(InvalidValueException) as cm:
+            config.get_transport_type()
+
+        exception = cm.exception
+        self.assertIsNotNone(exception)
+
+    # Test 31
+    def test_get_output_queue_limit(self):
+        # This test ensures that when the get_output_queue_limit() function is called,
+        # it will return the correct value.
+        global this_config
+
+        self.assertEqual(config.get_output_queue_limit(), this_config["output-queue"]["maximum-frames"])
+
+    # Test 32
+    def test_get_threads(self):
+        # This test ensures that the threads configuration functions will return the correct values.
+        global this_config
+
+        self.assertEqual(config.get_link_threads_enabled(), this_config["threads"]["enabled"])
+        self.assertEqual(config.get_link_queue_size(), this_config["threads"]["link-queue-size"])
+        self.assertEqual(config.get_record_queue_size(), this_config["threads"]["record-queue-size"])
+
+    # Test 33
+    def test_get_threads_queue_size_invalid(self):
+        # This test ensures that when a queue size is less than one, an InvalidValueException will be raised.
+
+        # Hard-coded for test purposes.
+        config.config["threads"]["link-queue-size"] = 0
+
+        with self.assertRaises(InvalidValueException) as cm:
+            config.get_link_queue_size()
+
+        exception = cm.exception
+        self.assertIsNotNone(exception)
+
+    # Test 34
+    def test_get_panels(self):
+        # This test ensures that when the get_panels() function is called,
+        # it will return the correct value.
+        global this_config
+
+        self.assertEqual(config.get_panels(), this_config["panels"])
+
+    # Test 35
+    def test_get_panels_duplicate_name(self):
+        # This test ensures that when two panels share a name, an InvalidValueException will be raised.
+
+        # Hard-coded for test purposes.
+        config.config["panels"] = [{"name": "panel"}, {"name": "panel"}]
+
+        with self.assertRaises(InvalidValueException) as cm:
+            config.get_panels()
+
+        exception = cm.exception
+        self.assertIsNotNone(exception)
+
+    # Test 36
+    def test_get_capture_enabled(self):
+        # This test ensures that when the get_capture_enabled() function is called,
+        # it will return the correct value.
+        global this_config
+
+        self.assertEqual(config.get_capture_enabled(), this_config["capture"]["enabled"])
+
+    # Test 37
+    def test_get_capture_dir(self):
+        # This test ensures that when the get_capture_dir() function is called,
+        # it will return the correct value.
+        global this_config
+
+        self.assertEqual(config.get_capture_dir(), this_config["capture"]["directory"])
+
+    # Test 38
+    def test_get_decode_cache_capacity(self):
+        # This test ensures that when the get_decode_cache_capacity() function is called,
+        # it will return the correct value.
+        global this_config
+
+        self.assertEqual(config.get_decode_cache_capacity(), this_config["decode-cache"]["capacity"])
+
+    # Test 39
+    def test_get_decode_cache_capacity_invalid(self):
+        # This test ensures that when the decode cache capacity is negative, an InvalidValueException will be
+        # raised.
+
+        # Hard-coded for test purposes.
+        config.config["decode-cache"]["capacity"] = -1
+
+        with self.assertRaises(InvalidValueException) as cm:
+            config.get_decode_cache_capacity()
+
+        exception = cm.exception
+        self.assertIsNotNone(exception)
+
+    # Test 40
+    def test_get_change_filter(self):
+        # This test ensures that the change filter configuration functions will return the correct values.
+        global this_config
+
+        self.assertEqual(config.get_change_filter_enabled(), this_config["change-filter"]["enabled"])
+        self.assertEqual(config.get_heartbeat_cycles(), this_config["change-filter"]["heartbeat-cycles"])
+
+    # Test 41
+    def test_get_change_filter_heartbeat_invalid(self):
+        # This test ensures that when the heartbeat is less than one cycle, an InvalidValueException will be
+        # raised.
+
+        # Hard-coded for test purposes.
+        config.config["change-filter"]["heartbeat-cycles"] = 0
+
+        with self.assertRaises(InvalidValueException) as cm:
+            config.get_heartbeat_cycles()
+
+        exception = cm.exception
+        self.assertIsNotNone(exception)
+
+    # Test 42
+    def test_get_discovery(self):
+        # This test ensures that the discovery configuration functions will return the correct values.
+        global this_config
+
+        self.assertEqual(config.get_discovery_wildcard_enabled(), this_config["discovery"]["wildcard"])
+        self.assertEqual(config.get_discovery_gap_limit(), this_config["discovery"]["gap-limit"])
+        self.assertEqual(config.get_discovery_max_attempts(), this_config["discovery"]["maximum-attempts"])
+
+    # Test 43
+    def test_get_discovery_gap_limit_invalid(self):
+        # This test ensures that when the gap limit is negative, an InvalidValueException will be raised.
+
+        # Hard-coded for test purposes.
+        config.config["discovery"]["gap-limit"] = -1
+
+        with self.assertRaises(InvalidValueException) as cm:
+            config.get_discovery_gap_limit()
+
+        exception = cm.exception
+        self.assertIsNotNone(exception)
+
+    # Test 44
+    def test_get_inventory(self):
+        # This test ensures that the inventory configuration functions will return the correct values.
+        global this_config
+
+        self.assertEqual(config.get_inventory_enabled(), this_config["inventory"]["enabled"])
+        self.assertEqual(config.get_inventory_dir(), this_config["inventory"]["directory"])
+        self.assertEqual(config.get_inventory_revalidation_batch(), this_config["inventory"]["revalidation-batch"])
+
+    # Test 45
+    def test_get_inventory_revalidation_batch_invalid(self):
+        # This test ensures that when the revalidation batch is negative, an InvalidValueException will be
+        # raised.
+
+        # Hard-coded for test purposes.
+        config.config["inventory"]["revalidation-batch"] = -1
+
+        with self.assertRaises(InvalidValueException) as cm:
+            config.get_inventory_revalidation_batch()
+
+        exception = cm.exception
+        self.assertIsNotNone(exception)
+
+    # Test 46
+    def test_get_unit_conversion(self):
+        # This test ensures that the unit conversion configuration function will return the correct value.
+        global this_config
+
+        self.assertEqual(config.get_unit_conversion_enabled(), this_config["unit-conversion"]["enabled"])
 
     @classmethod
     def tearDownClass(cls) -> None:
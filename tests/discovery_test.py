@@ -0,0 +1,128 @@
+## @file discovery_test.py
+# @brief Contains tests to test the 'discovery' file and class.
+# @author Guy Chamberlain-Webber
+
+import asyncio
+import time
+import unittest
+
+from src.discovery import PointDiscovery
+from src.exceptions.invalid_value import InvalidValueException
+from src.packet.async_serial_data_transfer import AsyncSerialDataTransfer
+from src.packet.retry_policy import RetryPolicy
+from src.packet.rtt_estimator import RetransmitTimers
+from src.packet.serial_data_transfer import SerialDataTransfer
+from src.packet.transaction_engine import TransactionEngine
+from src.simulator.panel_simulator import PanelSimulator
+from src.transport.pty_transport import PtyTransport
+
+# The points with a device on the simulated panel.
+DEVICES = {0: 0x02, 1: 0x0d, 2: 0x02, 5: 0x10, 9: 0x02}
+
+
+## This test case tests the 'discovery' file and class.
+class TestPointDiscovery(unittest.TestCase):
+    ## Starts a simulated panel and connects a link to it.
+    #
+    # @param wildcard Whether the panel answers a request for every point.
+    # @param silent Whether the panel never answers a request for a point with no device.
+    # @return The link.
+    def connect(self, wildcard: bool = False, silent: bool = False) -> SerialDataTransfer:
+        simulator = PanelSimulator(devices=DEVICES, wildcard=wildcard, silent=silent)
+        simulator.start()
+        self.addCleanup(simulator.stop)
+        self.simulator = simulator
+
+        link = SerialDataTransfer(transport=PtyTransport(simulator.port_name))
+        self.addCleanup(link.close)
+
+        return link
+
+    ## Creates a discovery with short timeouts.
+    #
+    # @param link The link session to send and receive packets with.
+    # @param wildcard Whether to request every point at once first.
+    # @param gap_limit The number of points in a row with no device before the sweep stops.
+    # @return The discovery.
+    def create_discovery(self, link, wildcard: bool, gap_limit: int) -> PointDiscovery:
+        engine = TransactionEngine(link, window=8, timers=RetransmitTimers(0.2, 0.05, 1.0),
+                                   retry_policy=RetryPolicy(2, 0.01, 0.01, 0.0))
+
+        return PointDiscovery(link, wildcard, gap_limit, engine)
+
+    # Test 1
+    def test_sweep(self):
+        # This test ensures that a sweep with no gap limit probes every point and finds each device.
+
+        discovery = self.create_discovery(self.connect(), False, 0)
+
+        self.assertEqual(discovery.run(), sorted(DEVICES))
+        self.assertEqual(discovery.probe_count, 251)
+
+    # Test 2
+    def test_gap_limit(self):
+        # This test ensures that the sweep stops once the gap limit is reached after the last device, having
+        # probed fewer than every point.
+
+        discovery = self.create_discovery(self.connect(), False, 16)
+
+        self.assertEqual(discovery.run(), sorted(DEVICES))
+        self.assertEqual(discovery.probe_count, 32)
+
+    # Test 3
+    def test_wildcard(self):
+        # This test ensures that a panel which answers a request for every point is discovered with that
+        # single request.
+
+        discovery = self.create_discovery(self.connect(wildcard=True), True, 16)
+
+        self.assertEqual(discovery.run(), sorted(DEVICES))
+        self.assertEqual(discovery.probe_count, 0)
+        self.assertEqual(self.simulator.request_count, 1)
+
+    # Test 4
+    def test_wildcard_unsupported(self):
+        # This test ensures that when the panel does not answer a request for every point, the points are
+        # swept instead.
+
+        discovery = self.create_discovery(self.connect(wildcard=False), True, 16)
+
+        self.assertEqual(discovery.run(), sorted(DEVICES))
+        self.assertEqual(discovery.probe_count, 32)
+
+    # Test 5
+    def test_async(self):
+        # This test ensures that points are discovered the same way from an asyncio event loop.
+
+        simulator = PanelSimulator(devices=DEVICES, wildcard=True)
+        simulator.start()
+        self.addCleanup(simulator.stop)
+
+        async def discover():
+            async with AsyncSerialDataTransfer(transport=PtyTransport(simulator.port_name)) as link:
+                discovery = self.create_discovery(link, True, 16)
+                return await discovery.run_async(), await discovery.sweep_async()
+
+        self.assertEqual(asyncio.run(discover()), (sorted(DEVICES), sorted(DEVICES)))
+
+    # Test 6
+    def test_invalid_gap_limit(self):
+        # This test ensures that a negative gap limit is rejected.
+
+        with self.assertRaises(InvalidValueException):
+            PointDiscovery(None, False, -1, engine=object())
+
+    # Test 7
+    def test_sweep_silent_points(self):
+        # This test ensures that with the default engine, a sweep of a panel which never answers for points
+        # with no device probes each of them once, and is not slowed by their timeouts backing off.
+
+        discovery = PointDiscovery(self.connect(silent=True), False, 0)
+
+        start = time.monotonic()
+        valid_points = discovery.run()
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(valid_points, sorted(DEVICES))
+        self.assertEqual(self.simulator.request_count, 251)
+        self.assertLess(elapsed, 10)
@@ -0,0 +1,153 @@
+## @file inventory_test.py
+# @brief Contains tests to test the 'inventory' file and classes.
+# @author Guy Chamberlain-Webber
+
+import os
+import tempfile
+import unittest
+
+from src.inventory import InventoryEntry, InventoryRevalidator, PointInventory, load_inventory, open_inventory, \
+    read_panel_identity
+from src.packet.packet_types import PointInformationRequestMX5
+from src.packet.retry_policy import RetryPolicy
+from src.packet.rtt_estimator import RetransmitTimers
+from src.packet.serial_data_transfer import SerialDataTransfer
+from src.packet.transaction_engine import TransactionEngine
+from src.simulator.panel_simulator import PanelSimulator
+from src.transport.pty_transport import PtyTransport
+
+
+## This test case tests the 'inventory' file and classes.
+class TestPointInventory(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "panel.inv")
+
+    ## Starts a simulated panel and creates a transaction engine connected to it.
+    #
+    # @param devices The device type of each point on the panel, keyed by point number.
+    # @return The transaction engine.
+    def connect(self, devices: dict) -> TransactionEngine:
+        simulator = PanelSimulator(devices=devices)
+        simulator.start()
+        self.addCleanup(simulator.stop)
+
+        link = SerialDataTransfer(transport=PtyTransport(simulator.port_name))
+        self.addCleanup(link.close)
+
+        return TransactionEngine(link, window=8, timers=RetransmitTimers(0.2, 0.05, 1.0),
+                                 retry_policy=RetryPolicy(2, 0.01, 0.01, 0.0))
+
+    # Test 1
+    def test_save_and_load(self):
+        # This test ensures that an inventory read back from its file holds the same identity and entries.
+
+        inventory = PointInventory(self.path, b"\x01\x02\x03")
+        inventory.add(InventoryEntry(4, 0x02, 1, 1))
+        inventory.add(InventoryEntry(2, 0x0d, 3, 2))
+        inventory.save()
+
+        loaded = load_inventory(self.path)
+
+        self.assertEqual(loaded.identity, b"\x01\x02\x03")
+        self.assertEqual(loaded.get_points(), [2, 4])
+        self.assertEqual(loaded.get_entry(2), InventoryEntry(2, 0x0d, 3, 2))
+        self.assertFalse(loaded.changed)
+        self.assertEqual(os.path.getsize(self.path), 8 + 4 + 3 + 2 * 4)
+
+    # Test 2
+    def test_load_invalid(self):
+        # This test ensures that a missing, truncated or foreign file is not loaded.
+
+        self.assertIsNone(load_inventory(self.path))
+
+        inventory = PointInventory(self.path, b"\x01")
+        inventory.add(InventoryEntry(1, 0x02, 1, 1))
+        inventory.save()
+
+        with open(self.path, "rb") as file:
+            data = file.read()
+
+        for invalid in [data[:-1], data[:4], b"NOTANINV" + data[8:]]:
+            with open(self.path, "wb") as file:
+                file.write(invalid)
+
+            self.assertIsNone(load_inventory(self.path))
+
+    # Test 3
+    def test_open_identity(self):
+        # This test ensures that a cached inventory is only used when it was found on the same panel, or the
+        # panel's identity is not known.
+
+        inventory = PointInventory(self.path, b"\x01")
+        inventory.add(InventoryEntry(1, 0x02, 1, 1))
+        inventory.save()
+
+        self.assertEqual(open_inventory(self.path, b"\x01").get_points(), [1])
+        self.assertEqual(open_inventory(self.path, None).get_points(), [1])
+
+        other = open_inventory(self.path, b"\x02")
+        self.assertEqual(len(other), 0)
+        self.assertEqual(other.identity, b"\x02")
+
+    # Test 4
+    def test_record(self):
+        # This test ensures that a point is added or updated by a successful reply, removed by a failed one,
+        # and that the inventory is only marked as changed when an entry changes.
+
+        engine = self.connect({1: 0x02, 2: 0x0d})
+        inventory = PointInventory(self.path)
+
+        requests = [PointInformationRequestMX5(point, engine.link) for point in (1, 2, 3)]
+        for transaction in engine.run(requests):
+            inventory.record(transaction.get_point(), transaction.reply)
+
+        self.assertEqual(inventory.get_points(), [1, 2])
+        self.assertEqual(inventory.get_entry(2).device_type, 0x0d)
+        self.assertTrue(inventory.save_if_changed())
+
+        for transaction in engine.run(requests):
+            inventory.record(transaction.get_point(), transaction.reply)
+
+        self.assertFalse(inventory.save_if_changed())
+
+        inventory.add(InventoryEntry(3, 0x02, 1, 1))
+        inventory.record(3, engine.run(requests[2:])[0].reply)
+
+        self.assertEqual(inventory.get_points(), [1, 2])
+
+    # Test 5
+    def test_revalidator(self):
+        # This test ensures that the revalidator probes only the points which are not in the inventory, a
+        # batch at a time, and adds any devices it finds.
+
+        engine = self.connect({1: 0x02, 7: 0x02, 40: 0x10})
+        inventory = PointInventory(self.path)
+        inventory.add(InventoryEntry(1, 0x02, 1, 1))
+
+        revalidator = InventoryRevalidator(inventory, engine, 4)
+
+        revalidator.probe()
+        self.assertEqual(inventory.get_points(), [1])
+        self.assertEqual(revalidator._next_point, 5)
+
+        revalidator.probe()
+        self.assertEqual(inventory.get_points(), [1, 7])
+
+        while 40 not in inventory:
+            revalidator.probe()
+
+        self.assertEqual(inventory.get_points(), [1, 7, 40])
+
+    # Test 6
+    def test_read_panel_identity(self):
+        # This test ensures that a panel's identity is read from its panel details reply, and is the same
+        # each time.
+
+        engine = self.connect({1: 0x02})
+
+        identity = read_panel_identity(engine)
+
+        self.assertIsNotNone(identity)
+        self.assertEqual(read_panel_identity(engine), identity)
@@ -23,7 +23,7 @@ class TestLog(unittest.TestCase):
         log_dir = config.get_log_dir()
 
         if os.path.exists(log_dir):
-            os.rmdir(log_dir)
+            shutil.rmtree(log_dir)
 
     # Test 1
     def test_create_log_dir_no_exist(self):
@@ -68,6 +68,26 @@ class TestLog(unittest.TestCase):
         with open("{}/{}".format(log_dir_name, test_logfile), "r") as fd:
             self.assertEqual(fd.read(), time.strftime("%d/%m/%Y @ %H:%M:%S - ", time.gmtime()) + test_entry + "\n")
 
+    # Test 4
+    def test_write_logs(self):
+        # This test ensures that the write_logs() function writes each entry on its own line, with the same
+        # time and date, to the designated log file.
+
+        log_dir_name = config.get_log_dir()
+
+        test_entries = ["first test entry", "second test entry"]
+        test_logfile = "test_logfile.txt"
+
+        log.create_log_dir()
+        log.write_logs(test_entries, test_logfile)
+
+        with open("{}/{}".format(log_dir_name, test_logfile), "r") as fd:
+            lines = fd.read().splitlines()
+
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[0][:24], lines[1][:24])
+        self.assertEqual([line[24:] for line in lines], test_entries)
+
     @classmethod
     def tearDownClass(cls) -> None:
         # Remove test log directory
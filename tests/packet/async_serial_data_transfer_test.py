@@ -0,0 +1,147 @@
+## @file async_serial_data_transfer_test.py
+# @brief Contains tests to test the 'async_serial_data_transfer' file and class.
+# @author Guy Chamberlain-Webber
+
+import asyncio
+import errno
+import os
+import pty
+import time
+import tty
+import unittest
+from unittest.mock import patch
+
+import src.constants as constants
+from src.packet.async_serial_data_transfer import AsyncSerialDataTransfer
+from src.packet.headers import LocalHeaderMX5
+from src.packet.packet import Packet
+from src.packet.packet_ids import PacketID
+from src.transport.loopback_transport import LoopbackTransport
+
+
+## Creates a valid frame.
+#
+# @param seq The sequence number of the frame.
+# @return The frame.
+def make_frame(seq: int = 0x01) -> bytes:
+    return bytes(Packet(LocalHeaderMX5(PacketID.POINT_INFO_REPLY), value1=1, value2=2).get_byte_array(seq))
+
+
+## This test case tests the 'async_serial_data_transfer' file and class.
+class TestAsyncSerialDataTransfer(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        # The link is opened on the slave end of a pseudo-terminal, the test plays the panel on the master end.
+        self.master, slave = pty.openpty()
+        tty.setraw(self.master)
+        self.slave_name = os.ttyname(slave)
+        os.close(slave)
+
+        self.com_patch = patch("src.config.get_com_port", return_value=self.slave_name)
+        self.com_patch.start()
+
+    def tearDown(self) -> None:
+        self.com_patch.stop()
+
+        if self.master is not None:
+            os.close(self.master)
+
+    # Test 1
+    async def test_open_close(self):
+        # This test ensures that the link session can be opened and closed, and that this is counted.
+
+        link = AsyncSerialDataTransfer()
+
+        async with link:
+            self.assertTrue(link.is_open())
+
+        self.assertFalse(link.is_open())
+        self.assertEqual(link.open_count, 1)
+        self.assertEqual(link.close_count, 1)
+
+    # Test 2
+    async def test_read_frame(self):
+        # This test ensures that a frame arriving in several pieces is returned once it is complete.
+
+        frame = make_frame()
+
+        async with AsyncSerialDataTransfer() as link:
+            os.write(self.master, bytes([constants.ACK]) + frame[:5])
+            await asyncio.sleep(0.05)
+            os.write(self.master, frame[5:])
+
+            self.assertEqual((await link.read_frame(time.monotonic() + 1)).frame, frame)
+
+    # Test 3
+    async def test_read_frame_timeout(self):
+        # This test ensures that when no frame arrives, read_frame() returns a timeout result once the deadline passes.
+
+        async with AsyncSerialDataTransfer() as link:
+            self.assertTrue((await link.read_frame(time.monotonic() + 0.05)).is_timeout())
+
+    # Test 4
+    async def test_packet_round_trip(self):
+        # This test ensures that a packet written asynchronously reaches the port, and that its reply
+        # is read and acknowledged once the link is drained.
+
+        reply = make_frame(seq=0x05)
+
+        async with AsyncSerialDataTransfer() as link:
+            packet = Packet(LocalHeaderMX5(PacketID.POINT_INFO_REQUEST), link=link, value=3)
+            sent = bytes(packet.get_byte_array())
+
+            await packet.write_async()
+            self.assertEqual(os.read(self.master, 1024), sent)
+
+            os.write(self.master, reply)
+            self.assertEqual(await packet.read_async(), list(reply))
+
+            # The ACK is queued to be sent with the next packet, so drain the link to send it now.
+            await link.drain()
+            self.assertEqual(os.read(self.master, 1024), bytes([constants.ACK]))
+
+    # Test 5
+    async def test_read_frame_disconnected(self):
+        # This test ensures that when the other end closes the connection, the frames received before then
+        # are still read, then ConnectionError is raised and the transport is closed.
+
+        transport = LoopbackTransport()
+        frame = make_frame()
+
+        async with AsyncSerialDataTransfer(transport=transport) as link:
+            transport.peer.sendall(frame)
+            transport.peer.close()
+
+            self.assertEqual((await link.read_frame(time.monotonic() + 1)).frame, frame)
+
+            with self.assertRaises(ConnectionError):
+                await link.read_frame(time.monotonic() + 1)
+
+            self.assertFalse(link.is_open())
+
+    # Test 6
+    async def test_read_frame_hang_up(self):
+        # This test ensures that when the port is hung up, read_frame() raises ConnectionError and the port
+        # is closed.
+
+        async with AsyncSerialDataTransfer() as link:
+            os.close(self.master)
+            self.master = None
+
+            with self.assertRaises(ConnectionError):
+                await link.read_frame(time.monotonic() + 1)
+
+            self.assertFalse(link.is_open())
+
+    # Test 7
+    async def test_read_frame_read_error(self):
+        # This test ensures that when reading the port fails, such as with EIO, read_frame() raises
+        # ConnectionError and the port is closed, rather than the error escaping the event loop.
+
+        async with AsyncSerialDataTransfer() as link:
+            with patch("src.packet.async_serial_data_transfer.os.read", side_effect=OSError(errno.EIO, "EIO")):
+                os.write(self.master, bytes([constants.ACK]))
+
+                with self.assertRaises(ConnectionError):
+                    await link.read_frame(time.monotonic() + 1)
+
+            self.assertFalse(link.is_open())
@@ -0,0 +1,91 @@
+## @file batch_decode_test.py
+# @brief Contains tests to test the 'batch_decode' file.
+# @author Guy Chamberlain-Webber
+
+import os
+import tempfile
+import unittest
+
+import src.constants as constants
+from src.config import MXSpeakVersion
+from src.exceptions.invalid_value import InvalidValueException
+from src.packet.batch_decode import checksum_mask, decode_replies, get_reply_size, read_capture_replies
+from src.packet.capture import CaptureDirection, CaptureWriter
+from src.packet.packet_types import PointInformationRequestMX5, PointInformationRequestMX6
+from src.simulator.panel_simulator import PanelSimulator, create_devices
+
+# The request type of each version.
+REQUEST_TYPES = {
+    MXSpeakVersion.MX_SPEAK5: PointInformationRequestMX5,
+    MXSpeakVersion.MX_SPEAK6: PointInformationRequestMX6
+}
+
+
+## Creates a reply from the simulator for each point.
+#
+# @param version The MX Speak version of the replies.
+# @param count The number of points.
+# @return A list of the replies.
+def create_replies(version: MXSpeakVersion, count: int) -> list:
+    simulator = PanelSimulator(version, devices=create_devices(count // 2, seed=1))
+    request_type = REQUEST_TYPES[version]
+
+    return [simulator.create_reply(request_type(point).encode(point % constants.SEQ_WRAP + 1))
+            for point in range(count)]
+
+
+## This test case tests the 'batch_decode' file.
+class TestBatchDecode(unittest.TestCase):
+    # Test 1
+    def test_decode_replies(self):
+        # This test ensures that each field of each reply decoded in a batch matches the reply decoded on
+        # its own.
+
+        for version in MXSpeakVersion:
+            frames = create_replies(version, 20)
+            replies = decode_replies(b"".join(frames), version)
+
+            self.assertEqual(len(replies), 20)
+            self.assertEqual(get_reply_size(version), len(frames[0]))
+
+            for frame, decoded in zip(frames, replies):
+                reply = REQUEST_TYPES[version](0).create_reply(frame)
+
+                for name, value in reply.get_parameters().items():
+                    self.assertEqual(decoded[name], value)
+
+    # Test 2
+    def test_checksum_mask(self):
+        # This test ensures that only replies with an invalid checksum are flagged.
+
+        frames = create_replies(MXSpeakVersion.MX_SPEAK5, 5)
+        frames[3] = frames[3][:-1] + bytes([(frames[3][-1] + 1) % 256])
+
+        self.assertEqual(checksum_mask(b"".join(frames), MXSpeakVersion.MX_SPEAK5).tolist(),
+                         [True, True, True, False, True])
+
+    # Test 3
+    def test_invalid_length(self):
+        # This test ensures that a buffer which is not a whole number of replies is rejected.
+
+        frames = create_replies(MXSpeakVersion.MX_SPEAK5, 2)
+
+        self.assertRaises(InvalidValueException, decode_replies, b"".join(frames)[:-1], MXSpeakVersion.MX_SPEAK5)
+
+    # Test 4
+    def test_read_capture_replies(self):
+        # This test ensures that only the point information replies received are collected from a capture file.
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "panel.cap")
+
+        frames = create_replies(MXSpeakVersion.MX_SPEAK5, 3)
+
+        with CaptureWriter(path) as capture:
+            for point, frame in enumerate(frames):
+                capture.record(CaptureDirection.TX, PointInformationRequestMX5(point).encode(1))
+                capture.record(CaptureDirection.RX, frame)
+                capture.record(CaptureDirection.TX, bytes([constants.ACK]))
+
+        self.assertEqual(read_capture_replies(path, MXSpeakVersion.MX_SPEAK5), b"".join(frames))
@@ -0,0 +1,187 @@
+## @file capture_test.py
+# @brief Contains tests to test the 'capture' file and classes.
+# @author Guy Chamberlain-Webber
+
+import os
+import tempfile
+import time
+import unittest
+
+import src.constants as constants
+from src.config import MXSpeakVersion
+from src.packet.capture import CAPTURE_MAGIC, CaptureDirection, CaptureReader, CaptureWriter, RECORD_HEADER, \
+    replay
+from src.packet.packet_types import PointInformationReplyMX6, PointInformationRequestMX5, \
+    PointInformationRequestMX6
+from src.packet.serial_data_transfer import SerialDataTransfer
+from src.simulator.panel_simulator import PanelSimulator
+from src.transport.loopback_transport import LoopbackTransport
+
+
+## This test case tests the 'capture' file and classes.
+class TestCapture(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        self.path = os.path.join(directory.name, "panel.cap")
+
+    ## Reads every record in the capture file, copying each frame.
+    #
+    # @return A list of (direction, timestamp, frame) tuples.
+    def read_records(self) -> list:
+        with CaptureReader(self.path) as reader:
+            return [(record.direction, record.timestamp_ns, bytes(record.frame)) for record in reader]
+
+    # Test 1
+    def test_round_trip(self):
+        # This test ensures that frames written to a capture file are read back in order, with their direction
+        # and timestamp.
+
+        with CaptureWriter(self.path) as capture:
+            capture.record(CaptureDirection.TX, b"\x01\x02\x03", 100)
+            capture.record(CaptureDirection.RX, bytes([constants.ACK]), 200)
+
+        self.assertEqual(self.read_records(), [(CaptureDirection.TX, 100, b"\x01\x02\x03"),
+                                               (CaptureDirection.RX, 200, bytes([constants.ACK]))])
+
+    # Test 2
+    def test_append(self):
+        # This test ensures that reopening a capture file appends to it, rather than starting it again.
+
+        with CaptureWriter(self.path) as capture:
+            capture.record(CaptureDirection.TX, b"\x01", 1)
+
+        with CaptureWriter(self.path) as capture:
+            capture.record(CaptureDirection.TX, b"\x02", 2)
+
+        self.assertEqual([frame for _, _, frame in self.read_records()], [b"\x01", b"\x02"])
+
+    # Test 3
+    def test_truncated_record(self):
+        # This test ensures that a record cut short at the end of the file is ignored.
+
+        with CaptureWriter(self.path) as capture:
+            capture.record(CaptureDirection.RX, b"\x01\x02", 1)
+            capture.record(CaptureDirection.RX, b"\x03\x04", 2)
+
+        with open(self.path, "r+b") as fd:
+            fd.truncate(os.path.getsize(self.path) - 1)
+
+        self.assertEqual(self.read_records(), [(CaptureDirection.RX, 1, b"\x01\x02")])
+
+        with open(self.path, "r+b") as fd:
+            fd.truncate(len(CAPTURE_MAGIC) + RECORD_HEADER.size + 2 + RECORD_HEADER.size // 2)
+
+        self.assertEqual(len(self.read_records()), 1)
+
+    # Test 4
+    def test_not_capture_file(self):
+        # This test ensures that a file which is not a capture file is rejected.
+
+        with open(self.path, "wb") as fd:
+            fd.write(b"not a capture file")
+
+        self.assertRaises(ValueError, CaptureReader, self.path)
+
+    # Test 5
+    def test_frames_are_views(self):
+        # This test ensures that each frame read is a view into the capture file, rather than a copy.
+
+        with CaptureWriter(self.path) as capture:
+            capture.record(CaptureDirection.TX, b"\x01\x02", 1)
+
+        with CaptureReader(self.path) as reader:
+            record = next(iter(reader))
+
+            self.assertIsInstance(record.frame, memoryview)
+            self.assertEqual(record.frame.obj, reader._view.obj)
+
+            del record
+
+    # Test 6
+    def test_link_capture(self):
+        # This test ensures that a link records each frame it sends, and each frame it receives, with
+        # non-decreasing timestamps.
+
+        transport = LoopbackTransport()
+        capture = CaptureWriter(self.path)
+        link = SerialDataTransfer(transport=transport, capture=capture)
+
+        request = bytes(PointInformationRequestMX5(3).packet.get_byte_array(1))
+        reply = PanelSimulator(devices={3: 0x0d}).create_reply(request)
+
+        link.write(request)
+        transport.peer.sendall(reply)
+        link.read_frame(time.monotonic() + 1)
+        link.write_byte(constants.ACK)
+
+        link.close()
+        capture.close()
+
+        records = self.read_records()
+
+        self.assertEqual([(direction, frame) for direction, _, frame in records],
+                         [(CaptureDirection.TX, request), (CaptureDirection.RX, reply),
+                          (CaptureDirection.TX, bytes([constants.ACK]))])
+        self.assertEqual([timestamp for _, timestamp, _ in records],
+                         sorted(timestamp for _, timestamp, _ in records))
+
+    # Test 7
+    def test_replay(self):
+        # This test ensures that replaying a capture file decodes each point information reply received, and
+        # nothing which was sent.
+
+        simulator = PanelSimulator(devices={3: 0x02, 4: 0x02})
+
+        with CaptureWriter(self.path) as capture:
+            for point in [3, 4]:
+                request = bytes(PointInformationRequestMX5(point).packet.get_byte_array(1))
+                capture.record(CaptureDirection.TX, request)
+                capture.record(CaptureDirection.RX, simulator.create_reply(request))
+
+        replies = []
+
+        self.assertEqual(replay(self.path, lambda reply: replies.append(reply.get_as_csv())), 2)
+        self.assertEqual(len(replies), 2)
+
+    # Test 8
+    def test_link_capture_raw(self):
+        # This test ensures that a link records the bytes it receives exactly as they were read, including
+        # those which do not form a valid frame.
+
+        transport = LoopbackTransport()
+        capture = CaptureWriter(self.path)
+        link = SerialDataTransfer(transport=transport, capture=capture)
+
+        request = bytes(PointInformationRequestMX5(3).packet.get_byte_array(1))
+        reply = PanelSimulator(devices={3: 0x0d}).create_reply(request)
+        corrupted = reply[:-1] + bytes([(reply[-1] + 1) % 256])
+
+        transport.peer.sendall(corrupted + reply)
+        link.read_frame(time.monotonic() + 1)
+
+        link.close()
+        capture.close()
+
+        self.assertEqual([(direction, frame) for direction, _, frame in self.read_records()],
+                         [(CaptureDirection.RX, corrupted + reply)])
+
+    # Test 9
+    def test_replay_chunks(self):
+        # This test ensures that replaying a capture file splits the bytes received into frames, however they
+        # were read, and decodes each reply with the indices of its own version.
+
+        request = PointInformationRequestMX6(4).encode(1)
+        reply = PanelSimulator(MXSpeakVersion.MX_SPEAK6, devices={4: 0x02}).create_reply(request)
+
+        with CaptureWriter(self.path) as capture:
+            capture.record(CaptureDirection.TX, request)
+            capture.record(CaptureDirection.RX, bytes([constants.ACK]) + reply[:10])
+            capture.record(CaptureDirection.RX, reply[10:] + reply)
+
+        replies = []
+
+        self.assertEqual(replay(self.path, replies.append), 2)
+        self.assertTrue(all(isinstance(reply, PointInformationReplyMX6) for reply in replies))
+        self.assertEqual([reply.point_number for reply in replies], [4, 4])
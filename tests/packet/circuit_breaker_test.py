@@ -0,0 +1,66 @@
+## @file circuit_breaker_test.py
+# @brief Contains tests to test the 'circuit_breaker' file and classes.
+# @author Guy Chamberlain-Webber
+
+import unittest
+
+from src.packet.circuit_breaker import BreakerState, CircuitBreaker, PointBreakers
+
+
+## This test case tests the 'circuit_breaker' file and classes.
+class TestCircuitBreaker(unittest.TestCase):
+    # Test 1
+    def test_opens_after_threshold(self):
+        # This test ensures that the breaker only opens once the failure threshold has been reached.
+
+        breaker = CircuitBreaker(failure_threshold=3, probe_interval=10)
+
+        breaker.record_failure(0)
+        breaker.record_failure(0)
+        self.assertTrue(breaker.allow_request(0))
+
+        breaker.record_failure(0)
+        self.assertEqual(breaker.state, BreakerState.OPEN)
+        self.assertFalse(breaker.allow_request(5))
+
+    # Test 2
+    def test_probe_success_closes(self):
+        # This test ensures that once the probe interval has passed, a single probe is allowed, and that the
+        # breaker closes if it succeeds.
+
+        breaker = CircuitBreaker(failure_threshold=1, probe_interval=10)
+        breaker.record_failure(0)
+
+        self.assertTrue(breaker.allow_request(10))
+        self.assertEqual(breaker.state, BreakerState.HALF_OPEN)
+        self.assertFalse(breaker.allow_request(10))
+
+        breaker.record_success()
+        self.assertEqual(breaker.state, BreakerState.CLOSED)
+
+    # Test 3
+    def test_probe_failure_reopens(self):
+        # This test ensures that a failed probe opens the breaker again until the next probe is due.
+
+        breaker = CircuitBreaker(failure_threshold=1, probe_interval=10)
+        breaker.record_failure(0)
+
+        breaker.allow_request(10)
+        breaker.record_failure(10)
+
+        self.assertEqual(breaker.state, BreakerState.OPEN)
+        self.assertFalse(breaker.allow_request(15))
+        self.assertTrue(breaker.allow_request(20))
+
+    # Test 4
+    def test_point_breakers_independent(self):
+        # This test ensures that each point has its own breaker, and that requests which are not for a
+        # point are always allowed.
+
+        breakers = PointBreakers(failure_threshold=1, probe_interval=10)
+        breakers.record_failure(1, 0)
+
+        self.assertFalse(breakers.allow_request(1, 0))
+        self.assertTrue(breakers.allow_request(2, 0))
+        self.assertTrue(breakers.allow_request(None, 0))
+        self.assertEqual(breakers.get_open_points(), {1: BreakerState.OPEN})
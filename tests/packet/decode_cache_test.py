@@ -0,0 +1,84 @@
+## @file decode_cache_test.py
+# @brief Contains tests to test the 'decode_cache' file and class.
+# @author Guy Chamberlain-Webber
+
+import unittest
+from unittest.mock import patch
+
+from src.exceptions.invalid_value import InvalidValueException
+from src.packet.decode_cache import DecodeCache
+from src.packet.packet_types import PointInformationReplyMX5, PointInformationRequestMX5
+from src.simulator.panel_simulator import PanelSimulator
+
+
+## This test case tests the 'decode_cache' file and class.
+class TestDecodeCache(unittest.TestCase):
+    # Test 1
+    def test_hit_ignores_seq(self):
+        # This test ensures that replies differing only in their SOH, SEQ or checksum are decoded once.
+
+        cache = DecodeCache(4)
+        decoded = []
+
+        def decode():
+            decoded.append(True)
+            return "decoded"
+
+        self.assertEqual(cache.get(b"\x01\x01\x0a\x0b\x17", decode), "decoded")
+        self.assertEqual(cache.get(b"\x01\x02\x0a\x0b\x18", decode), "decoded")
+
+        self.assertEqual(len(decoded), 1)
+        self.assertEqual((cache.hit_count, cache.miss_count), (1, 1))
+
+    # Test 2
+    def test_miss_on_change(self):
+        # This test ensures that a reply whose contents have changed is decoded again.
+
+        cache = DecodeCache(4)
+
+        self.assertEqual(cache.get(b"\x01\x01\x0a\x0b\x17", lambda: "first"), "first")
+        self.assertEqual(cache.get(b"\x01\x01\x0a\x0c\x18", lambda: "second"), "second")
+        self.assertEqual(cache.get_stats()["misses"], 2)
+
+    # Test 3
+    def test_least_recently_used_evicted(self):
+        # This test ensures that when the cache is full, the reply used least recently is removed.
+
+        cache = DecodeCache(2)
+
+        cache.get(b"\x01\x01\x0a\x00", lambda: "a")
+        cache.get(b"\x01\x01\x0b\x00", lambda: "b")
+        cache.get(b"\x01\x01\x0a\x00", lambda: "a")
+        cache.get(b"\x01\x01\x0c\x00", lambda: "c")
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get(b"\x01\x01\x0a\x00", lambda: "missed"), "a")
+        self.assertEqual(cache.get(b"\x01\x01\x0b\x00", lambda: "missed"), "missed")
+
+    # Test 4
+    def test_capacity(self):
+        # This test ensures that a capacity of 0 disables the cache, and a negative capacity is rejected.
+
+        cache = DecodeCache(0)
+        cache.get(b"\x01\x01\x0a\x00", lambda: "a")
+
+        self.assertEqual(len(cache), 0)
+        self.assertRaises(InvalidValueException, DecodeCache, -1)
+
+    # Test 5
+    def test_reply_csv_cached(self):
+        # This test ensures that identical replies received with different SEQs share one decoded CSV line.
+
+        frame = bytearray(PanelSimulator(devices={3: 0x02}).create_reply(PointInformationRequestMX5(3).encode(1)))
+        frames = [bytes(frame)]
+
+        frame[1] = 2
+        frame[-1] = sum(frame[1:-1]) % 256
+        frames.append(bytes(frame))
+
+        with patch("src.packet.packet_types.get_decode_cache", return_value=DecodeCache(4)) as get_cache:
+            replies = [PointInformationReplyMX5(3, frame) for frame in frames]
+
+            self.assertEqual(replies[0].get_as_csv(), replies[1].get_as_csv())
+            self.assertIs(replies[0].decode(), replies[1].decode())
+            self.assertEqual(get_cache.return_value.get_stats()["misses"], 1)
@@ -0,0 +1,88 @@
+## @file frame_content_test.py
+# @brief Contains tests to test the 'frame_content' file and class.
+# @author Guy Chamberlain-Webber
+
+import unittest
+
+import src.constants as constants
+from src.packet.frame_content import FrameContent
+from src.packet.packet_types import PointInformationReplyMX5
+
+
+## A frame with three parameters, for test purposes.
+class ExampleContent(FrameContent):
+    SCHEMA = (
+        ("first", 0),
+        ("third", 2),
+        ("second", 1)
+    )
+
+
+## This test case tests the 'frame_content' file and class.
+class TestFrameContent(unittest.TestCase):
+    # Test 1
+    def test_get_parameter(self):
+        # This test ensures that each parameter is read from its index in the frame.
+
+        content = ExampleContent([0x0a, 0x0b, 0x0c])
+
+        self.assertEqual(content.get_parameter("first"), 0x0a)
+        self.assertEqual(content.get_parameter("second"), 0x0b)
+        self.assertEqual(content.get_parameter("third"), 0x0c)
+        self.assertRaises(AttributeError, content.get_parameter, "fourth")
+
+    # Test 2
+    def test_get_parameters(self):
+        # This test ensures that the parameters are returned, and converted to bytes, in the order of the schema.
+
+        content = ExampleContent([0x0a, 0x0b, 0x0c])
+
+        self.assertEqual(list(content.get_parameters().items()), [("first", 0x0a), ("third", 0x0c), ("second", 0x0b)])
+        self.assertEqual(content.get_byte_array(), [0x0a, 0x0c, 0x0b])
+        self.assertEqual(str(content), "Packet contents:\nfirst: 10\nthird: 12\nsecond: 11\n")
+
+    # Test 3
+    def test_set_parameter(self):
+        # This test ensures that setting a parameter changes only its own byte, and that setting an unknown
+        # parameter raises an AttributeError.
+
+        content = ExampleContent([0x0a, 0x0b, 0x0c])
+        content.set_parameter("second", 0x01)
+
+        self.assertEqual(content.get_byte_array(), [0x0a, 0x0c, 0x01])
+        self.assertTrue(content.check_exists("second"))
+        self.assertFalse(content.check_exists("fourth"))
+        self.assertRaises(AttributeError, content.set_parameter, "fourth", 0x01)
+
+    # Test 4
+    def test_reply_slots(self):
+        # This test ensures that a reply keeps no per-instance dictionary, and reads its parameters from the
+        # frame it was given.
+
+        data = list(range(55))
+        reply = PointInformationReplyMX5(3, data)
+
+        self.assertFalse(hasattr(reply, "__dict__"))
+        self.assertEqual(reply.get_parameter(constants.PNAME_DEVICE_TYPE), data[constants.PIRMX5_DEVICE_TYPE_INDEX])
+
+    # Test 5
+    def test_properties(self):
+        # This test ensures that each parameter in the schema can be read as a property.
+
+        content = ExampleContent(b"\x0a\x0b\x0c")
+
+        self.assertEqual((content.first, content.second, content.third), (0x0a, 0x0b, 0x0c))
+
+    # Test 6
+    def test_frame_not_copied(self):
+        # This test ensures that the frame given is viewed rather than copied, until a parameter is set.
+
+        frame = bytearray(b"\x0a\x0b\x0c")
+        content = ExampleContent(memoryview(frame))
+
+        frame[0] = 0x01
+        self.assertEqual(content.first, 0x01)
+
+        content.set_parameter("first", 0x02)
+        self.assertEqual(frame[0], 0x01)
+        self.assertEqual(content.first, 0x02)
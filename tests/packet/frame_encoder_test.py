@@ -0,0 +1,72 @@
+## @file frame_encoder_test.py
+# @brief Contains tests to test the 'frame_encoder' file and class.
+# @author Guy Chamberlain-Webber
+
+import unittest
+
+import src.constants as constants
+from src.packet.frame_encoder import FrameEncoder, get_encoder, get_layout
+from src.packet.frame_parser import checksum_valid
+from src.packet.headers import LocalHeaderMX5, LocalHeaderMX6
+from src.packet.packet import Packet
+from src.packet.packet_ids import PacketID
+from src.packet.packet_types import PointInformationRequestMX5, PointInformationRequestMX6
+
+
+## This test case tests the 'frame_encoder' file and class.
+class TestFrameEncoder(unittest.TestCase):
+    # Test 1
+    def test_encode(self):
+        # This test ensures that a frame is packed with SOH, SEQ, each parameter and the checksum.
+
+        encoder = FrameEncoder((None, None, None))
+
+        self.assertEqual(encoder.encode(0x02, [0x03, 0x04, 0xff]), bytes([constants.SOH, 0x02, 0x03, 0x04, 0xff, 0x08]))
+        self.assertEqual(encoder.get_size(), 6)
+
+    # Test 2
+    def test_encode_string(self):
+        # This test ensures that a string parameter is packed as its UTF-8 bytes, and counted in the checksum.
+
+        encoder = get_encoder([0x01, "AB"])
+
+        self.assertEqual(encoder.layout, (None, 2))
+        self.assertEqual(encoder.encode(0x01, [0x01, "AB"]), bytes([constants.SOH, 0x01, 0x01, 0x41, 0x42, 0x85]))
+
+    # Test 3
+    def test_encoder_shared(self):
+        # This test ensures that packets with the same field layout share one compiled encoder.
+
+        self.assertIs(PointInformationRequestMX5(1).packet.get_encoder(),
+                      PointInformationRequestMX5(2).packet.get_encoder())
+        self.assertIsNot(PointInformationRequestMX5(1).packet.get_encoder(),
+                         PointInformationRequestMX6(1).packet.get_encoder())
+
+    # Test 4
+    def test_packet_frames(self):
+        # This test ensures that each packet type encodes to a frame of the size given by its packet
+        # length, with a valid checksum.
+
+        for packet in [Packet(LocalHeaderMX5(PacketID.PANEL_DETAILS_REQUEST)),
+                       Packet(LocalHeaderMX6(PacketID.PANEL_DETAILS_REQUEST)),
+                       PointInformationRequestMX5(3).packet, PointInformationRequestMX6(3).packet]:
+            frame = packet.encode(0x05)
+
+            self.assertEqual(len(frame), frame[2] + 3)
+            self.assertEqual(frame[1], 0x05)
+            self.assertTrue(checksum_valid(frame))
+
+    # Test 5
+    def test_set_parameter(self):
+        # This test ensures that changing a parameter is reflected in the next frame encoded, including one
+        # which changes the field layout.
+
+        packet = Packet(LocalHeaderMX5(PacketID.POINT_INFO_REQUEST), value=0x01)
+        packet.encode(0x01)
+
+        packet.set_parameter("value", 0x02)
+        self.assertEqual(packet.encode(0x01)[-2], 0x02)
+
+        packet.set_parameter("value", "xy")
+        self.assertEqual(packet.encode(0x01)[-3:-1], b"xy")
+        self.assertEqual(packet.get_encoder().layout, get_layout(packet.get_parameters().values()))
@@ -0,0 +1,127 @@
+## @file frame_parser_test.py
+# @brief Contains tests to test the 'frame_parser' file and class.
+# @author Guy Chamberlain-Webber
+
+import unittest
+
+import src.constants as constants
+from src.packet.frame_parser import FrameParser, checksum_valid
+from src.packet.headers import LocalHeaderMX5, LocalHeaderMX6
+from src.packet.packet import Packet
+from src.packet.packet_ids import PacketID
+
+this_parser = None
+
+
+## Creates a valid frame with the given number of content bytes.
+#
+# @param content_size The number of content bytes.
+# @param seq The sequence number of the frame.
+# @return The frame.
+def make_frame(content_size: int, seq: int = 0x01) -> bytes:
+    params = {f"value{i}": i for i in range(content_size)}
+    packet = Packet(LocalHeaderMX5(PacketID.POINT_INFO_REPLY), **params)
+
+    return bytes(packet.get_byte_array(seq))
+
+
+## This test case tests the 'frame_parser' file and class.
+class TestFrameParser(unittest.TestCase):
+    def setUp(self) -> None:
+        global this_parser
+
+        this_parser = FrameParser()
+
+    # Test 1
+    def test_single_frame(self):
+        # This test ensures that a complete frame fed in one chunk is returned as it was received.
+        global this_parser
+
+        frame = make_frame(10)
+
+        self.assertEqual(this_parser.feed(frame), [frame])
+        self.assertEqual(this_parser.buffered(), 0)
+
+    # Test 2
+    def test_frame_split_across_chunks(self):
+        # This test ensures that a frame fed one byte at a time is only returned once it is complete.
+        global this_parser
+
+        frame = make_frame(43)
+        frames = []
+
+        for i in range(len(frame)):
+            frames += this_parser.feed(frame[i:i + 1])
+
+            if i < len(frame) - 1:
+                self.assertEqual(frames, [])
+
+        self.assertEqual(frames, [frame])
+
+    # Test 3
+    def test_multiple_frames_one_chunk(self):
+        # This test ensures that several frames, separated by ACKs, fed in a single chunk are all returned
+        # in order, and that the ACKs are counted.
+        global this_parser
+
+        first = make_frame(5, seq=1)
+        second = make_frame(43, seq=2)
+        third = make_frame(0, seq=3)
+
+        chunk = bytes([constants.ACK]) + first + bytes([constants.ACK]) + second + third
+
+        self.assertEqual(this_parser.feed(chunk), [first, second, third])
+        self.assertEqual(this_parser.ack_count, 2)
+
+    # Test 4
+    def test_resync_after_noise(self):
+        # This test ensures that bytes before a frame, including a false SOH, are skipped.
+        global this_parser
+
+        frame = make_frame(10)
+        noise = bytes([0xff, constants.SOH, 0x20, 0x02, 0x44])
+
+        self.assertEqual(this_parser.feed(noise + frame), [frame])
+        self.assertEqual(this_parser.checksum_error_count, 1)
+
+    # Test 5
+    def test_corrupt_frame_dropped(self):
+        # This test ensures that a frame with an invalid checksum is not returned, and that the following
+        # frame still is.
+        global this_parser
+
+        corrupt = bytearray(make_frame(10))
+        corrupt[5] ^= 0xff
+        frame = make_frame(10, seq=2)
+
+        self.assertEqual(this_parser.feed(bytes(corrupt) + frame), [frame])
+
+    # Test 6
+    def test_resync_incomplete_frame(self):
+        # This test ensures that when a frame can never be completed, resync() gives up on it and finds
+        # any frames after it.
+        global this_parser
+
+        frame = make_frame(10)
+
+        # A false SOH claiming a far longer packet than is available.
+        self.assertEqual(this_parser.feed(bytes([constants.SOH, 0x01, 0xf0]) + frame), [])
+        self.assertEqual(this_parser.resync(), [frame])
+
+    # Test 7
+    def test_mx6_frame(self):
+        # This test ensures that frames with an MX Speak 6 header are also found.
+        global this_parser
+
+        frame = bytes(Packet(LocalHeaderMX6(PacketID.PANEL_DETAILS_RESPONSE), value=7).get_byte_array(4))
+
+        self.assertEqual(this_parser.feed(frame), [frame])
+
+    # Test 8
+    def test_checksum_valid(self):
+        # This test ensures that checksum_valid() accepts a valid frame, and rejects an invalid one.
+
+        frame = make_frame(3)
+
+        self.assertTrue(checksum_valid(frame))
+        self.assertFalse(checksum_valid(frame[:-1] + bytes([(frame[-1] + 1) % 256])))
@@ -0,0 +1,53 @@
+## @file output_queue_test.py
+# @brief Contains tests to test the 'output_queue' file and class.
+# @author Guy Chamberlain-Webber
+
+import unittest
+
+from src.exceptions.invalid_value import InvalidValueException
+from src.packet.output_queue import OutputQueue
+
+
+## This test case tests the 'output_queue' file and class.
+class TestOutputQueue(unittest.TestCase):
+    # Test 1
+    def test_take_joins(self):
+        # This test ensures that everything queued is taken as a single bytes object, in order.
+
+        queue = OutputQueue(8)
+        queue.add(b"\x06")
+        queue.add(b"\x01\x02")
+
+        self.assertEqual(queue.take(), b"\x06\x01\x02")
+        self.assertTrue(queue.is_empty())
+        self.assertEqual(queue.take(), b"")
+
+    # Test 2
+    def test_full(self):
+        # This test ensures that the queue reports when it is full.
+
+        queue = OutputQueue(2)
+
+        self.assertFalse(queue.add(b"\x01"))
+        self.assertTrue(queue.add(b"\x02"))
+
+    # Test 3
+    def test_stats(self):
+        # This test ensures that the writes, frames and bytes taken are counted, and that taking an empty
+        # queue is not counted as a write.
+
+        queue = OutputQueue(8)
+        queue.add(b"\x06")
+        queue.add(b"\x01\x02")
+        queue.take()
+        queue.take()
+        queue.add(b"\x03")
+        queue.take()
+
+        self.assertEqual(queue.get_stats(), {"writes": 2, "frames": 3, "bytes": 4, "frames_per_write": 1.5})
+
+    # Test 4
+    def test_invalid_limit(self):
+        # This test ensures that a limit of less than one frame is rejected.
+
+        self.assertRaises(InvalidValueException, OutputQueue, 0)
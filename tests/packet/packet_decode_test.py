@@ -0,0 +1,64 @@
+## @file packet_decode_test.py
+# @brief Contains tests to test the 'packet_decode' file.
+# @author Guy Chamberlain-Webber
+
+import unittest
+
+import src.constants as constants
+from src.packet.packet_decode import compile_flags_table, compile_table, decode_pirmx5, flags_table
+from src.packet.packet_types import PointInformationReplyMX5
+
+
+## This test case tests the 'packet_decode' file.
+class TestPacketDecode(unittest.TestCase):
+    # Test 1
+    def test_compile_table(self):
+        # This test ensures that a compiled table has an entry for every byte, giving the meaning of each known
+        # value and the value itself for the rest.
+
+        table = compile_table({1: "One", 255: "All"})
+
+        self.assertEqual(len(table), 256)
+        self.assertEqual((table[0], table[1], table[2], table[255]), (0, "One", 2, "All"))
+
+    # Test 2
+    def test_compile_flags_table(self):
+        # This test ensures that a value with several bits set is expanded into the meaning of each bit.
+
+        table = compile_flags_table({0: "None", 1: "A", 2: "B", 4: "C"})
+
+        self.assertEqual(table[0], "None")
+        self.assertEqual(table[2], "B")
+        self.assertEqual(table[3], "A | B")
+        self.assertEqual(table[7], "A | B | C")
+        self.assertEqual(table[9], "A | 8")
+
+    # Test 3
+    def test_decode_multiple_flags(self):
+        # This test ensures that a reply with several flags set is decoded.
+
+        data = [0] * 55
+        data[constants.PIRMX5_FLAGS_INDEX] = 2 | 32
+        data[constants.PIRMX5_AUXILIARY_POINT_ATTRIBUTES_INDEX] = 1 | 64
+
+        decoded = decode_pirmx5(PointInformationReplyMX5(0, data).get_parameters())
+
+        self.assertEqual(decoded[constants.PNAME_FLAGS], "Input Isolated | Loop Fault")
+        self.assertEqual(decoded[constants.PNAME_AUXILIARY_POINT_ATTRIBUTES],
+                         "The point supports output | Is isolation of point allowed")
+        self.assertEqual(flags_table[2 | 32], decoded[constants.PNAME_FLAGS])
+
+    # Test 4
+    def test_decode_unknown_values(self):
+        # This test ensures that values missing from a table are decoded as they are, and that the group is
+        # built from its two bytes.
+
+        data = [0xee] * 55
+        data[constants.PIRMX5_GROUP1_INDEX] = 0x01
+        data[constants.PIRMX5_GROUP2_INDEX] = 0x02
+
+        decoded = decode_pirmx5(PointInformationReplyMX5(0, data).get_parameters())
+
+        self.assertEqual(decoded[constants.PNAME_CHANNEL], 0xee)
+        self.assertEqual(decoded[constants.PNAME_UNITS_OF_MEASURE1], 0xee)
+        self.assertEqual(decoded[constants.PNAME_GROUP], 0x0102)
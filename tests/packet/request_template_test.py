@@ -0,0 +1,60 @@
+## @file request_template_test.py
+# @brief Contains tests to test the 'request_template' file and class.
+# @author Guy Chamberlain-Webber
+
+import unittest
+
+from src.packet.frame_parser import checksum_valid
+from src.packet.packet_types import PointInformationRequestMX5, PointInformationRequestMX6
+from src.packet.request_template import get_template
+
+
+## This test case tests the 'request_template' file and class.
+class TestRequestTemplate(unittest.TestCase):
+    # Test 1
+    def test_fill_matches_packet(self):
+        # This test ensures that a frame filled in from the template is identical to the frame encoded from
+        # the request's packet, for each point and SEQ.
+
+        for request_type in [PointInformationRequestMX5, PointInformationRequestMX6]:
+            for point in [0, 1, 127, 255]:
+                for seq in [1, 9, 15]:
+                    request = request_type(point)
+
+                    self.assertEqual(request.encode(seq), request.packet.encode(seq))
+                    self.assertTrue(checksum_valid(request.encode(seq)))
+
+    # Test 2
+    def test_field_index(self):
+        # This test ensures that the patched field is found at the point number's position in each version's
+        # request.
+
+        self.assertEqual(get_template(PointInformationRequestMX5, "ppoint_number").field_index, 15)
+        self.assertEqual(get_template(PointInformationRequestMX6, "ppoint_number").field_index, 17)
+
+    # Test 3
+    def test_template_shared(self):
+        # This test ensures that one template is built per type of request.
+
+        self.assertIs(get_template(PointInformationRequestMX5, "ppoint_number"),
+                      get_template(PointInformationRequestMX5, "ppoint_number"))
+        self.assertIsNot(get_template(PointInformationRequestMX5, "ppoint_number"),
+                         get_template(PointInformationRequestMX6, "ppoint_number"))
+
+    # Test 4
+    def test_frames_independent(self):
+        # This test ensures that filling the template again does not change a frame already returned.
+
+        first = PointInformationRequestMX5(1).encode(1)
+        PointInformationRequestMX5(2).encode(2)
+
+        self.assertEqual(first, PointInformationRequestMX5(1).packet.encode(1))
+
+    # Test 5
+    def test_packet_built_lazily(self):
+        # This test ensures that encoding a point request from the template does not build its packet.
+
+        request = PointInformationRequestMX5(3)
+        request.encode(1)
+
+        self.assertIsNone(request._packet)
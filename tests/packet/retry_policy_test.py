@@ -0,0 +1,44 @@
+## @file retry_policy_test.py
+# @brief Contains tests to test the 'retry_policy' file and class.
+# @author Guy Chamberlain-Webber
+
+import unittest
+
+from src.packet.retry_policy import RetryPolicy
+
+
+## This test case tests the 'retry_policy' file and class.
+class TestRetryPolicy(unittest.TestCase):
+    # Test 1
+    def test_should_retry(self):
+        # This test ensures that a request is only retried until it has been sent the maximum number of times.
+
+        policy = RetryPolicy(max_attempts=3, base_delay=0.1, max_delay=1, jitter=0)
+
+        self.assertTrue(policy.should_retry(1))
+        self.assertTrue(policy.should_retry(2))
+        self.assertFalse(policy.should_retry(3))
+
+    # Test 2
+    def test_exponential_delay(self):
+        # This test ensures that without jitter, the delay doubles with each attempt up to the maximum delay.
+
+        policy = RetryPolicy(max_attempts=10, base_delay=0.1, max_delay=0.5, jitter=0)
+
+        self.assertAlmostEqual(policy.get_delay(1), 0.1)
+        self.assertAlmostEqual(policy.get_delay(2), 0.2)
+        self.assertAlmostEqual(policy.get_delay(3), 0.4)
+        self.assertAlmostEqual(policy.get_delay(4), 0.5)
+
+    # Test 3
+    def test_jitter(self):
+        # This test ensures that with jitter, the delay is never more than without it, nor less than the
+        # jitter allows.
+
+        policy = RetryPolicy(max_attempts=10, base_delay=1, max_delay=1, jitter=0.5)
+
+        for i in range(100):
+            delay = policy.get_delay(1)
+
+            self.assertLessEqual(delay, 1)
+            self.assertGreaterEqual(delay, 0.5)
@@ -0,0 +1,127 @@
+## @file rtt_estimator_test.py
+# @brief Contains tests to test the 'rtt_estimator' file and classes.
+# @author Guy Chamberlain-Webber
+
+import unittest
+
+from src.packet.rtt_estimator import RttEstimator, RetransmitTimers
+
+
+## This test case tests the 'rtt_estimator' file and classes.
+class TestRttEstimator(unittest.TestCase):
+    # Test 1
+    def test_initial_rto(self):
+        # This test ensures that before any samples are added, the initial RTO is used.
+
+        estimator = RttEstimator(1.0, 0.05, 5)
+
+        self.assertEqual(estimator.rto, 1.0)
+        self.assertFalse(estimator.has_samples())
+
+    # Test 2
+    def test_first_sample(self):
+        # This test ensures that the first sample sets the smoothed RTT to the sample, and the variance
+        # to half of it.
+
+        estimator = RttEstimator(1.0, 0.0, 5)
+        estimator.add_sample(0.02)
+
+        self.assertAlmostEqual(estimator.srtt, 0.02)
+        self.assertAlmostEqual(estimator.rttvar, 0.01)
+        self.assertAlmostEqual(estimator.rto, 0.06)
+
+    # Test 3
+    def test_converges(self):
+        # This test ensures that after many steady samples, the RTO settles close to the RTT.
+
+        estimator = RttEstimator(1.0, 0.0, 5)
+
+        for i in range(100):
+            estimator.add_sample(0.03)
+
+        self.assertAlmostEqual(estimator.srtt, 0.03)
+        self.assertLess(estimator.rto, 0.031)
+
+    # Test 4
+    def test_floor_and_ceiling(self):
+        # This test ensures that the RTO is never less than the floor, nor more than the ceiling.
+
+        estimator = RttEstimator(1.0, 0.05, 2)
+
+        estimator.add_sample(0.001)
+        self.assertEqual(estimator.rto, 0.05)
+
+        for i in range(10):
+            estimator.backoff()
+
+        self.assertEqual(estimator.rto, 2)
+
+    # Test 5
+    def test_point_uses_panel_until_sampled(self):
+        # This test ensures that a point without samples uses the panel's RTO, and its own once it has one.
+
+        timers = RetransmitTimers(1.0, 0.0, 5)
+        timers.add_sample(1, 0.02)
+
+        self.assertAlmostEqual(timers.get_rto(2), timers.panel.rto)
+
+        timers.add_sample(2, 0.2)
+
+        self.assertAlmostEqual(timers.get_rto(2), 0.6)
+
+    # Test 6
+    def test_backoff_point(self):
+        # This test ensures that backing off a point with its own estimate does not affect other points.
+
+        timers = RetransmitTimers(1.0, 0.0, 5)
+        timers.add_sample(1, 0.1)
+        timers.add_sample(2, 0.1)
+
+        timers.backoff(1)
+
+        self.assertAlmostEqual(timers.get_rto(1), 2 * timers.get_rto(2))
+
+    # Test 7
+    def test_get_estimates(self):
+        # This test ensures that the estimates of the panel and each point can be inspected.
+
+        timers = RetransmitTimers(1.0, 0.0, 5)
+        timers.add_sample(7, 0.1)
+
+        estimates = timers.get_estimates()
+
+        self.assertEqual(estimates["panel"]["samples"], 1)
+        self.assertAlmostEqual(estimates[7]["srtt"], 0.1)
+
+    # Test 8
+    def test_backoff_unmeasured_point(self):
+        # This test ensures that a point which has never answered only backs off its own RTO, starting from the
+        # panel's, and that the RTO of the panel and of every other point is unchanged.
+
+        timers = RetransmitTimers(1.0, 0.0, 5)
+
+        for _ in range(4):
+            timers.add_sample(1, 0.03)
+
+        panel_rto = timers.panel.rto
+
+        for _ in range(40):
+            timers.backoff(9)
+
+        self.assertEqual(timers.get_rto(9), 5)
+        self.assertAlmostEqual(timers.panel.rto, panel_rto)
+        self.assertAlmostEqual(timers.get_rto(2), panel_rto)
+        self.assertAlmostEqual(timers.get_rto(), panel_rto)
+
+    # Test 9
+    def test_backoff_reset_by_sample(self):
+        # This test ensures that once a backed off point answers, its RTO comes from the measured round trip time.
+
+        timers = RetransmitTimers(1.0, 0.0, 5)
+        timers.backoff(3)
+
+        self.assertEqual(timers.get_rto(3), 2.0)
+
+        timers.add_sample(3, 0.1)
+
+        self.assertAlmostEqual(timers.get_rto(3), 0.3)
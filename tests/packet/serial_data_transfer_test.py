@@ -0,0 +1,153 @@
+## @file serial_data_transfer_test.py
+# @brief Contains tests to test the 'serial_data_transfer' file and class.
+# @author Guy Chamberlain-Webber
+
+import io
+import os
+import pty
+import time
+import unittest
+from unittest.mock import patch
+
+import src.constants as constants
+import src.packet.serial_data_transfer as serial_data_transfer
+from src.packet.headers import LocalHeaderMX5
+from src.packet.packet import Packet
+from src.packet.packet_ids import PacketID
+from src.packet.serial_data_transfer import SerialDataTransfer
+
+
+## This test case tests the 'serial_data_transfer' file and class.
+@patch("serial.Serial")
+class TestSerialDataTransfer(unittest.TestCase):
+    def setUp(self) -> None:
+        # Make sure no session is left over from a previous test.
+        serial_data_transfer.session = None
+
+    def tearDown(self) -> None:
+        serial_data_transfer.session = None
+
+    # Test 1
+    def test_open_on_creation(self, mock_serial):
+        # This test ensures that creating a link session opens the serial port exactly once.
+
+        link = SerialDataTransfer()
+
+        self.assertTrue(link.is_open())
+        self.assertEqual(link.open_count, 1)
+        self.assertEqual(mock_serial.call_count, 1)
+
+    # Test 2
+    def test_open_is_idempotent(self, mock_serial):
+        # This test ensures that opening an already open link session does not reopen the port.
+
+        link = SerialDataTransfer()
+        link.open()
+        link.open()
+
+        self.assertEqual(link.open_count, 1)
+        self.assertEqual(mock_serial.call_count, 1)
+
+    # Test 3
+    def test_close(self, mock_serial):
+        # This test ensures that closing a link session closes the port, and that closing it
+        # again has no effect.
+
+        link = SerialDataTransfer()
+        link.close()
+        link.close()
+
+        self.assertFalse(link.is_open())
+        self.assertEqual(link.close_count, 1)
+        mock_serial.return_value.close.assert_called_once()
+
+    # Test 4
+    def test_get_session_shared(self, mock_serial):
+        # This test ensures that get_session() always returns the same, single, link session.
+
+        self.assertIs(serial_data_transfer.get_session(), serial_data_transfer.get_session())
+        self.assertEqual(mock_serial.call_count, 1)
+
+    # Test 5
+    def test_packet_writes_do_not_reopen(self, mock_serial):
+        # This test ensures that writing many packets through an injected link session does not
+        # reopen the serial port.
+
+        link = SerialDataTransfer()
+        packet = Packet(LocalHeaderMX5(PacketID.INVALID), link=link)
+
+        for i in range(10):
+            packet.write()
+
+        self.assertEqual(link.open_count, 1)
+        self.assertEqual(link.close_count, 0)
+        self.assertEqual(mock_serial.return_value.write.call_count, 10)
+
+    # Test 6
+    def test_read_frame_bulk(self, mock_serial):
+        # This test ensures that read_frame() returns each frame received, even when they arrive split
+        # across, or combined within, the chunks read from the port.
+
+        first = bytes(Packet(LocalHeaderMX5(PacketID.POINT_INFO_REPLY), value=1).get_byte_array(1))
+        second = bytes(Packet(LocalHeaderMX5(PacketID.POINT_INFO_REPLY), value=2).get_byte_array(2))
+        stream = bytes([constants.ACK]) + first + bytes([constants.ACK]) + second
+
+        chunks = [stream[:4], stream[4:]]
+        mock_serial.return_value.in_waiting = 0
+        mock_serial.return_value.fileno.side_effect = io.UnsupportedOperation
+        mock_serial.return_value.read.side_effect = lambda size: chunks.pop(0)
+
+        link = SerialDataTransfer()
+
+        self.assertEqual(link.read_frame().frame, first)
+        self.assertEqual(link.read_frame().frame, second)
+        self.assertEqual(mock_serial.return_value.read.call_count, 2)
+
+
+    # Test 7
+    def test_ack_coalesced_with_next_request(self, mock_serial):
+        # This test ensures that the ACK for a reply is not written on its own, but along with the next
+        # packet, in a single write.
+
+        link = SerialDataTransfer()
+        packet = Packet(LocalHeaderMX5(PacketID.INVALID), link=link)
+
+        sent = bytes([constants.ACK]) + bytes(packet.get_byte_array())
+
+        link.queue_byte(constants.ACK)
+        packet.write()
+
+        mock_serial.return_value.write.assert_called_once_with(sent)
+        self.assertEqual(link.get_coalescing_stats()["frames_per_write"], 2)
+
+
+## This test case tests reading from a real serial port with the 'serial_data_transfer' class.
+class TestSerialDataTransferPort(unittest.TestCase):
+    def setUp(self) -> None:
+        # The link is opened on the slave end of a pseudo-terminal.
+        self.master, slave = pty.openpty()
+        slave_name = os.ttyname(slave)
+        os.close(slave)
+
+        self.com_patch = patch("src.config.get_com_port", return_value=slave_name)
+        self.com_patch.start()
+
+    def tearDown(self) -> None:
+        self.com_patch.stop()
+        os.close(self.master)
+
+    # Test 1
+    def test_read_frame_timeout(self):
+        # This test ensures that when no frame arrives, read_frame() returns a timeout result once the
+        # deadline has passed, and that the process sleeps rather than spins while it waits.
+
+        link = SerialDataTransfer()
+
+        cpu_start = time.process_time()
+        result = link.read_frame(time.monotonic() + 0.2)
+        cpu_used = time.process_time() - cpu_start
+
+        link.close()
+
+        self.assertTrue(result.is_timeout())
+        self.assertLess(cpu_used, 0.1)
@@ -0,0 +1,122 @@
+## @file threaded_serial_data_transfer_test.py
+# @brief Contains tests to test the 'threaded_serial_data_transfer' file and class.
+# @author Guy Chamberlain-Webber
+
+import threading
+import time
+import unittest
+
+import src.constants as constants
+from src.packet.headers import LocalHeaderMX5
+from src.packet.packet import Packet
+from src.packet.packet_ids import PacketID
+from src.packet.threaded_serial_data_transfer import ThreadedSerialDataTransfer
+from src.transport.loopback_transport import LoopbackTransport
+
+
+## Creates a valid frame.
+#
+# @param seq The sequence number of the frame.
+# @return The frame.
+def make_frame(seq: int = 0x01) -> bytes:
+    return bytes(Packet(LocalHeaderMX5(PacketID.POINT_INFO_REPLY), value=seq).get_byte_array(seq))
+
+
+## This test case tests the 'threaded_serial_data_transfer' file and class.
+class TestThreadedSerialDataTransfer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.transport = LoopbackTransport()
+        self.link = ThreadedSerialDataTransfer(transport=self.transport, queue_size=2)
+        self.peer = self.transport.peer
+
+    def tearDown(self) -> None:
+        self.link.close()
+
+    # Test 1
+    def test_threads_started_and_stopped(self):
+        # This test ensures that the reader and writer threads run while the link is open, and stop
+        # when it is closed.
+
+        names = [thread.name for thread in threading.enumerate()]
+        self.assertIn("LinkReader", names)
+        self.assertIn("LinkWriter", names)
+
+        self.link.close()
+
+        names = [thread.name for thread in threading.enumerate()]
+        self.assertNotIn("LinkReader", names)
+        self.assertNotIn("LinkWriter", names)
+        self.assertFalse(self.link.is_open())
+
+    # Test 2
+    def test_read_frame(self):
+        # This test ensures that frames received by the reader thread are returned by read_frame(), in order.
+
+        self.peer.sendall(make_frame(1) + bytes([constants.ACK]) + make_frame(2))
+
+        self.assertEqual(self.link.read_frame(time.monotonic() + 1).frame, make_frame(1))
+        self.assertEqual(self.link.read_frame(time.monotonic() + 1).frame, make_frame(2))
+
+    # Test 3
+    def test_read_frame_timeout(self):
+        # This test ensures that read_frame() returns a timeout result when no frame arrives in time.
+
+        self.assertTrue(self.link.read_frame(time.monotonic() + 0.05).is_timeout())
+
+    # Test 4
+    def test_frames_dropped_when_full(self):
+        # This test ensures that once the received frame queue is full, further frames are dropped and counted
+        # rather than holding up the reader thread.
+
+        self.peer.sendall(make_frame(1) + make_frame(2) + make_frame(3))
+
+        deadline = time.monotonic() + 1
+        while self.link.dropped_frame_count == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(self.link.dropped_frame_count, 1)
+        self.assertEqual(self.link.read_frame(time.monotonic() + 1).frame, make_frame(1))
+        self.assertEqual(self.link.read_frame(time.monotonic() + 1).frame, make_frame(2))
+
+    # Test 5
+    def test_write(self):
+        # This test ensures that the writer thread sends everything flushed, in order, and that the ACK and
+        # request flushed together are counted as a single write.
+
+        frame = make_frame(4)
+
+        self.link.queue_byte(constants.ACK)
+        self.link.queue(frame)
+        self.link.flush()
+        self.link.write(frame)
+
+        expected = bytes([constants.ACK]) + frame + frame
+        received = b""
+
+        self.peer.settimeout(1)
+        while len(received) < len(expected):
+            received += self.peer.recv(1024)
+
+        self.assertEqual(received, expected)
+        self.assertEqual(self.link.get_coalescing_stats()["writes"], 2)
+
+    # Test 6
+    def test_disconnected(self):
+        # This test ensures that when the other end closes the connection, the frames received before then
+        # are still read, then ConnectionError is raised, and that the link can still be closed.
+
+        self.peer.sendall(make_frame(1))
+        self.peer.close()
+
+        self.assertEqual(self.link.read_frame(time.monotonic() + 1).frame, make_frame(1))
+
+        with self.assertRaises(ConnectionError):
+            self.link.read_frame(time.monotonic() + 1)
+
+        with self.assertRaises(ConnectionError):
+            self.link.read_frame(time.monotonic() + 1)
+
+        self.link.write(make_frame(2))
+        self.link.close()
+
+        self.assertFalse(any(thread.name in ("LinkReader", "LinkWriter") for thread in threading.enumerate()))
@@ -0,0 +1,284 @@
+## @file transaction_engine_test.py
+# @brief Contains tests to test the 'transaction_engine' file and classes.
+# @author Guy Chamberlain-Webber
+
+import unittest
+from unittest.mock import patch
+
+import src.constants as constants
+from src.exceptions.invalid_value import InvalidValueException
+from src.packet.packet import Packet
+from src.packet.packet_types import PointInformationRequestMX5
+from src.packet.read_result import frame_result, timeout_result
+from src.packet.circuit_breaker import PointBreakers
+from src.packet.retry_policy import RetryPolicy
+from src.packet.rtt_estimator import RetransmitTimers
+from src.packet.transaction_engine import TransactionEngine, TransactionStatus
+
+# The index of the point number in a point information request.
+REQUEST_POINT_NUMBER_INDEX = 15
+
+
+## A clock which only moves when it is told to.
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+## A link which answers point information requests in the reverse order they were sent.
+class ReversingLink:
+    def __init__(self, clock: FakeClock = None, timeouts: int = 0, dead_points: tuple = ()):
+        self.clock = clock
+        self.outstanding = []
+        self.max_outstanding = 0
+        self.writes = 0
+        self.acks = 0
+        self.flushes = 0
+        self.timeouts = timeouts
+        self.dead_points = dead_points
+        self.requested_points = []
+
+    def write(self, data: list):
+        self.writes += 1
+        self.requested_points.append(data[REQUEST_POINT_NUMBER_INDEX])
+
+        if data[REQUEST_POINT_NUMBER_INDEX] in self.dead_points:
+            return
+
+        self.outstanding.append((data[constants.PIRMX5_SEQ_INDEX], data[REQUEST_POINT_NUMBER_INDEX]))
+        self.max_outstanding = max(self.max_outstanding, len(self.outstanding))
+
+    def write_byte(self, value):
+        if value == constants.ACK:
+            self.acks += 1
+
+    def queue(self, data: list):
+        self.write(data)
+
+    def queue_byte(self, value):
+        self.write_byte(value)
+
+    def flush(self):
+        self.flushes += 1
+
+    def read_frame(self, deadline: float = None):
+        if self.timeouts > 0 or not self.outstanding:
+            # Let the deadline pass without replying.
+            self.timeouts = max(0, self.timeouts - 1)
+            self.outstanding.clear()
+            self.clock.now = deadline
+            return timeout_result()
+
+        seq, point = self.outstanding.pop()
+
+        data = [0] * 55
+        data[constants.PIRMX5_SOH_INDEX] = constants.SOH
+        data[constants.PIRMX5_SEQ_INDEX] = seq
+        data[constants.PIRMX5_POINT_NUMBER_INDEX] = point
+
+        return frame_result(bytes(data))
+
+
+## This test case tests the 'transaction_engine' file and classes.
+class TestTransactionEngine(unittest.TestCase):
+    def setUp(self) -> None:
+        # Reset the SEQ number between tests.
+        Packet.seq = 0x01
+
+    # Test 1
+    def test_replies_matched_by_seq(self):
+        # This test ensures that when replies arrive out of order, each one is matched back to the
+        # request with the same sequence number.
+
+        link = ReversingLink()
+        engine = TransactionEngine(link, window=4)
+
+        requests = [PointInformationRequestMX5(point, link) for point in range(10)]
+        transactions = engine.run(requests)
+
+        for point, transaction in enumerate(transactions):
+            self.assertTrue(transaction.is_complete())
+            self.assertEqual(transaction.reply.get_parameter(constants.PNAME_POINT_NUMBER), point)
+
+        self.assertEqual(link.acks, 10)
+        self.assertEqual(engine.in_flight(), 0)
+
+    # Test 2
+    def test_window_respected(self):
+        # This test ensures that no more than 'window' requests are ever in flight at once.
+
+        link = ReversingLink()
+        engine = TransactionEngine(link, window=3)
+
+        engine.run([PointInformationRequestMX5(point, link) for point in range(10)])
+
+        self.assertEqual(link.max_outstanding, 3)
+
+    # Test 3
+    def test_unique_seq_in_flight(self):
+        # This test ensures that when the window is as large as possible, each request in flight still
+        # has its own sequence number.
+
+        link = ReversingLink()
+        engine = TransactionEngine(link, window=constants.SEQ_WRAP)
+
+        transactions = engine.run([PointInformationRequestMX5(point, link) for point in range(40)])
+
+        for point, transaction in enumerate(transactions):
+            self.assertEqual(transaction.reply.get_parameter(constants.PNAME_POINT_NUMBER), point)
+
+    # Test 4
+    def test_resend_on_timeout(self):
+        # This test ensures that when no reply is received in time, the requests in flight are sent again.
+
+        clock = FakeClock()
+        link = ReversingLink(clock, timeouts=1)
+        engine = TransactionEngine(link, window=2)
+
+        with patch("src.packet.transaction_engine.time", clock):
+            transactions = engine.run([PointInformationRequestMX5(point, link) for point in range(2)])
+
+        self.assertEqual(link.writes, 4)
+        self.assertTrue(all(transaction.attempts == 2 for transaction in transactions))
+
+    # Test 5
+    def test_invalid_window(self):
+        # This test ensures that a window larger than the number of sequence numbers raises an
+        # InvalidValueException.
+
+        with self.assertRaises(InvalidValueException) as cm:
+            TransactionEngine(ReversingLink(), window=constants.SEQ_WRAP + 1)
+
+        exception = cm.exception
+        self.assertIsNotNone(exception)
+
+    # Test 6
+    def test_rtt_measured(self):
+        # This test ensures that the round trip time of each reply is measured for its point, and that
+        # replies to resent requests are not measured.
+
+        clock = FakeClock()
+        link = ReversingLink(clock, timeouts=1)
+        engine = TransactionEngine(link, window=2)
+
+        with patch("src.packet.transaction_engine.time", clock):
+            engine.run([PointInformationRequestMX5(point, link) for point in range(2)])
+            engine.run([PointInformationRequestMX5(point, link) for point in range(2)])
+
+        estimates = engine.timers.get_estimates()
+
+        self.assertEqual(estimates["panel"]["samples"], 2)
+        self.assertEqual(estimates[0]["samples"], 1)
+        self.assertEqual(estimates[1]["samples"], 1)
+
+    # Test 7
+    def test_gives_up_after_max_attempts(self):
+        # This test ensures that a request to a point which never replies is given up on after the maximum
+        # number of attempts, while the other points are still answered.
+
+        clock = FakeClock()
+        link = ReversingLink(clock, dead_points=(3,))
+        engine = TransactionEngine(link, window=4, retry_policy=RetryPolicy(3, 0.1, 1, 0))
+
+        with patch("src.packet.transaction_engine.time", clock):
+            transactions = engine.run([PointInformationRequestMX5(point, link) for point in range(6)])
+
+        for point, transaction in enumerate(transactions):
+            if point == 3:
+                self.assertEqual(transaction.status, TransactionStatus.FAILED)
+                self.assertEqual(transaction.attempts, 3)
+            else:
+                self.assertTrue(transaction.is_complete())
+
+    # Test 8
+    def test_breaker_skips_dead_point(self):
+        # This test ensures that once a point has failed enough times, its circuit breaker takes it out of the
+        # rotation until a probe is due.
+
+        clock = FakeClock()
+        link = ReversingLink(clock, dead_points=(1,))
+        engine = TransactionEngine(link, window=2, retry_policy=RetryPolicy(1, 0.1, 1, 0),
+                                   breakers=PointBreakers(failure_threshold=2, probe_interval=1000))
+
+        with patch("src.packet.transaction_engine.time", clock):
+            for i in range(2):
+                engine.run([PointInformationRequestMX5(point, link) for point in range(3)])
+
+            link.requested_points.clear()
+            transactions = engine.run([PointInformationRequestMX5(point, link) for point in range(3)])
+
+        self.assertEqual(transactions[1].status, TransactionStatus.SKIPPED)
+        self.assertNotIn(1, link.requested_points)
+        self.assertTrue(transactions[0].is_complete())
+        self.assertTrue(transactions[2].is_complete())
+
+    # Test 9
+    def test_reply_from_wrong_point_discarded(self):
+        # This test ensures that a reply carrying a request's SEQ, but from another point, does not complete
+        # the request, which is sent again and completed by its own reply.
+
+        clock = FakeClock()
+        link = ReversingLink(clock)
+        engine = TransactionEngine(link, window=1, timers=RetransmitTimers(0.1, 0.1, 0.1),
+                                   retry_policy=RetryPolicy(2, 0.1, 1, 0))
+
+        read_frame = link.read_frame
+
+        def read_wrong_point_first(deadline: float = None):
+            result = read_frame(deadline)
+
+            if link.writes == 1 and result.is_ok():
+                data = bytearray(result.frame)
+                data[constants.PIRMX5_POINT_NUMBER_INDEX] = 9
+                return frame_result(bytes(data))
+
+            return result
+
+        link.read_frame = read_wrong_point_first
+
+        with patch("src.packet.transaction_engine.time", clock):
+            transaction = engine.run([PointInformationRequestMX5(4, link)])[0]
+
+        self.assertTrue(transaction.is_complete())
+        self.assertEqual(transaction.reply.get_parameter(constants.PNAME_POINT_NUMBER), 4)
+        self.assertEqual(transaction.attempts, 2)
+
+    # Test 10
+    def test_expired_seq_quarantined(self):
+        # This test ensures that the SEQ of an unanswered request is not reused until its own retransmission
+        # timeout has passed again, and that unanswered requests to many dead points still keep the window full.
+
+        clock = FakeClock()
+        link = ReversingLink(clock, dead_points=(0,))
+        engine = TransactionEngine(link, window=1, timers=RetransmitTimers(0.1, 0.1, 5),
+                                   retry_policy=RetryPolicy(1, 0.1, 1, 0))
+
+        with patch("src.packet.transaction_engine.time", clock):
+            transactions = engine.run([PointInformationRequestMX5(point, link) for point in range(30)])
+            expired_seq = transactions[0].seq
+
+            self.assertEqual(transactions[0].status, TransactionStatus.FAILED)
+            self.assertNotIn(expired_seq, [transaction.seq for transaction in transactions[1:]])
+
+            clock.now += 0.1
+            transactions = engine.run([PointInformationRequestMX5(point, link) for point in range(1, 16)])
+
+        self.assertIn(expired_seq, [transaction.seq for transaction in transactions])
+
+        clock = FakeClock()
+        link = ReversingLink(clock, dead_points=tuple(range(64)))
+        engine = TransactionEngine(link, window=8, timers=RetransmitTimers(0.1, 0.1, 5),
+                                   retry_policy=RetryPolicy(1, 0.1, 1, 0))
+
+        with patch("src.packet.transaction_engine.time", clock):
+            transactions = engine.run([PointInformationRequestMX5(point, link) for point in range(64)])
+
+        # Eight rounds of eight requests, each round waiting out a single 0.1 second timeout.
+        self.assertTrue(all(transaction.status == TransactionStatus.FAILED for transaction in transactions))
+        self.assertAlmostEqual(clock.now, 0.8)
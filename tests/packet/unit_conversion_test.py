@@ -0,0 +1,103 @@
+## @file unit_conversion_test.py
+# @brief Contains tests to test the 'unit_conversion' file.
+# @author Guy Chamberlain-Webber
+
+import math
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+import src.constants as constants
+from src.config import MXSpeakVersion
+from src.packet.batch_decode import decode_replies
+from src.packet.unit_conversion import QUANTITIES, ConversionTable, convert_cycle, convert_replies
+
+
+## Returns a point information reply frame.
+#
+# @param device_type The device type of the point.
+# @param channels The unit of measurement and converted value of each of the three analogue channels.
+# @return The frame.
+def create_frame(device_type: int, channels: list) -> bytes:
+    frame = bytearray(55)
+    frame[constants.PIRMX5_DEVICE_TYPE_INDEX] = device_type
+
+    for channel, (unit, value) in enumerate(channels):
+        frame[constants.PIRMX5_UNITS_OF_MEASURE1_INDEX + channel] = unit
+        frame[constants.PIRMX5_CONVERTED_VALUE1_INDEX + channel] = value
+
+    return bytes(frame)
+
+
+## This test case tests the 'unit_conversion' file.
+class TestUnitConversion(unittest.TestCase):
+    # Test 1
+    def test_convert_replies(self):
+        # This test ensures that each value is converted into the standard unit of its quantity, with one
+        # row per reply and one column per channel.
+
+        frames = [create_frame(0x02, [(1, 25), (5, 3), (9, 0)]),
+                  create_frame(0x02, [(2, 212), (4, 1), (10, 250)])]
+
+        converted = convert_replies(decode_replies(b"".join(frames), MXSpeakVersion.MX_SPEAK5))
+
+        self.assertEqual(set(converted), set(QUANTITIES))
+        self.assertEqual(converted["temperature"].shape, (2, 3))
+
+        np.testing.assert_allclose(converted["temperature"][:, 0], [25.0, 100.0])
+        np.testing.assert_allclose(converted["obscuration"][:, 1], [3.0, 1 / 0.3048])
+        self.assertAlmostEqual(converted["current"][1, 2], 0.25)
+
+    # Test 2
+    def test_other_quantities_nan(self):
+        # This test ensures that a value is NaN in every quantity but its own, and in every quantity when its
+        # unit has no value.
+
+        frames = [create_frame(0x02, [(8, 24), (0, 5), (9, 5)])]
+
+        converted = convert_replies(decode_replies(b"".join(frames), MXSpeakVersion.MX_SPEAK5))
+
+        self.assertEqual(converted["voltage"][0, 0], 24.0)
+
+        for quantity, values in converted.items():
+            if quantity != "voltage":
+                self.assertTrue(math.isnan(values[0, 0]))
+
+            self.assertTrue(np.isnan(values[0, 1:]).all())
+
+    # Test 3
+    def test_unknown_device_type(self):
+        # This test ensures that the values of a device type which is not known are NaN.
+
+        frames = [create_frame(0x01, [(1, 25), (1, 25), (1, 25)])]
+
+        converted = convert_replies(decode_replies(b"".join(frames), MXSpeakVersion.MX_SPEAK5))
+
+        self.assertTrue(np.isnan(converted["temperature"]).all())
+
+    # Test 4
+    def test_device_coefficients(self):
+        # This test ensures that the values of device types which are scaled differently from the default for
+        # their unit are converted with their own coefficients.
+
+        with patch.dict("src.packet.unit_conversion.DEVICE_COEFFICIENTS", {0x02: {5: (0.1, 0.0)}}):
+            table = ConversionTable()
+
+        converted = table.convert(np.array([[0x02, 0x02, 0x0d]]), np.array([[5, 1, 5]]), np.array([[25, 30, 25]]))
+
+        np.testing.assert_allclose(converted["obscuration"][0, [0, 2]], [2.5, 25.0])
+        self.assertEqual(converted["temperature"][0, 1], 30.0)
+
+    # Test 5
+    def test_convert_cycle(self):
+        # This test ensures that the replies of a polling cycle are decoded and converted together, leaving out
+        # any frame which is not the size of a reply.
+
+        frames = [create_frame(0x02, [(1, 25), (9, 0), (9, 0)]), b"\x01\x02",
+                  create_frame(0x02, [(1, 26), (9, 0), (9, 0)])]
+
+        replies, converted = convert_cycle(frames)
+
+        self.assertEqual(len(replies), 2)
+        np.testing.assert_allclose(converted["temperature"][:, 0], [25.0, 26.0])
@@ -0,0 +1,65 @@
+## @file record_sink_test.py
+# @brief Contains tests to test the 'record_sink' file and class.
+# @author Guy Chamberlain-Webber
+
+import threading
+import unittest
+
+from src.record_sink import RecordSink
+
+
+## This test case tests the 'record_sink' file and class.
+class TestRecordSink(unittest.TestCase):
+    # Test 1
+    def test_records_handled_on_own_thread(self):
+        # This test ensures that each record is handled, in order, on the sink's own thread.
+
+        handled = []
+        threads = set()
+
+        def handler(record):
+            handled.append(record)
+            threads.add(threading.current_thread().name)
+
+        with RecordSink(handler, 8) as sink:
+            for record in range(5):
+                sink.put(record)
+
+        self.assertEqual(handled, list(range(5)))
+        self.assertEqual(threads, {"RecordSink"})
+        self.assertEqual(sink.handled_count, 5)
+
+    # Test 2
+    def test_records_dropped_when_full(self):
+        # This test ensures that when the handler falls behind and the queue is full, records are dropped
+        # and counted rather than blocking the caller.
+
+        release = threading.Event()
+        sink = RecordSink(lambda record: release.wait(), 1)
+        sink.start()
+
+        results = [sink.put(record) for record in range(10)]
+        release.set()
+        sink.stop()
+
+        self.assertFalse(all(results))
+        self.assertEqual(sink.dropped_count, results.count(False))
+        self.assertEqual(sink.handled_count + sink.dropped_count, 10)
+
+    # Test 3
+    def test_handler_error(self):
+        # This test ensures that a record which can not be handled does not stop the sink.
+
+        handled = []
+
+        def handler(record):
+            if record == 1:
+                raise ValueError("Bad record")
+
+            handled.append(record)
+
+        with RecordSink(handler, 8) as sink:
+            for record in range(3):
+                sink.put(record)
+
+        self.assertEqual(handled, [0, 2])
@@ -0,0 +1,143 @@
+## @file scheduler_test.py
+# @brief Contains tests to test the 'scheduler' file and class.
+# @author Guy Chamberlain-Webber
+
+import threading
+import unittest
+from unittest.mock import patch
+
+from src.exceptions.invalid_value import InvalidValueException
+from src.scheduler import Scheduler
+
+
+## A clock which only moves when it is waited on.
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.waits = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    ## Stands in for threading.Event.wait(), moving the clock on instead of sleeping.
+    def wait(self, seconds: float) -> bool:
+        self.waits.append(seconds)
+        self.now += seconds
+        return False
+
+
+## This test case tests the 'scheduler' file and class.
+class TestScheduler(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+        patcher = patch("src.scheduler.time.monotonic", self.clock.monotonic)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.stop_event = threading.Event()
+        self.stop_event.wait = self.clock.wait
+
+    # Test 1
+    def test_one_shot_order(self):
+        # This test ensures that one-shot jobs are run once each, in order of when they are due, sleeping
+        # until each is due rather than polling the clock.
+
+        scheduler = Scheduler()
+        runs = []
+
+        scheduler.schedule(lambda: runs.append(("b", self.clock.now)), delay=2.0)
+        scheduler.schedule(lambda: runs.append(("a", self.clock.now)), delay=1.0)
+        scheduler.schedule(lambda: runs.append(("c", self.clock.now)), delay=2.0)
+        scheduler.run(self.stop_event)
+
+        self.assertEqual(runs, [("a", 1.0), ("b", 2.0), ("c", 2.0)])
+        self.assertEqual(self.clock.waits, [1.0, 1.0])
+        self.assertEqual(len(scheduler), 0)
+
+    # Test 2
+    def test_periodic_no_drift(self):
+        # This test ensures that a periodic job stays on its period, however long each run takes.
+
+        scheduler = Scheduler()
+        runs = []
+
+        def job():
+            runs.append(self.clock.now)
+            self.clock.now += 0.3
+
+            if len(runs) == 4:
+                scheduler.stop()
+
+        scheduler.schedule(job, period=1.0)
+        scheduler.run(self.stop_event)
+
+        self.assertEqual(runs, [0.0, 1.0, 2.0, 3.0])
+
+    # Test 3
+    def test_overrun(self):
+        # This test ensures that a run which takes longer than the period is reported, and the missed runs
+        # skipped rather than run back to back.
+
+        overruns = []
+        scheduler = Scheduler(on_overrun=lambda job, late: overruns.append(late))
+        runs = []
+
+        def job():
+            runs.append(self.clock.now)
+            self.clock.now += 2.5 if len(runs) == 1 else 0.0
+
+            if len(runs) == 3:
+                scheduler.stop()
+
+        periodic_job = scheduler.schedule(job, period=1.0)
+        scheduler.run(self.stop_event)
+
+        self.assertEqual(runs, [0.0, 3.0, 4.0])
+        self.assertEqual(overruns, [1.5])
+        self.assertEqual((periodic_job.overrun_count, periodic_job.skipped_count), (1, 2))
+        self.assertEqual(scheduler.overrun_count, 1)
+
+    # Test 4
+    def test_cancel(self):
+        # This test ensures that a cancelled job is not run again, and the scheduler returns once no jobs
+        # are left.
+
+        scheduler = Scheduler()
+        runs = []
+        periodic_job = None
+
+        def job():
+            runs.append(self.clock.now)
+
+            if len(runs) == 2:
+                periodic_job.cancel()
+
+        periodic_job = scheduler.schedule(job, period=0.5)
+        scheduler.schedule(lambda: runs.append("one-shot"), delay=5.0)
+        scheduler.run(self.stop_event)
+
+        self.assertEqual(runs, [0.0, 0.5, "one-shot"])
+
+    # Test 5
+    def test_stop_event(self):
+        # This test ensures that the scheduler returns without running any more jobs once the stop event
+        # is set.
+
+        scheduler = Scheduler()
+        runs = []
+
+        def job():
+            runs.append(self.clock.now)
+            self.stop_event.set()
+
+        scheduler.schedule(job, period=1.0)
+        scheduler.run(self.stop_event)
+
+        self.assertEqual(runs, [0.0])
+
+    # Test 6
+    def test_invalid_period(self):
+        # This test ensures that a period which is not greater than 0 is rejected.
+
+        self.assertRaises(InvalidValueException, Scheduler().schedule, lambda: None, period=0)
@@ -0,0 +1,195 @@
+## @file panel_simulator_test.py
+# @brief Contains tests to test the 'panel_simulator' file and class.
+# @author Guy Chamberlain-Webber
+
+import time
+import unittest
+from unittest.mock import patch
+
+import src.constants as constants
+from src.config import MXSpeakVersion
+from src.exceptions.invalid_value import InvalidValueException
+from src.packet.circuit_breaker import PointBreakers
+from src.packet.frame_parser import checksum_valid
+from src.packet.packet_types import PointInformationRequestMX5, PointInformationRequestMX6, PanelDetailsRequestMX5
+from src.packet.retry_policy import RetryPolicy
+from src.packet.rtt_estimator import RetransmitTimers
+from src.packet.serial_data_transfer import SerialDataTransfer
+from src.packet.transaction_engine import TransactionEngine, TransactionStatus
+from src.simulator.panel_simulator import PanelSimulator, create_devices
+
+
+## This test case tests the 'panel_simulator' file and class.
+class TestPanelSimulator(unittest.TestCase):
+    # Test 1
+    def test_point_info_reply_mx5(self):
+        # This test ensures that an MX5 point information request for a device is answered with a correctly
+        # sized and checksummed reply, carrying the request's SEQ and the device's type.
+
+        simulator = PanelSimulator(devices={3: 0x0d})
+        request = bytes(PointInformationRequestMX5(3).packet.get_byte_array(7))
+
+        reply = PointInformationRequestMX5(3).create_reply(list(simulator.create_reply(request)))
+
+        self.assertEqual(len(reply._data), 55)
+        self.assertTrue(checksum_valid(reply._data))
+        self.assertTrue(reply.reply_successful())
+        self.assertEqual(reply.get_parameter(constants.PNAME_SEQ), 7)
+        self.assertEqual(reply.get_parameter(constants.PNAME_POINT_NUMBER), 3)
+        self.assertEqual(reply.get_parameter(constants.PNAME_DEVICE_TYPE), 0x0d)
+
+    # Test 2
+    def test_point_info_reply_mx6(self):
+        # This test ensures that an MX6 point information request is answered with a correctly sized and
+        # checksummed MX6 reply.
+
+        simulator = PanelSimulator(MXSpeakVersion.MX_SPEAK6, devices={3: 0x0d})
+        request = bytes(PointInformationRequestMX6(3).packet.get_byte_array(7))
+
+        reply = PointInformationRequestMX6(3).create_reply(list(simulator.create_reply(request)))
+
+        self.assertEqual(len(reply._data), 56)
+        self.assertTrue(checksum_valid(reply._data))
+        self.assertTrue(reply.reply_successful())
+        self.assertEqual(reply._data[constants.PIRMX6_DEVICE_TYPE_INDEX], 0x0d)
+
+    # Test 3
+    def test_point_info_reply_no_device(self):
+        # This test ensures that a point without a device is answered with an unsuccessful reply.
+
+        simulator = PanelSimulator(devices={3: 0x0d})
+        request = bytes(PointInformationRequestMX5(4).packet.get_byte_array(1))
+
+        reply = PointInformationRequestMX5(4).create_reply(list(simulator.create_reply(request)))
+
+        self.assertFalse(reply.reply_successful())
+
+    # Test 4
+    def test_panel_details_reply(self):
+        # This test ensures that a panel details request is answered with a correctly sized and checksummed
+        # reply.
+
+        simulator = PanelSimulator()
+        reply = simulator.create_reply(bytes(PanelDetailsRequestMX5().packet.get_byte_array(2)))
+
+        self.assertEqual(len(reply), 30)
+        self.assertTrue(checksum_valid(reply))
+
+    # Test 5
+    def test_invalid_values(self):
+        # This test ensures that unknown device types and rates outside 0 to 1 are rejected.
+
+        self.assertRaises(InvalidValueException, PanelSimulator, devices={1: 0x1000})
+        self.assertRaises(InvalidValueException, PanelSimulator, drop_rate=1.5)
+        self.assertRaises(InvalidValueException, PanelSimulator, corruption_rate=-0.1)
+
+    # Test 6
+    def test_create_devices(self):
+        # This test ensures that a population of devices is created at the first points, and that the same
+        # seed gives the same population.
+
+        devices = create_devices(10, seed=1)
+
+        self.assertEqual(list(devices.keys()), list(range(10)))
+        self.assertEqual(devices, create_devices(10, seed=1))
+
+    # Test 7
+    def test_wildcard_replies(self):
+        # This test ensures that a request for every point is answered by each device when the simulator
+        # supports it, and that other requests still have a single reply.
+
+        simulator = PanelSimulator(devices={2: 0x02, 5: 0x0d}, wildcard=True)
+        request = bytes(PointInformationRequestMX5(constants.ALL_POINTS).packet.get_byte_array(1))
+
+        replies = [PointInformationRequestMX5(0).create_reply(reply) for reply in simulator.create_replies(request)]
+
+        self.assertEqual([reply.ppoint_number for reply in replies], [2, 5])
+        self.assertEqual(len(simulator.create_replies(bytes(PanelDetailsRequestMX5().packet.get_byte_array(2)))), 1)
+
+    # Test 8
+    def test_silent_no_device(self):
+        # This test ensures that a silent simulator does not answer a point without a device, but still answers
+        # a point with one.
+
+        simulator = PanelSimulator(devices={3: 0x0d}, silent=True)
+
+        self.assertIsNone(simulator.create_reply(bytes(PointInformationRequestMX5(4).packet.get_byte_array(1))))
+        self.assertIsNotNone(simulator.create_reply(bytes(PointInformationRequestMX5(3).packet.get_byte_array(1))))
+
+
+## This test case tests the program against the 'panel_simulator' over a pseudo-terminal.
+class TestPanelSimulatorPort(unittest.TestCase):
+    ## Starts a simulator, and opens a link session on its port.
+    #
+    # @return The link session.
+    def start(self, simulator: PanelSimulator) -> SerialDataTransfer:
+        simulator.start()
+        self.addCleanup(simulator.stop)
+
+        with patch("src.config.get_com_port", return_value=simulator.port_name):
+            link = SerialDataTransfer()
+
+        self.addCleanup(link.close)
+
+        return link
+
+    ## Creates an engine which gives up on requests quickly.
+    #
+    # @param link The link session.
+    # @return The engine.
+    @staticmethod
+    def create_engine(link: SerialDataTransfer) -> TransactionEngine:
+        return TransactionEngine(link, window=4, timers=RetransmitTimers(0.2, 0.05, 0.2),
+                                 retry_policy=RetryPolicy(2, 0.01, 0.01, 0), breakers=PointBreakers(10, 60))
+
+    # Test 1
+    def test_poll(self):
+        # This test ensures that polling the simulator returns a successful reply for each device, an
+        # unsuccessful reply for each empty point, and that each reply is acknowledged.
+
+        simulator = PanelSimulator(devices=create_devices(5, seed=1), latency=0.001)
+        link = self.start(simulator)
+
+        transactions = self.create_engine(link).run([PointInformationRequestMX5(point, link) for point in range(10)])
+
+        for point, transaction in enumerate(transactions):
+            self.assertTrue(transaction.is_complete())
+            self.assertEqual(transaction.reply.reply_successful(), point < 5)
+
+        self.assertEqual(simulator.request_count, 10)
+        self.assertEqual(simulator.reply_count, 10)
+
+        # The final ACK may still be on its way to the simulator.
+        deadline = time.monotonic() + 1
+        while simulator.get_ack_count() < 10 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual(simulator.get_ack_count(), 10)
+
+        # The requests filling the window, and each ACK with the request replacing its reply, are coalesced.
+        self.assertGreater(link.get_coalescing_stats()["frames_per_write"], 1)
+
+    # Test 2
+    def test_drop(self):
+        # This test ensures that requests dropped by the simulator are given up on.
+
+        simulator = PanelSimulator(devices=create_devices(2), drop_rate=1)
+        link = self.start(simulator)
+
+        transactions = self.create_engine(link).run([PointInformationRequestMX5(point, link) for point in range(2)])
+
+        self.assertTrue(all(transaction.status is TransactionStatus.FAILED for transaction in transactions))
+        self.assertEqual(simulator.dropped_count, 4)
+
+    # Test 3
+    def test_corruption(self):
+        # This test ensures that replies corrupted by the simulator are rejected by the link's checksum check.
+
+        simulator = PanelSimulator(devices=create_devices(2), corruption_rate=1)
+        link = self.start(simulator)
+
+        transactions = self.create_engine(link).run([PointInformationRequestMX5(point, link) for point in range(2)])
+
+        self.assertTrue(all(transaction.status is TransactionStatus.FAILED for transaction in transactions))
+        self.assertGreater(link.parser.checksum_error_count, 0)
+        self.assertEqual(simulator.corrupted_count, 4)
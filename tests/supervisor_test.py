@@ -0,0 +1,92 @@
+## @file supervisor_test.py
+# @brief Contains tests to test the 'supervisor' file and class.
+# @author Guy Chamberlain-Webber
+
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from src.packet.packet_types import PointInformationRequestMX5
+from src.packet.transaction_engine import TransactionEngine
+from src.record_sink import RecordSink
+from src.simulator.panel_simulator import PanelSimulator, create_devices
+from src.supervisor import PanelReply, PanelSupervisor
+
+
+## Polls each point on a panel once, then waits to be stopped.
+#
+# @param name The name of the panel.
+# @param link The link session to send and receive packets with.
+# @param sink The record sink to put replies on.
+# @param stop_event An event which is set when polling should stop.
+def poll_once(name, link, sink, stop_event):
+    requests = [PointInformationRequestMX5(point, link) for point in range(4)]
+
+    for transaction in TransactionEngine(link, window=4).run(requests):
+        if transaction.is_complete() and transaction.reply.reply_successful():
+            sink.put(PanelReply(name, transaction.reply.get_parameter("ppoint_number")))
+
+    stop_event.wait()
+
+
+## This test case tests the 'supervisor' file and class.
+class TestPanelSupervisor(unittest.TestCase):
+    # Test 1
+    def test_poll_panels_concurrently(self):
+        # This test ensures that each panel is polled over its own link, on its own thread, and that the
+        # replies from every panel are put on the one record sink.
+
+        simulators = {"a": PanelSimulator(devices=create_devices(2)), "b": PanelSimulator(devices=create_devices(3))}
+        records = []
+        threads = set()
+
+        def poll(name, link, sink, stop_event):
+            threads.add(threading.current_thread().name)
+            poll_once(name, link, sink, stop_event)
+
+        for simulator in simulators.values():
+            simulator.start()
+            self.addCleanup(simulator.stop)
+
+        panels = [{"name": name, "transport": {"type": "pty", "path": simulator.port_name}}
+                  for name, simulator in simulators.items()]
+
+        with RecordSink(lambda record: records.append((record.panel, record.reply)), 16) as sink:
+            supervisor = PanelSupervisor(panels, poll, sink)
+            supervisor.start()
+
+            deadline = time.monotonic() + 5
+            while sink.handled_count < 5 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            supervisor.stop()
+
+        self.assertEqual(sorted(records), [("a", 0), ("a", 1), ("b", 0), ("b", 1), ("b", 2)])
+        self.assertEqual(threads, {"Panel-a", "Panel-b"})
+        self.assertFalse(supervisor.links["a"].is_open())
+        self.assertFalse(supervisor.links["b"].is_open())
+
+    # Test 2
+    def test_stop_waits_for_panels(self):
+        # This test ensures that stop() waits until each panel has finished polling and its link session
+        # has been closed, even if the panel's thread is reported as no longer alive.
+
+        simulator = PanelSimulator(devices=create_devices(1))
+        simulator.start()
+        self.addCleanup(simulator.stop)
+
+        def poll(name, link, sink, stop_event):
+            stop_event.wait()
+            time.sleep(0.2)
+
+        panels = [{"name": "a", "transport": {"type": "pty", "path": simulator.port_name}}]
+
+        with RecordSink(lambda record: None, 16) as sink:
+            supervisor = PanelSupervisor(panels, poll, sink)
+            supervisor.start()
+
+            with patch.object(threading.Thread, "is_alive", return_value=False):
+                supervisor.stop()
+
+        self.assertEqual(supervisor.links["a"].close_count, 1)
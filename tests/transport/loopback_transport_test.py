@@ -0,0 +1,89 @@
+## @file loopback_transport_test.py
+# @brief Contains tests to test the 'loopback_transport' file and class.
+# @author Guy Chamberlain-Webber
+
+import unittest
+
+from src.packet.headers import LocalHeaderMX5
+from src.packet.packet import Packet
+from src.packet.packet_ids import PacketID
+from src.packet.serial_data_transfer import SerialDataTransfer
+from src.transport.loopback_transport import LoopbackTransport
+
+
+## This test case tests the 'loopback_transport' file and class.
+class TestLoopbackTransport(unittest.TestCase):
+    def setUp(self) -> None:
+        self.transport = LoopbackTransport()
+        self.transport.open()
+
+    def tearDown(self) -> None:
+        self.transport.close()
+
+    # Test 1
+    def test_writev(self):
+        # This test ensures that buffers written together arrive at the other end in order.
+
+        self.transport.writev([b"\x01\x02", b"\x03"])
+
+        self.assertEqual(self.transport.peer.recv(16), b"\x01\x02\x03")
+
+    # Test 2
+    def test_read_available_bulk(self):
+        # This test ensures that every byte waiting is read at once.
+
+        self.transport.peer.sendall(b"\x01\x02")
+        self.transport.peer.sendall(b"\x03")
+
+        self.assertEqual(self.transport.read_available(1), b"\x01\x02\x03")
+
+    # Test 3
+    def test_read_available_timeout(self):
+        # This test ensures that no bytes are returned when none arrive in time.
+
+        self.assertEqual(self.transport.read_available(0.01), b"")
+
+    # Test 4
+    def test_close(self):
+        # This test ensures that closing the transport closes both ends.
+
+        self.transport.close()
+
+        self.assertFalse(self.transport.is_open())
+        self.assertIsNone(self.transport.peer)
+
+    # Test 5
+    def test_link_session(self):
+        # This test ensures that a link session can read frames from, and write frames to, a loopback transport.
+
+        link = SerialDataTransfer(transport=self.transport)
+        frame = bytes(Packet(LocalHeaderMX5(PacketID.POINT_INFO_REPLY), value=1).get_byte_array(1))
+
+        self.transport.peer.sendall(frame)
+        link.writev([frame, frame])
+
+        self.assertEqual(link.read_frame().frame, frame)
+        self.assertEqual(self.transport.peer.recv(256), frame + frame)
+
+    # Test 6
+    def test_read_available_disconnected(self):
+        # This test ensures that when the other end closes the connection, the transport is closed and
+        # ConnectionError raised, rather than empty reads being returned as if no bytes had arrived.
+
+        self.transport.peer.close()
+
+        with self.assertRaises(ConnectionError):
+            self.transport.read_available(1)
+
+        self.assertFalse(self.transport.is_open())
+
+    # Test 7
+    def test_link_session_disconnected(self):
+        # This test ensures that a link session reading from a connection closed by the other end raises
+        # ConnectionError, rather than waiting out the deadline.
+
+        link = SerialDataTransfer(transport=self.transport)
+        self.transport.peer.close()
+
+        with self.assertRaises(ConnectionError):
+            link.read_frame()
@@ -0,0 +1,81 @@
+## @file pty_transport_test.py
+# @brief Contains tests to test the 'pty_transport' file and class.
+# @author Guy Chamberlain-Webber
+
+import os
+import pty
+import time
+import tty
+import unittest
+
+from src.packet.serial_data_transfer import SerialDataTransfer
+from src.transport.pty_transport import PtyTransport
+
+
+## This test case tests the 'pty_transport' file and class.
+class TestPtyTransport(unittest.TestCase):
+    def setUp(self) -> None:
+        # The transport is opened on the slave end of a pseudo-terminal, the test plays the panel on the master end.
+        self.master, slave = pty.openpty()
+        tty.setraw(self.master)
+        self.transport = PtyTransport(os.ttyname(slave))
+        os.close(slave)
+
+        self.transport.open()
+
+    def tearDown(self) -> None:
+        self.transport.close()
+
+        if self.master is not None:
+            os.close(self.master)
+
+    ## Hangs up the pseudo-terminal, as if the panel had gone away.
+    def hang_up(self):
+        os.close(self.master)
+        self.master = None
+
+    # Test 1
+    def test_raw_bytes(self):
+        # This test ensures that bytes which a terminal would normally translate, such as carriage returns,
+        # pass through unchanged in both directions.
+
+        self.transport.writev([b"\x01\r\n", b"\x03"])
+        os.write(self.master, b"\r\x06")
+
+        self.assertEqual(os.read(self.master, 16), b"\x01\r\n\x03")
+        self.assertEqual(self.transport.read_available(1), b"\r\x06")
+
+    # Test 2
+    def test_open_failure(self):
+        # This test ensures that the program exits if the pseudo-terminal can not be opened.
+
+        transport = PtyTransport("/dev/pts/does-not-exist")
+
+        self.assertRaises(SystemExit, transport.open)
+
+    # Test 3
+    def test_read_available_hang_up(self):
+        # This test ensures that when the pseudo-terminal is hung up, the transport is closed and
+        # ConnectionError raised, rather than empty reads being returned as if no bytes had arrived.
+
+        self.hang_up()
+
+        with self.assertRaises(ConnectionError):
+            self.transport.read_available(1)
+
+        self.assertFalse(self.transport.is_open())
+
+    # Test 4
+    def test_link_session_hang_up(self):
+        # This test ensures that a link session reading from a hung up pseudo-terminal raises ConnectionError
+        # straight away, rather than reading nothing over and over until the deadline.
+
+        link = SerialDataTransfer(transport=self.transport)
+        self.hang_up()
+
+        start_time = time.monotonic()
+
+        with self.assertRaises(ConnectionError):
+            link.read_frame(start_time + 1)
+
+        self.assertLess(time.monotonic() - start_time, 0.5)
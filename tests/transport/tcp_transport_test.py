@@ -0,0 +1,52 @@
+## @file tcp_transport_test.py
+# @brief Contains tests to test the 'tcp_transport' file and class.
+# @author Guy Chamberlain-Webber
+
+import socket
+import unittest
+
+from src.transport.tcp_transport import TcpTransport
+
+
+## This test case tests the 'tcp_transport' file and class.
+class TestTcpTransport(unittest.TestCase):
+    def setUp(self) -> None:
+        # The test plays the serial-to-Ethernet converter on a local listening socket.
+        self.server = socket.create_server(("127.0.0.1", 0))
+        self.transport = TcpTransport("127.0.0.1", self.server.getsockname()[1], 1)
+        self.transport.open()
+        self.converter, _ = self.server.accept()
+
+    def tearDown(self) -> None:
+        self.transport.close()
+        self.converter.close()
+        self.server.close()
+
+    # Test 1
+    def test_no_delay(self):
+        # This test ensures that Nagle's algorithm is disabled, so requests are not held back.
+
+        self.assertEqual(self.transport.socket.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY), 1)
+
+    # Test 2
+    def test_write_and_read(self):
+        # This test ensures that bytes can be written to, and read from, the converter.
+
+        self.transport.writev([b"\x01", b"\x02\x03"])
+        self.converter.sendall(b"\x06")
+
+        self.assertEqual(self.converter.recv(16), b"\x01\x02\x03")
+        self.assertEqual(self.transport.read_available(1), b"\x06")
+
+    # Test 3
+    def test_connect_failure(self):
+        # This test ensures that the program exits if the converter can not be reached.
+
+        port = self.server.getsockname()[1]
+        self.server.close()
+        self.converter.close()
+        self.transport.close()
+
+        transport = TcpTransport("127.0.0.1", port, 1)
+
+        self.assertRaises(SystemExit, transport.open)
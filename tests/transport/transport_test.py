@@ -0,0 +1,90 @@
+## @file transport_test.py
+# @brief Contains tests to test the 'transport' and 'transport_factory' files.
+# @author Guy Chamberlain-Webber
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import serial
+
+from src.config import TransportType
+from src.transport.loopback_transport import LoopbackTransport
+from src.transport.serial_transport import SerialTransport
+from src.transport.tcp_transport import TcpTransport
+from src.transport.transport import read_connected, write_all_vectored
+from src.transport.transport_factory import create_transport
+
+
+## This test case tests the 'transport' and 'transport_factory' files.
+class TestTransport(unittest.TestCase):
+    # Test 1
+    def test_write_all_vectored_partial(self):
+        # This test ensures that every byte is written, in order, even when each call only writes part of
+        # the buffers given.
+
+        written = bytearray()
+        calls = []
+
+        def write_vectored(buffers):
+            calls.append(len(buffers))
+            chunk = b"".join(bytes(buffer) for buffer in buffers)[:3]
+            written.extend(chunk)
+            return len(chunk)
+
+        write_all_vectored(write_vectored, [b"abcd", b"", b"ef", b"ghij"])
+
+        self.assertEqual(bytes(written), b"abcdefghij")
+        self.assertEqual(calls, [3, 3, 1, 1])
+
+    # Test 2
+    def test_create_transport(self):
+        # This test ensures that the transport chosen in the configuration file is created.
+
+        with patch("src.config.get_transport_type", return_value=TransportType.SERIAL):
+            self.assertIsInstance(create_transport(), SerialTransport)
+
+        with patch("src.config.get_transport_type", return_value=TransportType.LOOPBACK):
+            self.assertIsInstance(create_transport(), LoopbackTransport)
+
+        with patch("src.config.get_transport_type", return_value=TransportType.TCP):
+            self.assertIsInstance(create_transport(), TcpTransport)
+
+    # Test 3
+    def test_read_connected(self):
+        # This test ensures that a read which returns nothing, or fails with any OSError, such as pyserial's
+        # SerialException, closes the transport and raises ConnectionError.
+
+        transport = MagicMock()
+
+        self.assertEqual(read_connected(transport, lambda: b"\x06"), b"\x06")
+        transport.close.assert_not_called()
+
+        def fail():
+            raise serial.SerialException("device reports readiness to read but returned no data")
+
+        for read in (lambda: b"", fail):
+            transport.close.reset_mock()
+
+            with self.assertRaises(ConnectionError):
+                read_connected(transport, read)
+
+            transport.close.assert_called_once()
+
+    # Test 4
+    def test_serial_read_error(self):
+        # This test ensures that a serial port which fails to read is closed and ConnectionError raised, while
+        # a read which times out on a port which can not be waited on returns no bytes.
+
+        transport = SerialTransport()
+        transport.serial = MagicMock(in_waiting=0)
+
+        with patch("sys.platform", "win32"):
+            transport.serial.read.return_value = b""
+            self.assertEqual(transport.read_available(0.01), b"")
+
+            transport.serial.read.side_effect = serial.SerialException("Device disconnected")
+
+            with self.assertRaises(ConnectionError):
+                transport.read_available(0.01)
+
+        self.assertFalse(transport.is_open())